@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+sample_conformation throughput: per-residue trial loop vs one (N, 100, 2) batch
+
+The per-residue path is the previous implementation: each residue draws and
+scores its 100 trials, then picks one with a sequential accept loop. The
+batched path draws all N × 100 trials at once, scores them with a single
+grid lookup per residue class plus broadcast local terms, and makes one
+softmax (Boltzmann) categorical draw per residue. Both use the same
+Ramachandran grids (built before timing).
+
+Reports samples per second and the mean energy per residue of the selected
+states. The two selection rules are different estimators of the same
+Boltzmann preference over the trials, so the mean energies are close but
+not equal.
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_utils import make_sequence, timed
+from protein_folding_analysis import RamachandranState, RigorousProteinFolder
+
+
+def per_residue_sample_conformation(folder: RigorousProteinFolder):
+    """Per-residue trials with the sequential accept loop"""
+    conformations = []
+    for i in range(folder.n_residues):
+        best_energy, best_state = float('inf'), None
+        trials = folder.np_random.uniform(-180, 180, size=(100, 2))
+        local_energy = folder.calculate_local_interactions(i, 0.0, 0.0)
+        trial_energies = folder.ramachandran_energies(i, trials[:, 0], trials[:, 1]) + local_energy
+        for (phi, psi), total_energy in zip(trials.tolist(), trial_energies.tolist()):
+            if total_energy < best_energy or folder.np_random.random() < np.exp(-(total_energy - best_energy) / folder.kT):
+                best_energy = total_energy
+                best_state = RamachandranState(phi, psi, total_energy, np.exp(-total_energy / folder.kT),
+                                               total_energy < 5.0)
+        conformations.append(best_state)
+    return conformations
+
+
+def throughput(sample, folder: RigorousProteinFolder, n_samples: int):
+    energies = []
+    with timed() as timing:
+        for _ in range(n_samples):
+            energies.append(np.mean([state.energy for state in sample(folder)]))
+    return n_samples / timing['seconds'], float(np.mean(energies))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Batched sample_conformation throughput",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--lengths", type=int, nargs='+', default=[40, 200, 1000], help="Sequence lengths")
+    parser.add_argument("--samples", type=int, default=50, help="Samples per length and path")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    print(f"{'N':>6} {'per-residue (samples/s)':>24} {'batched (samples/s)':>20} {'speedup':>8} "
+          f"{'mean E loop':>12} {'mean E softmax':>15}")
+    for length in args.lengths:
+        with open(os.devnull, 'w') as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            folder = RigorousProteinFolder(make_sequence(length))
+            sys.stdout = stdout
+        folder.sample_conformation()  # build the grids
+
+        loop_rate, loop_energy = throughput(per_residue_sample_conformation, folder, args.samples)
+        batch_rate, batch_energy = throughput(RigorousProteinFolder.sample_conformation, folder, args.samples)
+        print(f"{length:>6} {loop_rate:24.1f} {batch_rate:20.1f} {batch_rate / loop_rate:7.1f}x "
+              f"{loop_energy:12.3f} {batch_energy:15.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Checkpoint overhead of run_fot_optimization
+
+For each sequence length, times the same fixed-length optimization without
+checkpointing and with adaptive checkpointing at several I/O budgets, and
+reports the number of saves, the checkpoint file size, the measured I/O
+share of wall time and the overall slowdown.
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_utils import make_sequence, timed
+from fot.convergence import LagConvergence
+from fot.vqbit_checkpoint import FoTCheckpointer, OptimizationCheckpoint
+from fot.vqbit_mathematics import ProteinVQbitGraph
+
+
+def run(sequence: str, iterations: int, checkpointer=None):
+    graph = ProteinVQbitGraph(sequence)
+    with timed() as timing:
+        results = graph.run_fot_optimization(max_iterations=iterations, init_seed=0, checkpoint=checkpointer,
+                                             convergence=LagConvergence(threshold=0.0))
+    return results, timing['seconds']
+
+
+def checkpoint_bytes(sequence: str, path: str) -> int:
+    """Size of one checkpoint of a freshly initialized graph"""
+    graph = ProteinVQbitGraph(sequence)
+    graph.initialize_vqbit_states(seed=0)
+    parameters = graph._checkpoint_parameters('projection', 1, 0)
+    graph._make_checkpoint(parameters, 0, 0.0, 0, [], LagConvergence()).save(path)
+    size = os.path.getsize(path)
+    assert OptimizationCheckpoint.load(path) is not None
+    os.remove(path)
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Adaptive checkpoint overhead for FoT optimization",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--lengths", type=int, nargs='+', default=[42, 500, 2000],
+                        help="Sequence lengths")
+    parser.add_argument("--iterations", type=int, default=300, help="Iterations per run")
+    parser.add_argument("--io-fractions", type=float, nargs='+', default=[0.01, 0.05, 0.2],
+                        help="Checkpoint I/O budgets")
+    parser.add_argument("--min-interval", type=float, default=0.0,
+                        help="Minimum seconds between checkpoints")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    workdir = tempfile.mkdtemp(prefix="fot_checkpoints_")
+
+    print(f"{'N':>6} {'budget':>7} {'saves':>6} {'ckpt KB':>8} {'io share':>9} {'time (s)':>9} {'slowdown':>9}")
+    for length in args.lengths:
+        sequence = make_sequence(length)
+        path = os.path.join(workdir, f"fot_{length}.pt")
+        size_kb = checkpoint_bytes(sequence, path) / 1024
+
+        run(sequence, args.iterations)  # warm-up
+        _, baseline = run(sequence, args.iterations)
+        print(f"{length:>6} {'off':>7} {0:>6} {size_kb:8.1f} {0.0:9.4f} {baseline:9.3f} {1.0:8.3f}x")
+
+        for fraction in args.io_fractions:
+            checkpointer = FoTCheckpointer(path, max_io_fraction=fraction, min_interval_s=args.min_interval)
+            results, seconds = run(sequence, args.iterations, checkpointer)
+            stats = results['checkpoint']
+            print(f"{length:>6} {fraction:>7.2f} {stats['saves']:>6} {size_kb:8.1f} {stats['io_fraction']:9.4f} "
+                  f"{seconds:9.3f} {seconds / baseline:8.3f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+FoT optimization throughput: compiled step and per-worker thread budgets
+
+Single process: runs a fixed sequence set through run_fot_optimization with
+the op-by-op loop and with each fused/compiled step backend, after one
+warm-up run per backend (reported separately as compile time).
+
+Worker pool: runs the same workload on a spawned process pool with and
+without the thread budget and with and without the compiled step. Workers
+warm up (and compile) in their initializer, so the timed section measures
+steady-state throughput.
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_utils import make_sequence, timed
+from fot.thread_budget import apply_thread_budget, available_cpus, thread_budget
+
+WARMUP_SEQUENCE = make_sequence(30, seed=0)
+
+
+def optimize(sequence: str, iterations: int, step_backend):
+    from fot.convergence import LagConvergence
+    from fot.vqbit_mathematics import ProteinVQbitGraph
+
+    graph = ProteinVQbitGraph(sequence)
+    results = graph.run_fot_optimization(max_iterations=iterations, init_seed=0, step_backend=step_backend,
+                                         convergence=LagConvergence(threshold=0.0))
+    return results['final_fot_value']
+
+
+def worker_init(n_threads, iterations, step_backend):
+    logging.disable(logging.INFO)
+    if n_threads is not None:
+        apply_thread_budget(n_threads)
+    optimize(WARMUP_SEQUENCE, iterations, step_backend)
+
+
+def run_pool(sequences, iterations, n_workers, budget, step_backend):
+    n_threads = thread_budget(n_workers) if budget else None
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=context, initializer=worker_init,
+                             initargs=(n_threads, iterations, step_backend)) as executor:
+        # Make sure every worker has started and warmed up before timing
+        list(executor.map(time.sleep, [0.5] * n_workers))
+        with timed() as timing:
+            list(executor.map(optimize, sequences, [iterations] * len(sequences),
+                              [step_backend] * len(sequences)))
+    return timing['seconds'], n_threads
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compiled FoT step and thread budget throughput",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--lengths", type=int, nargs='+', default=[42, 200, 800],
+                        help="Sequence lengths in the workload")
+    parser.add_argument("--repeats", type=int, default=8, help="Sequences per length")
+    parser.add_argument("--iterations", type=int, default=100, help="Iterations per optimization")
+    parser.add_argument("--backends", nargs='+', default=['fused', 'torchscript', 'inductor'],
+                        help="Step backends for the single-process run")
+    parser.add_argument("--workers", type=int, nargs='+', default=[1, 8], help="Pool sizes")
+    parser.add_argument("--pool-step", default='auto', help="Step backend for the compiled pool runs")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    sequences = [make_sequence(length, seed=length * 100 + r) for length in args.lengths for r in range(args.repeats)]
+    print(f"{len(sequences)} sequences, {args.iterations} iterations each, {available_cpus()} CPU(s)")
+
+    print(f"\n{'single process':>16} {'warm-up (s)':>12} {'time (s)':>9} {'seq/s':>8} {'speedup':>8}")
+    baseline = None
+    for backend in [None] + args.backends:
+        with timed() as warmup:
+            optimize(WARMUP_SEQUENCE, args.iterations, backend)
+        with timed() as timing:
+            for sequence in sequences:
+                optimize(sequence, args.iterations, backend)
+        baseline = baseline or timing['seconds']
+        print(f"{backend or 'op-by-op':>16} {warmup['seconds']:12.3f} {timing['seconds']:9.3f} "
+              f"{len(sequences) / timing['seconds']:8.2f} {baseline / timing['seconds']:7.2f}x")
+
+    print(f"\n{'workers':>8} {'budget':>7} {'threads':>8} {'step':>10} {'time (s)':>9} {'seq/s':>8} {'speedup':>8}")
+    for n_workers in args.workers:
+        baseline = None
+        for budget in (False, True):
+            for step_backend in (None, args.pool_step):
+                seconds, n_threads = run_pool(sequences, args.iterations, n_workers, budget, step_backend)
+                baseline = baseline or seconds
+                print(f"{n_workers:>8} {'on' if budget else 'off':>7} {n_threads or 'default':>8} "
+                      f"{step_backend or 'op-by-op':>10} {seconds:9.3f} {len(sequences) / seconds:8.2f} "
+                      f"{baseline / seconds:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Early-stopping benchmark for run_fot_optimization
+
+Runs a fixed panel of sequences with the original LagConvergence rule and
+with ToleranceConvergence from the same seed, and reports iterations saved
+and the deviation of the final optimization score (the last FoT value
+before measurement). Deviations above --score-tolerance are flagged.
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+import torch
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_utils import SEQUENCE_PANEL, timed
+from fot.convergence import LagConvergence, ToleranceConvergence
+from fot.vqbit_mathematics import ProteinVQbitGraph
+
+
+def run(sequence: str, controller, max_iterations: int, seed: int):
+    torch.manual_seed(seed)
+    with timed() as timing:
+        results = ProteinVQbitGraph(sequence).run_fot_optimization(
+            max_iterations=max_iterations, convergence=controller
+        )
+    return results['iterations'], results['fot_history'][-1], timing['seconds']
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convergence controller benchmark",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--max-iterations", type=int, default=500, help="Iteration cap")
+    parser.add_argument("--score-rtol", type=float, default=1e-4, help="ToleranceConvergence relative tolerance")
+    parser.add_argument("--patience", type=int, default=20, help="ToleranceConvergence patience")
+    parser.add_argument("--score-tolerance", type=float, default=0.01,
+                        help="Maximum accepted relative deviation of the final score")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    print(f"{'sequence':>16} {'lag iters':>10} {'tol iters':>10} {'saved':>7} "
+          f"{'lag time (s)':>13} {'tol time (s)':>13} {'score dev':>10}")
+    total_lag, total_tol = 0, 0
+    for seed, (name, sequence) in enumerate(SEQUENCE_PANEL.items()):
+        lag_iters, lag_score, lag_time = run(sequence, LagConvergence(), args.max_iterations, seed)
+        tol_iters, tol_score, tol_time = run(
+            sequence, ToleranceConvergence(score_rtol=args.score_rtol, patience=args.patience),
+            args.max_iterations, seed
+        )
+        deviation = abs(tol_score - lag_score) / max(abs(lag_score), 1e-12)
+        flag = '' if deviation <= args.score_tolerance else '  EXCEEDS TOLERANCE'
+        total_lag += lag_iters
+        total_tol += tol_iters
+        print(f"{name:>16} {lag_iters:>10} {tol_iters:>10} {lag_iters - tol_iters:>7} "
+              f"{lag_time:13.3f} {tol_time:13.3f} {deviation:10.2e}{flag}")
+
+    print(f"\nIterations saved: {total_lag - total_tol} of {total_lag} "
+          f"({100.0 * (total_lag - total_tol) / total_lag:.1f}%), score tolerance {args.score_tolerance:.1%}")
+
+
+if __name__ == "__main__":
+    main()
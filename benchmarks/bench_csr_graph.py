@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Contact-graph backend benchmark: CSR arrays vs NetworkX
+
+For each length, builds one ProteinVQbitGraph and times, on its CSR
+contact graph and on the equivalent NetworkX graph (graph.akg):
+
+- neighbor iteration: visiting every residue's sorted neighbor list
+- Laplacian build: the normalized sparse Laplacian
+- FoT scoring: graph invariants (clustering, degrees, density) plus
+  calculate_fot_equation, as done when a graph is scored from scratch
+
+and reports the memory held by the CSR arrays. NetworkX timings exclude
+building graph.akg itself.
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+import networkx as nx
+from scipy.sparse import csr_matrix
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_utils import make_sequence, timed
+from fot.vqbit_mathematics import ProteinVQbitGraph
+
+
+def best_of(repeats: int, fn):
+    seconds = []
+    for _ in range(repeats):
+        with timed() as timing:
+            fn()
+        seconds.append(timing['seconds'])
+    return min(seconds)
+
+
+def csr_neighbors(graph: ProteinVQbitGraph) -> int:
+    csr = graph.contact_graph
+    return sum(len(csr.neighbors(i).tolist()) for i in range(graph.n_residues))
+
+
+def nx_neighbors(graph: ProteinVQbitGraph) -> int:
+    akg = graph.akg
+    return sum(len(sorted(akg.neighbors(i))) for i in range(graph.n_residues))
+
+
+def csr_scoring(graph: ProteinVQbitGraph) -> float:
+    graph.graph_invariants = graph._compute_graph_invariants()
+    return graph.calculate_fot_equation()
+
+
+def nx_scoring(graph: ProteinVQbitGraph) -> float:
+    akg = graph.akg
+    invariants = graph.graph_invariants
+    invariants.average_clustering = nx.average_clustering(akg)
+    invariants.density = nx.density(akg)
+    [degree for _, degree in akg.degree()]
+    return graph.calculate_fot_equation()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="CSR vs NetworkX contact-graph operations",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--lengths", type=int, nargs='+', default=[100, 500, 2000, 5000],
+                        help="Sequence lengths")
+    parser.add_argument("--repeats", type=int, default=5, help="Timing repeats (best of)")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    print(f"{'N':>6} {'operation':>16} {'networkx (s)':>13} {'csr (s)':>10} {'speedup':>8}")
+    for length in args.lengths:
+        graph = ProteinVQbitGraph(make_sequence(length))
+        graph.initialize_vqbit_states(seed=0)
+        with timed() as export:
+            graph.akg
+
+        assert csr_neighbors(graph) == nx_neighbors(graph)
+        assert abs(csr_scoring(graph) - nx_scoring(graph)) < 1e-9
+
+        rows = [
+            ('neighbors', lambda: nx_neighbors(graph), lambda: csr_neighbors(graph)),
+            ('laplacian', lambda: csr_matrix(nx.normalized_laplacian_matrix(graph.akg)),
+             lambda: graph.contact_graph.normalized_laplacian()),
+            ('fot scoring', lambda: nx_scoring(graph), lambda: csr_scoring(graph)),
+        ]
+        for name, nx_fn, csr_fn in rows:
+            nx_s, csr_s = best_of(args.repeats, nx_fn), best_of(args.repeats, csr_fn)
+            print(f"{length:>6} {name:>16} {nx_s:13.5f} {csr_s:10.5f} {nx_s / csr_s:7.1f}x")
+        print(f"{length:>6} {'nx export':>16} {export['seconds']:13.5f} {'':>10} "
+              f"{'':>8}  (CSR arrays: {graph.contact_graph.nbytes() / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Ensemble cache saving per RigorousScientificDiscovery inquiry
+
+run_complete_scientific_inquiry simulates the sequence twice at 298.15 K:
+the reality check (200 samples), then the rigorous analysis (n_samples).
+Runs the whole inquiry with a fixed base seed three ways: without a cache
+(max_entries=0 evicts on insert), with an in-memory cache, where the
+rigorous analysis tops up the reality check's ensemble, and with an
+on-disk cache already warmed by an earlier inquiry, where both stages
+are served from .npz files. Reports wall time of the inquiry and of its
+folding simulations, the saving against the uncached run, and checks that
+the rigorous analysis statistics are identical in every mode.
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_utils import AB42_SEQUENCE, timed
+from fot.ensemble_cache import EnsembleCache
+from protein_folding_analysis import RigorousProteinFolder
+from rigorous_scientific_discovery import RigorousScientificDiscovery
+
+SUMMARY_KEYS = ('mean_energy', 'std_energy', 'best_energy', 'energy_histogram', 'energy_samples')
+
+
+def inquiry(sequence: str, n_samples: int, cache: EnsembleCache, output_dir: Path) -> dict:
+    """Time one inquiry and the folding simulations inside it"""
+
+    simulations = []
+    simulate = RigorousProteinFolder.run_folding_simulation
+
+    def timed_simulation(folder, *args, **kwargs):
+        with timed() as timing:
+            results = simulate(folder, *args, **kwargs)
+        simulations.append((timing['seconds'], results))
+        return results
+
+    RigorousProteinFolder.run_folding_simulation = timed_simulation
+    try:
+        with open(os.devnull, 'w') as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            try:
+                discovery = RigorousScientificDiscovery(sequence, output_dir=str(output_dir), base_seed=0,
+                                                        ensemble_cache=cache)
+                with timed() as timing:
+                    discovery.run_complete_scientific_inquiry(n_samples)
+            finally:
+                sys.stdout = stdout
+    finally:
+        RigorousProteinFolder.run_folding_simulation = simulate
+
+    return {
+        'total_s': timing['seconds'],
+        'folding_s': sum(seconds for seconds, _ in simulations),
+        'reused': sum(results['reused_samples'] for _, results in simulations),
+        'rigorous': simulations[-1][1] if simulations else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Ensemble cache saving per rigorous scientific inquiry",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--samples", type=int, default=1000, help="Samples of the rigorous analysis")
+    parser.add_argument("--repeats", type=int, default=3, help="Inquiries per mode (best time is reported)")
+    args = parser.parse_args()
+
+    # The inquiry logs its (expected) validation failures at ERROR level
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_dir = Path(tmp) / "rigorous_discoveries"
+        disk_dir = Path(tmp) / "ensembles"
+        inquiry(AB42_SEQUENCE, args.samples, EnsembleCache(cache_dir=disk_dir), output_dir)  # warm disk tier
+
+        modes = {
+            'none': lambda: EnsembleCache(max_entries=0),
+            'memory': lambda: EnsembleCache(),
+            'disk': lambda: EnsembleCache(max_entries=0, cache_dir=disk_dir),
+        }
+        rows = {mode: min((inquiry(AB42_SEQUENCE, args.samples, make_cache(), output_dir)
+                           for _ in range(args.repeats)), key=lambda row: row['total_s'])
+                for mode, make_cache in modes.items()}
+
+    reference = rows['none']
+    print(f"Abeta42, reality check 200 + rigorous analysis {args.samples} samples, best of {args.repeats}")
+    print(f"{'cache':>7} {'inquiry (s)':>12} {'folding (s)':>12} {'reused':>7} {'saved (s)':>10} "
+          f"{'saved %':>8} {'match':>6}")
+    for mode, row in rows.items():
+        saved = reference['total_s'] - row['total_s']
+        match = all(row['rigorous'][key] == reference['rigorous'][key] for key in SUMMARY_KEYS)
+        print(f"{mode:>7} {row['total_s']:12.2f} {row['folding_s']:12.2f} {row['reused']:>7} {saved:10.2f} "
+              f"{saved / reference['total_s']:8.1%} {str(match):>6}")
+
+
+if __name__ == "__main__":
+    main()
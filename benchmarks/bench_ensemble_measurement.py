@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Conformation measurement throughput
+
+Compares drawing K conformations with the legacy per-residue
+torch.multinomial loop against ProteinVQbitGraph.measure_ensemble, which
+draws all K × N measurements in one batched call. Reported as
+conformations per second.
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+import torch
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_utils import make_sequence, timed
+from fot.vqbit_mathematics import ProteinVQbitGraph
+
+
+def legacy_draw(graph: ProteinVQbitGraph, n_conformations: int) -> None:
+    """One multinomial call per residue per conformation, as the old measure_conformation did"""
+    for _ in range(n_conformations):
+        for i in range(graph.n_residues):
+            amplitudes = graph.amplitudes[i]
+            probabilities = torch.real(torch.conj(amplitudes) * amplitudes)
+            torch.multinomial(probabilities, 1).item()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Ensemble measurement throughput benchmark",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--lengths", type=int, nargs='+', default=[42, 200, 1000],
+                        help="Sequence lengths to benchmark")
+    parser.add_argument("--conformations", type=int, default=1000,
+                        help="Conformations drawn per measurement (K)")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    torch.manual_seed(0)
+
+    print(f"{'N':>6} {'K':>6} {'legacy conf/s':>14} {'ensemble conf/s':>16} {'speedup':>9}")
+    for length in args.lengths:
+        graph = ProteinVQbitGraph(make_sequence(length))
+        graph.initialize_from_sequence(use_biophysical_priors=True)
+
+        with timed() as legacy:
+            legacy_draw(graph, args.conformations)
+        with timed() as ensemble:
+            graph.measure_ensemble(args.conformations)
+
+        legacy_rate = args.conformations / legacy['seconds']
+        ensemble_rate = args.conformations / ensemble['seconds']
+        print(f"{length:>6} {args.conformations:>6} {legacy_rate:14.1f} {ensemble_rate:16.1f} "
+              f"{ensemble_rate / legacy_rate:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Initialization cache benchmark replaying a PublicationGradeAnalyzer run
+
+Follows PublicationGradeAnalyzer.run_single_replica for the vQbit side: one
+ProteinVQbitGraph per (temperature, replica), and one run_fot_optimization
+call per sample with the analyzer's Grover schedule as the iteration cap.
+The classical RigorousProteinFolder steps are skipped since they do not touch
+vQbit initialization.
+
+Each replica re-initializes from its own seed, so the replay is run four
+ways: the legacy initialization (eager random entanglement maps for every
+neighbor on every call), unseeded (fresh random state every call), seeded
+without a cache, and seeded with the initialization cache. Reports cache hit
+rate, time spent in initialization and total replay time.
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import torch
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_utils import AB42_SEQUENCE
+from fot.vqbit_init_cache import InitializationCache
+from fot.vqbit_mathematics import ProteinVQbitGraph
+from publication_grade_analysis import PublicationGradeAnalyzer
+
+
+def legacy_initialize(graph: ProteinVQbitGraph, seed=None) -> None:
+    """The pre-cache initialization: random amplitudes plus eager 8×8 maps per neighbor"""
+    amplitudes = torch.randn(graph.n_residues, 8, dtype=torch.complex64)
+    graph._set_state(amplitudes / torch.linalg.vector_norm(amplitudes, dim=1, keepdim=True))
+    graph.legacy_entanglement_maps = {
+        i: {neighbor: torch.randn(8, 8, dtype=torch.complex64) for neighbor in graph.contact_graph.neighbors(i).tolist()}
+        for i in range(graph.n_residues)
+    }
+
+
+def replay(analyzer: PublicationGradeAnalyzer, samples: int, mode: str, cache_dir=None) -> dict:
+    """Replay the vQbit calls of a PublicationGradeAnalyzer run"""
+
+    if mode == 'cached':
+        cache = InitializationCache(cache_dir=cache_dir)
+    else:
+        # max_entries=0 evicts on insert: every lookup misses
+        cache = InitializationCache(max_entries=0)
+
+    init_seconds = 0.0
+    start = time.perf_counter()
+
+    for t_index, temperature in enumerate(analyzer.temperatures):
+        for replica in range(analyzer.n_replicas_per_temp):
+            graph = ProteinVQbitGraph(analyzer.sequence, init_cache=cache)
+            replica_seed = None if mode in ('legacy', 'unseeded') else t_index * analyzer.n_replicas_per_temp + replica
+
+            if mode == 'legacy':
+                initialize = lambda seed=None, graph=graph: legacy_initialize(graph, seed)
+            else:
+                initialize = graph.initialize_vqbit_states
+
+            def timed_initialize(seed=None, initialize=initialize):
+                nonlocal init_seconds
+                init_start = time.perf_counter()
+                initialize(seed=seed)
+                init_seconds += time.perf_counter() - init_start
+
+            graph.initialize_vqbit_states = timed_initialize
+
+            for sample_idx in range(samples):
+                measurement_idx = sample_idx // analyzer.measurement_stride
+                if measurement_idx < len(analyzer.grover_schedule):
+                    grover_iters = analyzer.grover_schedule[measurement_idx]
+                else:
+                    grover_iters = 8
+                graph.run_fot_optimization(max_iterations=max(grover_iters, 1), init_seed=replica_seed)
+
+    info = cache.cache_info()
+    return {
+        'mode': mode,
+        'calls': len(analyzer.temperatures) * analyzer.n_replicas_per_temp * samples,
+        'hit_rate': info['hit_rate'],
+        'init_s': init_seconds,
+        'total_s': time.perf_counter() - start,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="vQbit initialization cache benchmark (PublicationGradeAnalyzer replay)",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--samples", type=int, default=200,
+                        help="Samples per replica (the analyzer uses 2000)")
+    parser.add_argument("--disk", action="store_true",
+                        help="Back the cache with a temporary on-disk directory")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        analyzer = PublicationGradeAnalyzer(AB42_SEQUENCE, output_dir=Path(tmp) / "publication_results")
+        analyzer.samples_per_replica = args.samples
+        analyzer.grover_schedule = analyzer._create_grover_schedule()
+        cache_dir = Path(tmp) / "init_cache" if args.disk else None
+
+        rows = [
+            replay(analyzer, args.samples, 'legacy'),
+            replay(analyzer, args.samples, 'unseeded'),
+            replay(analyzer, args.samples, 'seeded'),
+            replay(analyzer, args.samples, 'cached', cache_dir),
+        ]
+
+    baseline_init = rows[0]['init_s']
+    print(f"{'mode':>9} {'calls':>6} {'hit rate':>9} {'init (s)':>9} {'init saved (s)':>15} {'total (s)':>10}")
+    for row in rows:
+        print(f"{row['mode']:>9} {row['calls']:>6} {row['hit_rate']:9.3f} {row['init_s']:9.4f} "
+              f"{baseline_init - row['init_s']:15.4f} {row['total_s']:10.3f}")
+
+
+if __name__ == "__main__":
+    main()
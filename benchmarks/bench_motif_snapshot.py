@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Learned-motif lookup benchmark: per-window AKG queries vs local snapshot
+
+Builds a synthetic motif library with the extraction rules of
+AKGLearningSystem._extract_structural_motifs, then resolves the 6-residue
+windows of a batch of query sequences two ways:
+
+- per-window: one query per window, modelled as the Neo4j query (CONTAINS
+  scan over all motifs, ranked, LIMIT 10) plus a fixed round-trip latency
+- snapshot: one bulk load into MotifSnapshot, then resolve_windows()
+
+Reports windows resolved per second for each path.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_utils import make_sequence
+from fot.motif_snapshot import MotifSnapshot
+
+
+def build_library(n_discoveries: int, length: int):
+    """Motifs extracted from random 'discovered' sequences"""
+    motifs = []
+    for d in range(n_discoveries):
+        sequence = make_sequence(length, seed=d)
+        for i in range(len(sequence) - 7):
+            fragment = sequence[i:i + 8]
+            if 'G' in fragment[3:5]:
+                motifs.append({'type': 'beta_hairpin', 'fragment': fragment, 'confidence': 0.7})
+        for i in range(len(sequence) - 8):
+            fragment = sequence[i:i + 9]
+            if sum(1 for aa in fragment if aa in 'EDRK') >= 3:
+                motifs.append({'type': 'alpha_helix', 'fragment': fragment, 'confidence': 0.6})
+        for i in range(len(sequence) - 5):
+            fragment = sequence[i:i + 6]
+            if sum(1 for aa in fragment if aa in 'FILVWYAM') >= 4:
+                motifs.append({'type': 'binding_site', 'fragment': fragment, 'confidence': 0.65})
+
+    for index, motif in enumerate(motifs):
+        motif['motif_id'] = f"motif_{index}"
+        motif['validation_score'] = (index % 100) / 100.0
+    return motifs
+
+
+def per_window_query(motifs, fragment: str, latency_s: float):
+    """Model of query_learned_motifs: round trip plus a CONTAINS scan"""
+    if latency_s:
+        time.sleep(latency_s)
+    matches = [m for m in motifs if fragment in m['fragment'] or m['fragment'] in fragment]
+    matches.sort(key=lambda m: (-m['confidence'], -m['validation_score']))
+    return matches[:10]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Per-window vs snapshot learned-motif lookup",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--discoveries", type=int, default=200,
+                        help="Discoveries contributing motifs to the library")
+    parser.add_argument("--queries", type=int, default=50,
+                        help="Query sequences to initialize")
+    parser.add_argument("--length", type=int, default=300,
+                        help="Query sequence length")
+    parser.add_argument("--latency-ms", type=float, default=1.0,
+                        help="Modelled database round-trip latency per query")
+    args = parser.parse_args()
+
+    motifs = build_library(args.discoveries, 120)
+    # Half of the queries reuse discovered sequences so windows find motifs
+    queries = [make_sequence(args.length, seed=(q if q % 2 else 10_000 + q)) for q in range(args.queries)]
+    windows = [
+        (sequence, i) for sequence in queries
+        for i in range(0, len(sequence), 6) if len(sequence[i:i + 6]) >= 4
+    ]
+
+    start = time.perf_counter()
+    per_window_hits = 0
+    for sequence, i in windows:
+        per_window_hits += len(per_window_query(motifs, sequence[i:i + 6], args.latency_ms / 1000.0))
+    per_window_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    snapshot = MotifSnapshot(motifs, version=1)
+    build_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    snapshot_hits = sum(len(snapshot.resolve_windows(sequence)) for sequence in queries)
+    resolve_s = time.perf_counter() - start
+
+    print(f"library: {len(motifs)} motifs, {len(windows)} windows, latency {args.latency_ms} ms")
+    print(f"{'path':>22} {'seconds':>10} {'windows/s':>12} {'matches':>8}")
+    print(f"{'per-window query':>22} {per_window_s:10.4f} {len(windows) / per_window_s:12.0f} {per_window_hits:>8}")
+    print(f"{'snapshot (resolve)':>22} {resolve_s:10.4f} {len(windows) / resolve_s:12.0f} {snapshot_hits:>8}")
+    print(f"{'snapshot (+ build)':>22} {build_s + resolve_s:10.4f} "
+          f"{len(windows) / (build_s + resolve_s):12.0f} {snapshot_hits:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Strong scaling of run_folding_simulation over worker processes
+
+Runs a fixed number of samples split into a fixed number of seeded chains
+(--chains, 16 by default) with 1 to 16 worker processes, and reports wall
+time, speedup and parallel efficiency against one worker. Because the
+chains and their seeds do not depend on the worker count, every run must
+produce the same merged statistics as the single-process run; the 'match'
+column checks mean, std, best energy, histogram and energy reservoir for
+exact equality.
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_utils import make_sequence, timed
+from fot.rng_context import RNGContext
+from fot.thread_budget import available_cpus
+from protein_folding_analysis import RigorousProteinFolder
+
+SUMMARY_KEYS = ('mean_energy', 'std_energy', 'best_energy', 'energy_histogram', 'energy_samples')
+
+
+def simulate(sequence: str, n_samples: int, n_chains: int, n_workers: int, method: str):
+    with open(os.devnull, 'w') as devnull:
+        stdout, sys.stdout = sys.stdout, devnull
+        folder = RigorousProteinFolder(sequence, rng=RNGContext.derive(0, sequence))
+        with timed() as timing:
+            results = folder.run_folding_simulation(n_samples=n_samples, method=method, n_chains=n_chains,
+                                                    n_workers=n_workers)
+        sys.stdout = stdout
+    return results, timing['seconds']
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Multi-process folding simulation scaling",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--length", type=int, default=200, help="Sequence length")
+    parser.add_argument("--samples", type=int, default=1600, help="Samples per simulation")
+    parser.add_argument("--chains", type=int, default=16, help="Seeded chains the samples are split into")
+    parser.add_argument("--workers", type=int, nargs='+', default=[1, 2, 4, 8, 16], help="Worker counts")
+    parser.add_argument("--method", choices=('independent', 'mcmc'), default='independent')
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    sequence = make_sequence(args.length)
+    simulate(sequence, 1, 1, 1, args.method)  # build the grids
+
+    print(f"N={args.length}, {args.samples} samples in {args.chains} chains ({args.method}), "
+          f"{available_cpus()} CPU(s)")
+    print(f"{'workers':>8} {'time (s)':>9} {'samples/s':>10} {'speedup':>8} {'efficiency':>11} {'match':>6}")
+    reference, reference_s = None, None
+    for n_workers in args.workers:
+        results, seconds = simulate(sequence, args.samples, args.chains, n_workers, args.method)
+        if reference is None:
+            reference, reference_s = results, seconds
+        match = all(results[key] == reference[key] for key in SUMMARY_KEYS)
+        speedup = reference_s / seconds
+        print(f"{n_workers:>8} {seconds:9.2f} {args.samples / seconds:10.1f} {speedup:8.2f} "
+              f"{speedup / n_workers:11.2f} {str(match):>6}")
+
+
+if __name__ == "__main__":
+    main()
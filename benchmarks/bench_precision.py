@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Accuracy harness for the vQbit precision modes
+
+Runs the fixed sequence panel through run_fot_optimization in every
+precision mode from the same seeded initial state, with convergence
+disabled so every mode runs the same number of iterations. Reports, per
+sequence and mode:
+
+- the maximum relative deviation of the FoT history from the complex128
+  reference run
+- wall-clock time and the speedup over the reference
+- bytes held by the state, virtue operators and cached propagators
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+import numpy as np
+import torch
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_utils import SEQUENCE_PANEL, make_sequence, timed
+from fot.convergence import LagConvergence
+from fot.vqbit_mathematics import ProteinVQbitGraph
+from fot.vqbit_precision import PRECISION_POLICIES
+
+
+def tensor_bytes(*tensors) -> int:
+    return sum(t.element_size() * t.nelement() for t in tensors if t is not None)
+
+
+def engine_bytes(graph: ProteinVQbitGraph) -> int:
+    """Bytes held by the state tensors, operators and propagator cache"""
+    total = tensor_bytes(graph.amplitudes, graph.coherence, graph.virtue_scores, graph.laplacian_matrix)
+    total += sum(tensor_bytes(op.projector, op.aggregate_matrix) for op in graph.virtue_operators.values())
+    total += sum(tensor_bytes(cumulative, aggregates) for cumulative, aggregates, _ in graph._stage_operators.values())
+    if graph.propagator is not None:
+        total += tensor_bytes(*getattr(graph.propagator, '_propagators', {}).values())
+    return total
+
+
+def run(sequence: str, mode: str, iterations: int, seed: int):
+    graph = ProteinVQbitGraph(sequence, precision=mode)
+    torch.manual_seed(seed)
+    with timed() as timing:
+        results = graph.run_fot_optimization(
+            max_iterations=iterations, convergence=LagConvergence(threshold=0.0), init_seed=seed
+        )
+    return np.array(results['fot_history']), timing['seconds'], engine_bytes(graph)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="vQbit precision mode accuracy / speed / memory harness",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--iterations", type=int, default=200, help="Iterations per run")
+    parser.add_argument("--extra-lengths", type=int, nargs='*', default=[500],
+                        help="Random sequence lengths added to the panel")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    panel = dict(SEQUENCE_PANEL)
+    for length in args.extra_lengths:
+        panel[f'random-{length}'] = make_sequence(length, seed=length)
+
+    modes = list(PRECISION_POLICIES)
+    print(f"{'sequence':>16} {'mode':>10} {'max rel dev':>12} {'time (s)':>9} {'speedup':>8} {'bytes':>10} {'mem ratio':>10}")
+    for seed, (name, sequence) in enumerate(panel.items()):
+        runs = {mode: run(sequence, mode, args.iterations, seed) for mode in modes}
+        reference_history, reference_time, reference_bytes = runs['reference']
+
+        for mode in modes:
+            history, seconds, n_bytes = runs[mode]
+            deviation = np.max(np.abs(history - reference_history) / np.maximum(np.abs(reference_history), 1e-12))
+            print(f"{name:>16} {mode:>10} {deviation:12.2e} {seconds:9.3f} {reference_time / seconds:7.2f}x "
+                  f"{n_bytes:>10} {n_bytes / reference_bytes:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
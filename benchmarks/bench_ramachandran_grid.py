@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Ramachandran energy evaluations per second: region loop vs energy grid
+
+Times calculate_ramachandran_energy (eight region dictionaries in scalar
+Python) against ramachandran_energies (bilinear lookup in the residue
+class's precomputed grid) on random (phi, psi) trials, in batches of 100
+(one residue's trials in sample_conformation) and of 100,000. Also reports
+the grid build / .npy load time, the worst deviation from the region loop
+and one sample_conformation pass with each energy path.
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_utils import AB42_SEQUENCE, timed
+from fot.ramachandran_grid import RamachandranGridCache
+from protein_folding_analysis import RamachandranState, RigorousProteinFolder
+
+
+def legacy_sample_conformation(folder: RigorousProteinFolder):
+    """sample_conformation with the per-trial scalar energy calls"""
+    conformations = []
+    for i in range(folder.n_residues):
+        best_energy, best_state = float('inf'), None
+        for _ in range(100):
+            phi = folder.np_random.uniform(-180, 180)
+            psi = folder.np_random.uniform(-180, 180)
+            total_energy = folder.calculate_ramachandran_energy(i, phi, psi) + \
+                folder.calculate_local_interactions(i, phi, psi)
+            if total_energy < best_energy or folder.np_random.random() < np.exp(-(total_energy - best_energy) / folder.kT):
+                best_energy = total_energy
+                best_state = RamachandranState(phi, psi, total_energy, np.exp(-total_energy / folder.kT),
+                                               total_energy < 5.0)
+        conformations.append(best_state)
+    return conformations
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Ramachandran energy grid throughput",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--scalar-evaluations", type=int, default=20000,
+                        help="Trials scored with the scalar region loop")
+    parser.add_argument("--batch-evaluations", type=int, default=2_000_000,
+                        help="Trials scored with the grid")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    cache_dir = tempfile.mkdtemp(prefix="fot_rama_grids_")
+    with open(os.devnull, 'w') as devnull:
+        stdout, sys.stdout = sys.stdout, devnull
+        folder = RigorousProteinFolder(AB42_SEQUENCE, grid_cache=RamachandranGridCache(cache_dir))
+        cold = RigorousProteinFolder(AB42_SEQUENCE, grid_cache=RamachandranGridCache(cache_dir))
+        sys.stdout = stdout
+
+    n_classes = len(set(AB42_SEQUENCE))
+    with timed() as build:
+        for i in range(folder.n_residues):
+            folder.ramachandran_energies(i, [0.0], [0.0])
+    with timed() as load:
+        for i in range(cold.n_residues):
+            cold.ramachandran_energies(i, [0.0], [0.0])
+    print(f"{n_classes} residue classes: build {build['seconds']:.3f}s, .npy load {load['seconds']:.3f}s, "
+          f"{folder.grid_cache.cache_info()['nbytes'] / 2**20:.1f} MB")
+
+    rng = np.random.default_rng(0)
+    residues = rng.integers(0, folder.n_residues, size=args.scalar_evaluations)
+    angles = rng.uniform(-180, 180, size=(args.scalar_evaluations, 2))
+    with timed() as scalar:
+        reference = [folder.calculate_ramachandran_energy(i, phi, psi) for i, (phi, psi) in zip(residues, angles)]
+    grid_values = np.array([folder.ramachandran_energies(i, phi, psi) for i, (phi, psi) in zip(residues, angles)])
+    max_error = np.abs(grid_values - np.array(reference)).max()
+
+    batch_angles = rng.uniform(-180, 180, size=(args.batch_evaluations, 2))
+    with timed() as batch_100:
+        for start in range(0, args.batch_evaluations, 100):
+            folder.ramachandran_energies(start % folder.n_residues, batch_angles[start:start + 100, 0],
+                                         batch_angles[start:start + 100, 1])
+    with timed() as batch_large:
+        for start in range(0, args.batch_evaluations, 100_000):
+            folder.ramachandran_energies(start % folder.n_residues, batch_angles[start:start + 100_000, 0],
+                                         batch_angles[start:start + 100_000, 1])
+
+    scalar_rate = args.scalar_evaluations / scalar['seconds']
+    print(f"\n{'path':>22} {'evals/s':>14} {'speedup':>8}")
+    print(f"{'region loop':>22} {scalar_rate:14,.0f} {1.0:7.1f}x")
+    for name, timing in (('grid, batch 100', batch_100), ('grid, batch 100k', batch_large)):
+        rate = args.batch_evaluations / timing['seconds']
+        print(f"{name:>22} {rate:14,.0f} {rate / scalar_rate:7.1f}x")
+    print(f"max |grid - loop| = {max_error:.2e} kcal/mol")
+
+    with timed() as legacy:
+        legacy_sample_conformation(folder)
+    with timed() as gridded:
+        folder.sample_conformation()
+    print(f"\nsample_conformation (Abeta42): region loop {legacy['seconds']:.3f}s, "
+          f"grid {gridded['seconds']:.3f}s ({legacy['seconds'] / gridded['seconds']:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Dense vs sparse Laplacian backend benchmark
+
+For each length and backend, a fresh spawned process builds a
+ProteinVQbitGraph, runs a number of evolution steps and reports graph build
+time, the first step (which includes the eigendecomposition for the dense
+backend), the steady-state wall time per step and peak RSS.
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_utils import make_sequence, peak_rss_mb, timed
+
+
+def measure(length: int, backend: str, steps: int) -> dict:
+    logging.disable(logging.INFO)
+    from fot.vqbit_mathematics import ProteinVQbitGraph
+
+    # sparse_threshold=0 forces sparse; length forces dense
+    threshold = 0 if backend == 'sparse' else length
+    sequence = make_sequence(length)
+
+    with timed() as build:
+        graph = ProteinVQbitGraph(sequence, sparse_threshold=threshold)
+    graph.initialize_from_sequence(use_biophysical_priors=False)
+
+    with timed() as first:
+        graph.evolve_entangled_states(time_step=0.1)
+    with timed() as steady:
+        for _ in range(steps):
+            graph.evolve_entangled_states(time_step=0.1)
+
+    return {
+        'length': length,
+        'backend': backend,
+        'build_s': build['seconds'],
+        'first_step_s': first['seconds'],
+        'step_s': steady['seconds'] / steps,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Dense vs sparse Laplacian backend benchmark",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--lengths", type=int, nargs='+', default=[256, 1000, 2000, 5000],
+                        help="Sequence lengths to benchmark")
+    parser.add_argument("--max-dense-length", type=int, default=2000,
+                        help="Largest length for the dense backend")
+    parser.add_argument("--steps", type=int, default=10,
+                        help="Steady-state evolution steps to average over")
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    print(f"{'N':>6} {'backend':>8} {'build (s)':>10} {'1st step (s)':>13} {'step (s)':>10} {'peak RSS (MB)':>14}")
+    for length in args.lengths:
+        for backend in ('dense', 'sparse'):
+            if backend == 'dense' and length > args.max_dense_length:
+                continue
+            with context.Pool(1) as pool:
+                row = pool.apply(measure, (length, backend, args.steps))
+            print(f"{row['length']:>6} {row['backend']:>8} {row['build_s']:10.4f} "
+                  f"{row['first_step_s']:13.4f} {row['step_s']:10.5f} {row['peak_rss_mb']:14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark: spectral propagator vs dense Kronecker evolution
+
+Times one evolution step of ProteinVQbitGraph for N = 16 ... 1024 residues
+with the cached spectral propagator and with the original
+torch.matrix_exp(kron(L, I₈)) path. The dense path is O((8N)³) and is only
+run up to --max-kron-length.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import torch
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_utils import make_sequence
+from fot.vqbit_mathematics import ProteinVQbitGraph
+from fot.vqbit_propagator import SpectralPropagator
+
+
+def time_kronecker_step(laplacian: torch.Tensor, amplitudes: torch.Tensor, time_step: float) -> float:
+    start = time.perf_counter()
+    identity_8 = torch.eye(8, dtype=torch.complex64)
+    hamiltonian = -1.0 * torch.kron(laplacian.to(torch.complex64), identity_8)
+    evolution_operator = torch.matrix_exp(-1j * hamiltonian * time_step)
+    evolution_operator @ amplitudes.reshape(-1)
+    return time.perf_counter() - start
+
+
+def time_spectral_steps(laplacian: torch.Tensor, amplitudes: torch.Tensor, time_step: float,
+                        repeats: int):
+    start = time.perf_counter()
+    propagator = SpectralPropagator(laplacian)
+    propagator.apply(amplitudes, time_step)
+    first_step = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        amplitudes = propagator.apply(amplitudes, time_step)
+    cached_step = (time.perf_counter() - start) / repeats
+
+    return first_step, cached_step
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Spectral propagator scaling benchmark",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--lengths", type=int, nargs='+',
+                        default=[16, 32, 64, 128, 256, 512, 1024],
+                        help="Sequence lengths to benchmark")
+    parser.add_argument("--max-kron-length", type=int, default=256,
+                        help="Largest length for the dense Kronecker reference")
+    parser.add_argument("--repeats", type=int, default=20,
+                        help="Cached propagator applications to average over")
+    parser.add_argument("--time-step", type=float, default=0.1,
+                        help="Evolution time step")
+    args = parser.parse_args()
+
+    print(f"{'N':>6} {'kron step (s)':>14} {'spectral 1st (s)':>17} {'spectral cached (s)':>20} {'speedup':>9}")
+    for length in args.lengths:
+        graph = ProteinVQbitGraph(make_sequence(length))
+        amplitudes = torch.randn(length, 8, dtype=torch.complex64)
+
+        first_step, cached_step = time_spectral_steps(
+            graph.laplacian_matrix, amplitudes, args.time_step, args.repeats
+        )
+
+        if length <= args.max_kron_length:
+            kron_step = time_kronecker_step(graph.laplacian_matrix, amplitudes, args.time_step)
+            kron_text = f"{kron_step:14.5f}"
+            speedup_text = f"{kron_step / cached_step:8.1f}x"
+        else:
+            kron_text = f"{'skipped':>14}"
+            speedup_text = f"{'-':>9}"
+
+        print(f"{length:>6} {kron_text} {first_step:17.5f} {cached_step:20.6f} {speedup_text}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Streaming vs retained folding simulation statistics
+
+For each mode, a fresh spawned process runs run_folding_simulation
+(independent sampling) on a pseudo-random sequence and reports wall time,
+peak RSS and the RSS growth over the process after a one-sample warm-up
+(which loads torch and builds the Ramachandran grids). The streaming mode
+keeps only the constant-memory summaries; the retain mode also keeps every
+sample's energy and conformation (retain_conformations=True).
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_utils import make_sequence, peak_rss_mb, timed
+
+
+def measure(length: int, n_samples: int, retain: bool) -> dict:
+    logging.disable(logging.INFO)
+    from fot.rng_context import RNGContext
+    from protein_folding_analysis import RigorousProteinFolder
+
+    sequence = make_sequence(length)
+    with open(os.devnull, 'w') as devnull:
+        stdout, sys.stdout = sys.stdout, devnull
+        folder = RigorousProteinFolder(sequence, rng=RNGContext.derive(0, sequence))
+        folder.run_folding_simulation(n_samples=1)
+        baseline_mb = peak_rss_mb()
+        with timed() as timing:
+            results = folder.run_folding_simulation(n_samples=n_samples, retain_conformations=retain)
+        sys.stdout = stdout
+
+    return {
+        'mode': 'retain' if retain else 'streaming',
+        'seconds': timing['seconds'],
+        'peak_rss_mb': peak_rss_mb(),
+        'growth_mb': peak_rss_mb() - baseline_mb,
+        'mean_energy': results['mean_energy'],
+        'std_energy': results['std_energy'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Streaming vs retained folding simulation statistics",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--length", type=int, default=200, help="Sequence length")
+    parser.add_argument("--samples", type=int, default=100_000, help="Samples per simulation")
+    parser.add_argument("--modes", nargs='+', choices=('streaming', 'retain'), default=['streaming', 'retain'],
+                        help="Modes to run (retain needs ~50 MB per 1000 samples at N=200)")
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    print(f"N={args.length}, {args.samples} samples")
+    print(f"{'mode':>10} {'time (s)':>9} {'samples/s':>10} {'peak RSS (MB)':>14} {'growth (MB)':>12} "
+          f"{'mean E':>10} {'std E':>7}")
+    for retain in (mode == 'retain' for mode in args.modes):
+        with context.Pool(1) as pool:
+            row = pool.apply(measure, (args.length, args.samples, retain))
+        print(f"{row['mode']:>10} {row['seconds']:9.1f} {args.samples / row['seconds']:10.1f} "
+              f"{row['peak_rss_mb']:14.1f} {row['growth_mb']:12.1f} {row['mean_energy']:10.2f} "
+              f"{row['std_energy']:7.3f}")
+
+
+if __name__ == "__main__":
+    main()
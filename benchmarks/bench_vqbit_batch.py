@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Batched vs looped FoT optimization throughput
+
+Optimizes a panel of sequences once by looping ProteinVQbitGraph over them
+and once with a single VQbitBatch, and reports sequences per second.
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+import numpy as np
+import torch
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_utils import make_sequence, timed
+from fot.vqbit_batch import VQbitBatch
+from fot.vqbit_mathematics import ProteinVQbitGraph
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Batched vs looped FoT optimization benchmark",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--batch-sizes", type=int, nargs='+', default=[8, 32, 128],
+                        help="Number of sequences per panel")
+    parser.add_argument("--min-length", type=int, default=20, help="Minimum sequence length")
+    parser.add_argument("--max-length", type=int, default=60, help="Maximum sequence length")
+    parser.add_argument("--iterations", type=int, default=100, help="FoT iterations per sequence")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    rng = np.random.default_rng(2024)
+
+    print(f"{'B':>5} {'looped (s)':>11} {'batched (s)':>12} {'looped seq/s':>13} {'batched seq/s':>14} {'speedup':>8}")
+    for batch_size in args.batch_sizes:
+        lengths = rng.integers(args.min_length, args.max_length + 1, size=batch_size)
+        sequences = [make_sequence(int(length), seed=i) for i, length in enumerate(lengths)]
+
+        torch.manual_seed(0)
+        with timed() as looped:
+            for sequence in sequences:
+                ProteinVQbitGraph(sequence).run_fot_optimization(max_iterations=args.iterations)
+
+        torch.manual_seed(0)
+        with timed() as batched:
+            VQbitBatch(sequences).run_fot_optimization(max_iterations=args.iterations)
+
+        print(f"{batch_size:>5} {looped['seconds']:11.3f} {batched['seconds']:12.3f} "
+              f"{batch_size / looped['seconds']:13.1f} {batch_size / batched['seconds']:14.1f} "
+              f"{looped['seconds'] / batched['seconds']:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
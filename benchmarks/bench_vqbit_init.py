@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+ProteinVQbitGraph.__init__ time and memory benchmark
+
+Each length is measured in a fresh spawned process so peak RSS is not
+polluted by earlier runs. Reports total constructor time, the time spent
+building virtue operators (cold cache vs warm process-wide cache), the bytes
+held by the virtue operators, and the cost of the legacy per-residue
+(N, 8, 8) construction the shared operators replace.
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_utils import make_sequence, peak_rss_mb, timed
+
+
+def legacy_operator_build(n_residues: int) -> float:
+    """Rebuild the four per-residue (N, 8, 8) operators as the old constructor did"""
+    import torch
+
+    with timed() as timing:
+        stability = torch.tensor([0.8, 0.7, 0.6, 0.7, 0.6, 0.5, 0.4, 0.3], dtype=torch.complex64)
+        efficiency = torch.tensor([0.6, 0.5, 0.4, 0.6, 0.5, 0.4, 0.3, 0.2], dtype=torch.complex64)
+        for fill in ('justice', 'honesty', 'temperance', 'prudence'):
+            matrix = torch.zeros((n_residues, 8, 8), dtype=torch.complex64)
+            for i in range(n_residues):
+                if fill == 'justice':
+                    matrix[i, 0:3, 0:3] = torch.eye(3, dtype=torch.complex64) * 0.2
+                    matrix[i, 3:6, 3:6] = torch.eye(3, dtype=torch.complex64) * 0.6
+                    matrix[i, 6:8, 6:8] = torch.eye(2, dtype=torch.complex64) * 0.9
+                elif fill == 'honesty':
+                    matrix[i] = torch.eye(8, dtype=torch.complex64) * 0.7
+                elif fill == 'temperance':
+                    matrix[i] = torch.diag(stability)
+                else:
+                    matrix[i] = torch.diag(efficiency)
+            torch.linalg.eigh(matrix.sum(dim=0))
+    return timing['seconds']
+
+
+def measure(length: int, include_legacy: bool) -> dict:
+    logging.disable(logging.INFO)
+    from fot.vqbit_mathematics import ProteinVQbitGraph
+
+    sequence = make_sequence(length)
+    baseline_rss = peak_rss_mb()
+
+    with timed() as cold:
+        graph = ProteinVQbitGraph(sequence)
+    with timed() as warm:
+        ProteinVQbitGraph(sequence)
+    with timed() as operators_warm:
+        graph._initialize_virtue_operators()
+
+    operator_bytes = sum(
+        t.element_size() * t.nelement()
+        for op in graph.virtue_operators.values()
+        for t in (op.constraint_matrix, op.projector, op.aggregate_matrix)
+    )
+
+    return {
+        'length': length,
+        'init_cold_s': cold['seconds'],
+        'init_warm_s': warm['seconds'],
+        'operators_warm_s': operators_warm['seconds'],
+        'operator_bytes': operator_bytes,
+        'legacy_operator_bytes': 4 * length * 64 * 8,
+        'legacy_operators_s': legacy_operator_build(length) if include_legacy else float('nan'),
+        'peak_rss_delta_mb': peak_rss_mb() - baseline_rss,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="ProteinVQbitGraph construction benchmark",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--lengths", type=int, nargs='+', default=[50, 1000, 10000],
+                        help="Sequence lengths to benchmark")
+    parser.add_argument("--skip-legacy", action="store_true",
+                        help="Skip timing the legacy per-residue operator construction")
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    print(f"{'N':>6} {'init cold (s)':>14} {'init warm (s)':>14} {'ops warm (s)':>13} "
+          f"{'legacy ops (s)':>15} {'ops bytes':>10} {'legacy bytes':>13} {'peak RSS +MB':>13}")
+    for length in args.lengths:
+        with context.Pool(1) as pool:
+            row = pool.apply(measure, (length, not args.skip_legacy))
+        print(f"{row['length']:>6} {row['init_cold_s']:14.4f} {row['init_warm_s']:14.4f} "
+              f"{row['operators_warm_s']:13.6f} {row['legacy_operators_s']:15.4f} "
+              f"{row['operator_bytes']:>10} {row['legacy_operator_bytes']:>13} {row['peak_rss_delta_mb']:13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Windowed domain-decomposition solver vs the monolithic vQbit solver
+
+For chains from 200 to 4000 residues, runs the monolithic
+run_fot_optimization and WindowedVQbitSolver (in process and with a worker
+pool) for the same iteration cap and reports wall time, speedup and the
+relative deviation of the windowed FoT scores from the monolithic ones
+(last optimization iterate and final measured FoT).
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_utils import make_sequence, timed
+from fot.vqbit_mathematics import ProteinVQbitGraph
+from fot.vqbit_windowed import DEFAULT_OVERLAP, DEFAULT_WINDOW, WindowedVQbitSolver
+
+
+def relative_deviation(value: float, reference: float) -> float:
+    return abs(value - reference) / max(abs(reference), 1e-12)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Windowed vs monolithic vQbit optimization",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--lengths", type=int, nargs='+', default=[200, 500, 1000, 2000, 4000],
+                        help="Chain lengths")
+    parser.add_argument("--iterations", type=int, default=100, help="Iteration cap (monolithic and per window)")
+    parser.add_argument("--refinement", type=int, default=10, help="Global refinement iterations")
+    parser.add_argument("--window", type=int, default=DEFAULT_WINDOW, help="Window length")
+    parser.add_argument("--overlap", type=int, default=DEFAULT_OVERLAP, help="Window overlap")
+    parser.add_argument("--workers", type=int, nargs='+', default=[1, 4], help="Window worker pool sizes")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    print(f"{'N':>6} {'solver':>14} {'time (s)':>9} {'speedup':>8} {'last FoT dev':>13} {'final FoT dev':>14}")
+    for length in args.lengths:
+        sequence = make_sequence(length)
+
+        with timed() as timing:
+            monolithic = ProteinVQbitGraph(sequence).run_fot_optimization(max_iterations=args.iterations, init_seed=0)
+        baseline = timing['seconds']
+        print(f"{length:>6} {'monolithic':>14} {baseline:9.3f} {1.0:7.2f}x {0.0:13.2e} {0.0:14.2e}")
+
+        for n_workers in args.workers:
+            solver = WindowedVQbitSolver(sequence, args.window, args.overlap, n_workers=n_workers)
+            with timed() as timing:
+                windowed = solver.run(max_iterations=args.iterations, refinement_iterations=args.refinement,
+                                      init_seed=0)
+            last_dev = relative_deviation(windowed['fot_history'][-1], monolithic['fot_history'][-1])
+            final_dev = relative_deviation(windowed['final_fot_value'], monolithic['final_fot_value'])
+            print(f"{length:>6} {f'windowed x{n_workers}':>14} {timing['seconds']:9.3f} "
+                  f"{baseline / timing['seconds']:7.2f}x {last_dev:13.2e} {final_dev:14.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the vQbit / folding benchmark scripts
+"""
+
+import os
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+AMINO_ACIDS = "ACDEFGHIKLMNPQRSTVWY"
+
+AB42_SEQUENCE = "DAEFRHDSGYEVHHQKLVFFAEDVGSNKGAIIGLMVGGVVIA"
+
+
+def make_sequence(length: int, seed: int = 1337) -> str:
+    """Deterministic pseudo-random protein sequence"""
+    rng = np.random.default_rng(seed)
+    return ''.join(rng.choice(list(AMINO_ACIDS), size=length))
+
+
+# Fixed sequence panel shared by the accuracy / early-stopping benchmarks
+SEQUENCE_PANEL = {
+    'Abeta42': AB42_SEQUENCE,
+    'Abeta40': AB42_SEQUENCE[:40],
+    'alpha-syn 61-95': "EQVTNVGGAVVTGVTAVAQKTVEGAGSIAAATGFV",
+    'random-25': make_sequence(25, seed=1),
+    'random-60': make_sequence(60, seed=2),
+    'random-120': make_sequence(120, seed=3),
+}
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+@contextmanager
+def timed() -> Iterator[Dict[str, float]]:
+    """Context manager recording wall time in result['seconds']"""
+    result = {}
+    start = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result['seconds'] = time.perf_counter() - start
@@ -55,6 +55,7 @@ class ContinuousConfig:
     output_dir: Path = Path("continuous_discoveries")
     archive_after_hours: int = 24
     cleanup_interval_batches: int = 10
+    checkpoint_dir: Optional[Path] = None  # Defaults to output_dir / "checkpoints"
 
 @dataclass
 class BatchResult:
@@ -87,6 +88,11 @@ class ContinuousDiscoveryEngine:
         (self.config.output_dir / "archives").mkdir(exist_ok=True)
         (self.config.output_dir / "discoveries").mkdir(exist_ok=True)
         
+        # Checkpoints outlive batches, so a restarted engine re-analyzes interrupted candidates
+        # first; their vQbit optimization resumes from the checkpoint, the other stages re-run
+        if self.config.checkpoint_dir is None:
+            self.config.checkpoint_dir = self.config.output_dir / "checkpoints"
+        
         # Initialize discovery system
         self.discovery_system = None
         
@@ -163,7 +169,8 @@ class ContinuousDiscoveryEngine:
             self.discovery_system = ValidatedDiscoverySystem(
                 output_dir=self.config.output_dir / "batches" / f"batch_{batch_id:06d}",
                 min_validation_score=self.config.min_validation_score,
-                min_therapeutic_potential=self.config.min_therapeutic_potential
+                min_therapeutic_potential=self.config.min_therapeutic_potential,
+                checkpoint_dir=self.config.checkpoint_dir
             )
             
             # Run discovery
@@ -41,6 +41,7 @@ try:
     from rigorous_scientific_discovery import RigorousScientificDiscovery
     from production_cure_discovery import ProductionCureDiscoveryEngine
     from protein_folding_analysis import RigorousProteinFolder
+    from fot.vqbit_checkpoint import pending_checkpoints
 except ImportError as e:
     logger.error(f"Failed to import required modules: {e}")
     sys.exit(1)
@@ -73,6 +74,9 @@ class DiscoveryDaemon:
         # Create discovery directory
         self.discovery_dir.mkdir(exist_ok=True)
         
+        # vQbit optimizations checkpoint here so a restart resumes them
+        self.checkpoint_dir = self.discovery_dir / "checkpoints"
+        
         # Discovery tracking
         self.discoveries_found = 0
         self.total_sequences_tested = 0
@@ -128,7 +132,8 @@ class DiscoveryDaemon:
             logger.info(f"🧬 Analyzing sequence {sequence_id}: {sequence[:20]}...")
             
             # Run rigorous scientific discovery
-            discovery_system = RigorousScientificDiscovery(sequence, self.discovery_dir)
+            discovery_system = RigorousScientificDiscovery(sequence, self.discovery_dir,
+                                                           checkpoint_dir=self.checkpoint_dir)
             assessment = discovery_system.run_complete_scientific_inquiry(n_samples=200)
             
             # Extract key metrics
@@ -398,12 +403,19 @@ class DiscoveryDaemon:
         logger.info(f"   Alert threshold: {self.alert_threshold}")
         logger.info("   Press Ctrl+C to stop")
         
+        # Sequences whose analysis was interrupted go first. Only the vQbit optimization resumes
+        # from its checkpoint; the folding stages and the report of the inquiry run again.
+        interrupted = [checkpoint.sequence for checkpoint in pending_checkpoints(self.checkpoint_dir)]
+        if interrupted:
+            logger.info(f"♻️  Re-analyzing {len(interrupted)} interrupted sequences "
+                        f"(vQbit optimization resumes from its checkpoint, other stages re-run)")
+        
         try:
             sequence_counter = 1
             
             while True:
                 sequence_id = f"DAEMON_{sequence_counter:06d}"
-                sequence = self.generate_candidate_sequence()
+                sequence = interrupted.pop(0) if interrupted else self.generate_candidate_sequence()
                 
                 # Analyze sequence
                 result = self.analyze_sequence(sequence, sequence_id)
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Convergence Controllers for FoT Optimization
+
+run_fot_optimization asks a controller after every iteration whether to
+stop. Two controllers are provided:
+
+- LagConvergence: the original rule, |FoT(t) - FoT(t-9)| < threshold
+  once more than 10 iterations have run.
+- ToleranceConvergence: absolute/relative tolerances on the FoT score and
+  an optional tolerance on amplitude infidelity between iterations, which
+  must hold for `patience` consecutive iterations.
+
+Both honour an optional wall-clock budget per sequence and keep a compact,
+decimated trace of score versus iteration.
+"""
+
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+import torch
+
+logger = logging.getLogger(__name__)
+
+
+def amplitude_fidelity(previous: torch.Tensor, current: torch.Tensor) -> float:
+    """Mean per-residue fidelity |⟨ψ_prev|ψ_cur⟩|² between two (N, 8) states"""
+
+    overlap = torch.abs(torch.sum(torch.conj(previous) * current, dim=-1)) ** 2
+    norms = torch.sum(torch.abs(previous) ** 2, dim=-1) * torch.sum(torch.abs(current) ** 2, dim=-1)
+    return (overlap / norms.clamp_min(1e-20)).mean().item()
+
+
+class ConvergenceController(ABC):
+    """
+    Base convergence controller
+
+    Subclasses must implement _check(); the base class handles the time budget,
+    the score trace and the stop reason.
+    """
+
+    def __init__(self, time_budget_s: Optional[float] = None, max_trace_points: int = 200):
+        self.time_budget_s = time_budget_s
+        self.max_trace_points = max_trace_points
+        self.reset()
+
+    def reset(self) -> None:
+        """Prepare for a new optimization run"""
+        self.iterations: List[int] = []
+        self.scores: List[float] = []
+        self.stop_reason: Optional[str] = None
+        self.converged = False
+        self._start = time.perf_counter()
+
+    @property
+    def needs_amplitudes(self) -> bool:
+        """Whether update() needs the amplitude tensor"""
+        return False
+
+    def update(self, iteration: int, fot_value: float, amplitudes: Optional[torch.Tensor] = None) -> bool:
+        """Record one iteration; return True when the optimization should stop"""
+
+        self.iterations.append(iteration)
+        self.scores.append(fot_value)
+
+        if self._check(iteration, fot_value, amplitudes):
+            self.converged = True
+            self.stop_reason = 'converged'
+            return True
+
+        if self.time_budget_s is not None and time.perf_counter() - self._start > self.time_budget_s:
+            self.stop_reason = 'time_budget'
+            return True
+
+        return False
+
+    @abstractmethod
+    def _check(self, iteration: int, fot_value: float, amplitudes: Optional[torch.Tensor]) -> bool:
+        """Whether the run has converged after this iteration"""
+
+    def state_dict(self) -> Dict[str, Any]:
+        """Progress of the current run, for checkpointing"""
+        return {
+            'iterations': list(self.iterations),
+            'scores': list(self.scores),
+            'elapsed_s': time.perf_counter() - self._start,
+        }
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        """Continue a run from state_dict() (the time budget keeps counting)"""
+        self.reset()
+        self.iterations = list(state['iterations'])
+        self.scores = list(state['scores'])
+        self._start -= state.get('elapsed_s', 0.0)
+
+    def trace(self) -> Dict[str, Any]:
+        """Compact score-versus-iteration trace (at most max_trace_points, last point kept)"""
+
+        n_points = len(self.scores)
+        stride = max(1, -(-n_points // self.max_trace_points))
+        keep = list(range(0, n_points, stride))
+        if n_points and keep[-1] != n_points - 1:
+            keep.append(n_points - 1)
+
+        return {
+            'iteration': [self.iterations[i] for i in keep],
+            'fot': [self.scores[i] for i in keep],
+            'stop_reason': self.stop_reason or 'max_iterations',
+            'converged': self.converged,
+            'elapsed_s': time.perf_counter() - self._start,
+        }
+
+
+class LagConvergence(ConvergenceController):
+    """Original rule: FoT change over a fixed 10-iteration lag below threshold"""
+
+    def __init__(self, threshold: float = 1e-6, lag: int = 10, **kwargs):
+        self.threshold = threshold
+        self.lag = lag
+        super().__init__(**kwargs)
+
+    def _check(self, iteration: int, fot_value: float, amplitudes: Optional[torch.Tensor]) -> bool:
+        if iteration <= self.lag:
+            return False
+        return abs(self.scores[-1] - self.scores[-self.lag]) < self.threshold
+
+
+class ToleranceConvergence(ConvergenceController):
+    """
+    Tolerance-based early stopping with a patience window
+
+    An iteration is settled when |ΔFoT| <= score_atol + score_rtol·|FoT| and,
+    if fidelity_tol is set, 1 - F(ψ_prev, ψ_cur) <= fidelity_tol. The run
+    stops after `patience` consecutive settled iterations.
+    """
+
+    def __init__(self, score_atol: float = 1e-6, score_rtol: float = 1e-4,
+                 fidelity_tol: Optional[float] = None, patience: int = 20,
+                 min_iterations: int = 10, **kwargs):
+        self.score_atol = score_atol
+        self.score_rtol = score_rtol
+        self.fidelity_tol = fidelity_tol
+        self.patience = patience
+        self.min_iterations = min_iterations
+        super().__init__(**kwargs)
+
+    def reset(self) -> None:
+        super().reset()
+        self._settled = 0
+        self._previous_amplitudes: Optional[torch.Tensor] = None
+
+    @property
+    def needs_amplitudes(self) -> bool:
+        return self.fidelity_tol is not None
+
+    def state_dict(self) -> Dict[str, Any]:
+        state = super().state_dict()
+        state['settled'] = self._settled
+        state['previous_amplitudes'] = self._previous_amplitudes
+        return state
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        super().load_state_dict(state)
+        self._settled = state.get('settled', 0)
+        self._previous_amplitudes = state.get('previous_amplitudes')
+
+    def _check(self, iteration: int, fot_value: float, amplitudes: Optional[torch.Tensor]) -> bool:
+        settled = len(self.scores) > 1 and \
+            abs(self.scores[-1] - self.scores[-2]) <= self.score_atol + self.score_rtol * abs(fot_value)
+
+        if self.fidelity_tol is not None and amplitudes is not None:
+            if self._previous_amplitudes is None:
+                settled = False
+            else:
+                settled = settled and 1.0 - amplitude_fidelity(self._previous_amplitudes, amplitudes) <= self.fidelity_tol
+            self._previous_amplitudes = amplitudes.detach().clone()
+
+        self._settled = self._settled + 1 if settled else 0
+        return iteration + 1 >= self.min_iterations and self._settled >= self.patience
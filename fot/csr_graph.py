@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+CSR Graph Representation for the vQbit AKG
+
+ProteinVQbitGraph keeps its residue contact graph as a compressed sparse
+row (CSR) adjacency: ``indptr`` (N + 1,), ``indices`` (2E,) and ``weights``
+(2E,), each row's neighbors sorted ascending. Neighbor lookups are array
+slices, and the normalized Laplacian, degrees and clustering coefficient
+are sparse matrix expressions, so nothing on the optimization path walks a
+dictionary-of-dictionaries adjacency. NetworkX graphs are only built on
+request for export and visualization.
+
+The structural quantities reproduce NetworkX's defaults for the graphs the
+engine builds: edges carry their coupling as ``weights`` but, like
+nx.normalized_laplacian_matrix and nx.average_clustering on edges without
+a 'weight' attribute, the Laplacian and clustering are unweighted.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from scipy.sparse import csr_matrix, diags
+
+
+@dataclass
+class CSRGraph:
+    """Undirected graph as symmetric CSR adjacency plus its canonical edge list"""
+    n_nodes: int
+    indptr: np.ndarray  # (N + 1,) row offsets into indices / weights
+    indices: np.ndarray  # (2E,) neighbor ids, sorted within each row
+    weights: np.ndarray  # (2E,) edge weights, aligned with indices
+    edge_index: np.ndarray  # (2, E) edges with u < v, in insertion order
+    edge_weights: np.ndarray  # (E,) weights of edge_index
+
+    @classmethod
+    def from_edges(cls, n_nodes: int, edge_index: np.ndarray,
+                   edge_weights: Optional[np.ndarray] = None) -> 'CSRGraph':
+        """Build from a (2, E) list of distinct undirected edges"""
+        edge_index = np.asarray(edge_index, dtype=np.int64).reshape(2, -1)
+        if edge_weights is None:
+            edge_weights = np.ones(edge_index.shape[1])
+        edge_weights = np.asarray(edge_weights, dtype=np.float64)
+
+        rows = np.concatenate([edge_index[0], edge_index[1]])
+        cols = np.concatenate([edge_index[1], edge_index[0]])
+        both_weights = np.concatenate([edge_weights, edge_weights])
+
+        order = np.lexsort((cols, rows))
+        indptr = np.zeros(n_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n_nodes), out=indptr[1:])
+
+        return cls(n_nodes=n_nodes, indptr=indptr, indices=cols[order], weights=both_weights[order],
+                   edge_index=edge_index, edge_weights=edge_weights)
+
+    @property
+    def n_edges(self) -> int:
+        return self.edge_index.shape[1]
+
+    def neighbors(self, node: int) -> np.ndarray:
+        """Sorted neighbor ids of a node"""
+        return self.indices[self.indptr[node]:self.indptr[node + 1]]
+
+    def degrees(self) -> np.ndarray:
+        """(N,) unweighted node degrees"""
+        return np.diff(self.indptr)
+
+    def adjacency(self, weighted: bool = False) -> csr_matrix:
+        """Symmetric sparse adjacency (unit entries unless weighted)"""
+        data = self.weights if weighted else np.ones_like(self.weights)
+        return csr_matrix((data, self.indices, self.indptr), shape=(self.n_nodes, self.n_nodes))
+
+    def normalized_laplacian(self, weighted: bool = False) -> csr_matrix:
+        """D^-1/2 (D - A) D^-1/2, with isolated nodes left at zero (as NetworkX)"""
+        adjacency = self.adjacency(weighted)
+        degree = np.asarray(adjacency.sum(axis=1)).ravel()
+        with np.errstate(divide='ignore'):
+            inv_sqrt = np.where(degree > 0, 1.0 / np.sqrt(degree), 0.0)
+        scale = diags(inv_sqrt)
+        laplacian = scale @ (diags(degree) - adjacency) @ scale
+        return csr_matrix(laplacian)
+
+    def average_clustering(self) -> float:
+        """Mean local clustering coefficient over all nodes (unweighted)"""
+        if self.n_nodes == 0:
+            return 0.0
+        adjacency = self.adjacency()
+        # Closed 2-walks back into the neighborhood: (A²∘A)·1 = 2·triangles
+        triangles = np.asarray((adjacency @ adjacency).multiply(adjacency).sum(axis=1)).ravel() / 2.0
+        degree = self.degrees().astype(np.float64)
+        possible = degree * (degree - 1) / 2.0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            clustering = np.where(possible > 0, triangles / possible, 0.0)
+        return float(clustering.mean())
+
+    def density(self) -> float:
+        n = self.n_nodes
+        return 2.0 * self.n_edges / (n * (n - 1)) if n > 1 else 0.0
+
+    def nbytes(self) -> int:
+        """Bytes held by the CSR and edge-list arrays"""
+        return sum(a.nbytes for a in (self.indptr, self.indices, self.weights, self.edge_index, self.edge_weights))
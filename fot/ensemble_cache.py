@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Seeded Folding Ensemble Cache
+
+A seeded run_folding_simulation is a pure function of the sequence, the
+temperature, the sampler and the seed, and with streaming statistics its
+whole result is the FoldingStatistics accumulator plus the sampler's RNG
+position. Stages that simulate the same sequence (the reality check, then
+the rigorous analysis of ScientificDiscoveryEngine) therefore need not
+start over: a later stage reuses the cached ensemble and, when it asks for
+more samples, restores the RNG and tops the ensemble up. A run of n1
+samples topped up to n2 is identical to a fresh n2-sample run. Multi-chain
+runs store one ensemble per chain, keyed by the chain's own seed, so stages
+reuse each other's samples as long as they split into the same chains.
+
+Ensembles are snapshots of one sample count: each key holds one ensemble
+per count stored, and a request for n samples starts from the largest
+snapshot of at most n samples, so results always describe exactly the
+samples requested.
+
+EnsembleCache keeps snapshots in an in-process LRU and, if a cache
+directory is given, in ``<key>-<n_samples>.npz`` files so later processes
+can reuse them. Keys are a SHA-256 hash of (sequence, temperature, sampler
+version, seed), where the seed is the entropy and spawn key of the
+folder's RNGContext.
+
+Caching is opt-in: folders only use a cache that is passed in or installed
+with set_default_ensemble_cache (or by setting the FOT_ENSEMBLE_CACHE_DIR
+environment variable before import, which enables an on-disk default).
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+from fot.streaming_stats import STRUCTURE_CLASSES, FoldingStatistics
+
+logger = logging.getLogger(__name__)
+
+# Bump when the .npz layout changes so stale disk entries are ignored
+ENSEMBLE_CACHE_VERSION = 1
+
+
+@dataclass
+class FoldingEnsemble:
+    """Accumulated samples of a seeded simulation and the sampler RNG state after them"""
+    statistics: FoldingStatistics
+    rng_state: Dict[str, Any]  # numpy bit_generator.state
+
+    @property
+    def n_samples(self) -> int:
+        return self.statistics.energy.count
+
+
+def _welford_array(accumulator) -> np.ndarray:
+    return np.array([accumulator.count, accumulator.mean, accumulator.m2, accumulator.min, accumulator.max])
+
+
+def _restore_welford(accumulator, values: np.ndarray) -> None:
+    count, accumulator.mean, accumulator.m2, accumulator.min, accumulator.max = values.tolist()
+    accumulator.count = int(count)
+
+
+def _ensemble_arrays(ensemble: FoldingEnsemble) -> Dict[str, np.ndarray]:
+    """Flat array dict of an ensemble for np.savez"""
+    statistics = ensemble.statistics
+    histogram, reservoir = statistics.energy_histogram, statistics.energy_reservoir
+    arrays = {
+        'version': np.array(ENSEMBLE_CACHE_VERSION),
+        'n_residues': np.array(statistics.n_residues),
+        'energy': _welford_array(statistics.energy),
+        'structure': np.stack([_welford_array(statistics.structure[name]) for name in STRUCTURE_CLASSES]),
+        'histogram_range': np.array([histogram.low, histogram.high]),
+        'histogram_counts': histogram.counts,
+        'histogram_outside': np.array([histogram.underflow, histogram.overflow]),
+        'reservoir_capacity': np.array(reservoir.capacity),
+        'reservoir_seen': np.array(reservoir.seen),
+        'reservoir_values': np.array(reservoir.values, dtype=np.float64),
+        'reservoir_rng_state': np.array(json.dumps(reservoir.rng.bit_generator.state)),
+        'best_energy': np.array(statistics.best_energy),
+        'rng_state': np.array(json.dumps(ensemble.rng_state)),
+    }
+    if statistics.best_payload is not None:
+        arrays['best_angles'], arrays['best_energies'] = statistics.best_payload
+    return arrays
+
+
+def _ensemble_from_arrays(arrays: Dict[str, np.ndarray]) -> FoldingEnsemble:
+    """Inverse of _ensemble_arrays"""
+    if int(arrays['version']) != ENSEMBLE_CACHE_VERSION:
+        raise ValueError(f"Ensemble cache version {int(arrays['version'])} != {ENSEMBLE_CACHE_VERSION}")
+
+    statistics = FoldingStatistics(int(arrays['n_residues']), reservoir_size=int(arrays['reservoir_capacity']),
+                                   histogram_bins=len(arrays['histogram_counts']))
+    _restore_welford(statistics.energy, arrays['energy'])
+    for name, values in zip(STRUCTURE_CLASSES, arrays['structure']):
+        _restore_welford(statistics.structure[name], values)
+
+    histogram = statistics.energy_histogram
+    histogram.low, histogram.high = arrays['histogram_range'].tolist()
+    histogram.counts = arrays['histogram_counts'].astype(np.int64)
+    histogram.underflow, histogram.overflow = (int(v) for v in arrays['histogram_outside'])
+
+    reservoir = statistics.energy_reservoir
+    reservoir.seen = int(arrays['reservoir_seen'])
+    reservoir.values = arrays['reservoir_values'].tolist()
+    reservoir.rng.bit_generator.state = json.loads(str(arrays['reservoir_rng_state']))
+
+    statistics.best_energy = float(arrays['best_energy'])
+    if 'best_angles' in arrays:
+        statistics.best_payload = (arrays['best_angles'], arrays['best_energies'])
+    return FoldingEnsemble(statistics, json.loads(str(arrays['rng_state'])))
+
+
+class EnsembleCache:
+    """
+    LRU cache of seeded folding ensembles, one snapshot per (key, sample count)
+
+    get() returns a copy, so callers may top the ensemble up and put() it
+    back as a new snapshot. Hits and misses are counted for benchmarking.
+
+    Args:
+        max_entries: Snapshots kept in memory (0 disables the memory tier)
+        cache_dir: Directory for .npz snapshot files (None keeps snapshots in memory only)
+    """
+
+    def __init__(self, max_entries: int = 64, cache_dir: Optional[Union[str, Path]] = None):
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._entries: "OrderedDict[Tuple[str, int], FoldingEnsemble]" = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(sequence: str, temperature: float, sampler_version: Any, seed_sequence: np.random.SeedSequence) -> str:
+        """SHA-256 key of (sequence, temperature, sampler version, seed)"""
+        payload = json.dumps(
+            {'sequence': sequence, 'temperature': temperature, 'sampler_version': sampler_version,
+             'seed': [seed_sequence.entropy, list(seed_sequence.spawn_key)],
+             'version': ENSEMBLE_CACHE_VERSION},
+            sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key: str, n_samples: int) -> Path:
+        return self.cache_dir / f"{key}-{n_samples}.npz"
+
+    def _disk_counts(self, key: str) -> Dict[int, Path]:
+        """Sample counts of the on-disk snapshots of a key"""
+        if self.cache_dir is None or not self.cache_dir.is_dir():
+            return {}
+        counts = {}
+        for path in self.cache_dir.glob(f"{key}-*.npz"):
+            count = path.name[len(key) + 1:-len('.npz')]
+            if count.isdigit():
+                counts[int(count)] = path
+        return counts
+
+    def get(self, key: str, max_samples: Optional[int] = None) -> Optional[FoldingEnsemble]:
+        """
+        Copy of the largest snapshot of a key holding at most max_samples samples, or None
+
+        Memory is searched first, then disk; max_samples=None accepts any count.
+        """
+
+        def fits(count: int) -> bool:
+            return max_samples is None or count <= max_samples
+
+        memory_counts = [count for entry_key, count in self._entries if entry_key == key and fits(count)]
+        disk_counts = {count: path for count, path in self._disk_counts(key).items() if fits(count)}
+
+        for count in sorted(set(memory_counts) | set(disk_counts), reverse=True):
+            cached = self._entries.get((key, count))
+            if cached is not None:
+                self._entries.move_to_end((key, count))
+                self.hits += 1
+                return copy.deepcopy(cached)
+
+            path = disk_counts[count]
+            try:
+                with np.load(path) as arrays:
+                    cached = _ensemble_from_arrays(dict(arrays))
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable ensemble cache entry {path.name}: {e}")
+                continue
+            self._remember(key, cached)
+            self.hits += 1
+            self.disk_hits += 1
+            return copy.deepcopy(cached)
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, ensemble: FoldingEnsemble) -> None:
+        """Store a copy of an ensemble as its key's snapshot of that sample count (memory, then disk if configured)"""
+
+        ensemble = copy.deepcopy(ensemble)
+        self._remember(key, ensemble)
+
+        if self.cache_dir is not None:
+            path = self._path(key, ensemble.n_samples)
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix('.tmp.npz')
+                np.savez(tmp_path, **_ensemble_arrays(ensemble))
+                tmp_path.replace(path)
+            except OSError as e:
+                logger.warning(f"Could not write ensemble cache entry {path.name}: {e}")
+
+    def _remember(self, key: str, ensemble: FoldingEnsemble) -> None:
+        entry_key = (key, ensemble.n_samples)
+        self._entries[entry_key] = ensemble
+        self._entries.move_to_end(entry_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop in-memory entries and reset counters (disk files are kept)"""
+        self._entries.clear()
+        self.hits = self.disk_hits = self.misses = 0
+
+    def cache_info(self) -> Dict[str, Any]:
+        """Report occupancy and hit statistics"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'samples': sum(ensemble.n_samples for ensemble in self._entries.values()),
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'cache_dir': str(self.cache_dir) if self.cache_dir is not None else None,
+        }
+
+
+_default_cache: Optional[EnsembleCache] = (
+    EnsembleCache(cache_dir=os.environ['FOT_ENSEMBLE_CACHE_DIR']) if os.environ.get('FOT_ENSEMBLE_CACHE_DIR') else None
+)
+
+
+def default_ensemble_cache() -> Optional[EnsembleCache]:
+    """Process-wide cache used by folders not given one (None, the default, disables caching)"""
+    return _default_cache
+
+
+def set_default_ensemble_cache(cache: Optional[EnsembleCache]) -> None:
+    """Install (or, with None, remove) the process-wide cache, e.g. to share ensembles across engines or on disk"""
+    global _default_cache
+    _default_cache = cache
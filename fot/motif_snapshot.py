@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Local Motif Snapshot for Experience-Based vQbit Seeding
+
+initialize_from_sequence(use_learned_motifs=True) looks up learned
+structural motifs for every 6-residue window of a sequence. Doing that with
+one AKG query per window makes initialization network-bound, so this module
+keeps a local snapshot of the motif library instead:
+
+- MotifSnapshot holds every learned motif in hash maps keyed by exact k-mer
+  and resolves all windows of a sequence in one pass with the same matching
+  rule as AKGLearningSystem.query_learned_motifs (the motif fragment contains
+  the window or the window contains the motif fragment).
+- MotifSnapshotStore owns the refresh policy: the snapshot carries the
+  library's snapshot version, which is re-checked at most every
+  refresh_interval_s seconds; the snapshot is only re-fetched (one bulk
+  query) when that version changes. A JSON snapshot file lets later
+  processes start without touching the database.
+"""
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Window layout used by initialize_from_sequence
+MOTIF_WINDOW = 6
+MIN_MOTIF_WINDOW = 4
+MAX_MOTIFS_PER_WINDOW = 10
+
+
+class MotifSnapshot:
+    """
+    In-memory learned-motif library indexed by exact k-mer
+
+    ``_containing[kmer]`` lists motifs whose fragment contains the k-mer
+    (k-mers of every window length are indexed); ``_by_fragment[fragment]``
+    lists motifs by their exact fragment, used to find motifs contained in a
+    window by looking up each of the window's substrings.
+    """
+
+    def __init__(self, motifs: Iterable[Dict[str, Any]], version: int = 0,
+                 window: int = MOTIF_WINDOW, min_window: int = MIN_MOTIF_WINDOW,
+                 max_results: int = MAX_MOTIFS_PER_WINDOW):
+        self.version = version
+        self.window = window
+        self.min_window = min_window
+        self.max_results = max_results
+        self.motifs: List[Dict[str, Any]] = [dict(motif) for motif in motifs]
+
+        self._containing: Dict[str, List[int]] = {}
+        self._by_fragment: Dict[str, List[int]] = {}
+
+        for index, motif in enumerate(self.motifs):
+            fragment = motif.get('fragment') or ''
+            self._by_fragment.setdefault(fragment, []).append(index)
+
+            kmers = {
+                fragment[start:start + k]
+                for k in range(min_window, window + 1)
+                for start in range(len(fragment) - k + 1)
+            }
+            for kmer in kmers:
+                self._containing.setdefault(kmer, []).append(index)
+
+    def __len__(self) -> int:
+        return len(self.motifs)
+
+    def _rank_key(self, index: int):
+        motif = self.motifs[index]
+        return (-(motif.get('confidence') or 0.0), -(motif.get('validation_score') or 0.0))
+
+    def _match_indices(self, fragment: str) -> List[int]:
+        if self.min_window <= len(fragment) <= self.window:
+            matches = set(self._containing.get(fragment, ()))
+        else:
+            # Outside the indexed window lengths: fall back to a scan
+            matches = {i for i, motif in enumerate(self.motifs) if fragment in (motif.get('fragment') or '')}
+
+        for start in range(len(fragment)):
+            for end in range(start + 1, len(fragment) + 1):
+                matches.update(self._by_fragment.get(fragment[start:end], ()))
+
+        return sorted(matches, key=self._rank_key)[:self.max_results]
+
+    def query(self, sequence_fragment: str) -> List[Dict[str, Any]]:
+        """Motifs matching one fragment, ranked like query_learned_motifs"""
+        return [dict(self.motifs[i]) for i in self._match_indices(sequence_fragment)]
+
+    def resolve_windows(self, sequence: str) -> List[Dict[str, Any]]:
+        """
+        Motifs for every window of a sequence, tagged with 'query_start'
+
+        Windows start every `window` residues and shorter than `min_window`
+        tail windows are skipped. Repeated windows are resolved once.
+        """
+        resolved: Dict[str, List[int]] = {}
+        learned_motifs = []
+
+        for start in range(0, len(sequence), self.window):
+            fragment = sequence[start:start + self.window]
+            if len(fragment) < self.min_window:
+                continue
+            if fragment not in resolved:
+                resolved[fragment] = self._match_indices(fragment)
+            for index in resolved[fragment]:
+                motif = dict(self.motifs[index])
+                motif['query_start'] = start
+                learned_motifs.append(motif)
+
+        return learned_motifs
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the snapshot to a JSON file"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': self.version, 'motifs': self.motifs}, f, default=str)
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path], **kwargs) -> 'MotifSnapshot':
+        """Read a snapshot written by save()"""
+        with open(path) as f:
+            data = json.load(f)
+        return cls(data.get('motifs', []), version=data.get('version', 0), **kwargs)
+
+
+class MotifSnapshotStore:
+    """
+    Version-checked holder of the current MotifSnapshot
+
+    Args:
+        fetch_snapshot: Bulk loader returning a fresh MotifSnapshot
+        fetch_version: Cheap query for the library's current snapshot version
+        snapshot_path: Optional JSON file used to seed and persist the snapshot
+        refresh_interval_s: Minimum time between version checks
+    """
+
+    def __init__(self, fetch_snapshot: Callable[[], MotifSnapshot],
+                 fetch_version: Callable[[], Optional[int]],
+                 snapshot_path: Optional[Union[str, Path]] = None,
+                 refresh_interval_s: float = 300.0):
+        self.fetch_snapshot = fetch_snapshot
+        self.fetch_version = fetch_version
+        self.snapshot_path = Path(snapshot_path) if snapshot_path is not None else None
+        self.refresh_interval_s = refresh_interval_s
+
+        self._snapshot: Optional[MotifSnapshot] = None
+        self._checked_at: Optional[float] = None
+        self.refreshes = 0
+
+        if self.snapshot_path is not None and self.snapshot_path.exists():
+            try:
+                self._snapshot = MotifSnapshot.load(self.snapshot_path)
+                logger.info(f"Loaded motif snapshot v{self._snapshot.version} "
+                            f"({len(self._snapshot)} motifs) from {self.snapshot_path}")
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable motif snapshot {self.snapshot_path}: {e}")
+
+    def snapshot(self, force_check: bool = False) -> MotifSnapshot:
+        """Current snapshot, re-fetched only when the library version has changed"""
+
+        now = time.monotonic()
+        due = self._checked_at is None or now - self._checked_at >= self.refresh_interval_s
+        if self._snapshot is not None and not (due or force_check):
+            return self._snapshot
+
+        try:
+            version = self.fetch_version()
+            self._checked_at = now
+            if self._snapshot is None or version != self._snapshot.version:
+                self._snapshot = self.fetch_snapshot()
+                self.refreshes += 1
+                logger.info(f"Refreshed motif snapshot to v{self._snapshot.version} "
+                            f"({len(self._snapshot)} motifs)")
+                if self.snapshot_path is not None:
+                    self._snapshot.save(self.snapshot_path)
+        except Exception as e:
+            if self._snapshot is None:
+                raise
+            logger.warning(f"Motif snapshot refresh failed, keeping v{self._snapshot.version}: {e}")
+
+        return self._snapshot
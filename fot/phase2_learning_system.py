@@ -7,12 +7,57 @@ allowing it to extract patterns and improve from discoveries.
 """
 
 import logging
-from typing import Dict, List, Any
+import weakref
+from typing import Dict, List, Any, Optional
 from datetime import datetime
 from neo4j import GraphDatabase
 
+from fot.motif_snapshot import MotifSnapshot, MotifSnapshotStore
+
 logger = logging.getLogger(__name__)
 
+# One motif snapshot store per Neo4j engine, shared by every AKGLearningSystem
+_motif_stores: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+def _query_motif_snapshot_version(driver) -> int:
+    """Snapshot version of the global motif library (0 before anything is learned)"""
+    
+    with driver.session() as session:
+        record = session.run("""
+            OPTIONAL MATCH (ml:MotifLibrary {id: "global_motif_library"})
+            RETURN coalesce(ml.snapshot_version, 0) as version
+        """).single()
+        return record['version'] if record else 0
+
+def _query_motif_snapshot(driver) -> MotifSnapshot:
+    """Every learned StructuralMotif in one bulk query, tagged with the library version"""
+    
+    version = _query_motif_snapshot_version(driver)
+    
+    with driver.session() as session:
+        result = session.run("""
+            MATCH (m:StructuralMotif)
+            RETURN m.id as motif_id,
+                   m.motif_type as type,
+                   m.sequence_fragment as fragment,
+                   m.confidence as confidence,
+                   m.validation_score as validation_score,
+                   m.start_position as start_pos,
+                   m.end_position as end_pos
+        """)
+        
+        motifs = [{
+            'motif_id': record['motif_id'],
+            'type': record['type'],
+            'fragment': record['fragment'],
+            'confidence': record['confidence'],
+            'validation_score': record['validation_score'],
+            'start_position': record['start_pos'],
+            'end_position': record['end_pos']
+        } for record in result]
+    
+    return MotifSnapshot(motifs, version=version)
+
 class AKGLearningSystem:
     """
     Phase 2: Agentic Knowledge Graph Learning System
@@ -21,11 +66,28 @@ class AKGLearningSystem:
     and entanglement patterns to improve future predictions.
     """
     
-    def __init__(self, neo4j_engine):
-        """Initialize the learning system with a Neo4j engine"""
+    def __init__(self, neo4j_engine, motif_snapshot_path: Optional[str] = None,
+                 motif_refresh_interval_s: float = 300.0):
+        """
+        Initialize the learning system with a Neo4j engine
+        
+        Args:
+            neo4j_engine: Engine exposing a Neo4j `driver`
+            motif_snapshot_path: Optional JSON file persisting the motif snapshot
+            motif_refresh_interval_s: Minimum time between motif library version checks
+        """
         self.neo4j_engine = neo4j_engine
         self.driver = neo4j_engine.driver
         
+        self.motif_store = _motif_stores.get(neo4j_engine)
+        if self.motif_store is None:
+            driver = self.driver
+            self.motif_store = MotifSnapshotStore(
+                lambda: _query_motif_snapshot(driver), lambda: _query_motif_snapshot_version(driver),
+                snapshot_path=motif_snapshot_path, refresh_interval_s=motif_refresh_interval_s
+            )
+            _motif_stores[neo4j_engine] = self.motif_store
+        
     def learn_from_discovery(self, discovery_id: str) -> Dict[str, Any]:
         """
         Phase 2.1: Learn from a validated discovery and update the AKG
@@ -245,7 +307,8 @@ class AKGLearningSystem:
             WITH ls
             MATCH (ml:MotifLibrary {id: "global_motif_library"})
             SET ml.total_motifs = ml.total_motifs + $motifs,
-                ml.usage_count = ml.usage_count + 1
+                ml.usage_count = ml.usage_count + 1,
+                ml.snapshot_version = coalesce(ml.snapshot_version, 0) + 1
         """, motifs=motifs_extracted, patterns=patterns_identified)
     
     def query_learned_motifs(self, sequence_fragment: str) -> List[Dict[str, Any]]:
@@ -292,6 +355,23 @@ class AKGLearningSystem:
             logger.error(f"Error querying learned motifs: {e}")
             return []
     
+    def motif_snapshot_version(self) -> int:
+        """Current motif library snapshot version (bumped whenever motifs are learned)"""
+        return _query_motif_snapshot_version(self.driver)
+    
+    def fetch_motif_snapshot(self) -> MotifSnapshot:
+        """Load every learned motif in one bulk query"""
+        return _query_motif_snapshot(self.driver)
+    
+    def motif_snapshot(self, force_check: bool = False) -> MotifSnapshot:
+        """
+        Phase 2.2: Local snapshot of the learned motif library
+        
+        Resolves sequence windows without a database round trip per window;
+        refreshed when the library's snapshot version changes.
+        """
+        return self.motif_store.snapshot(force_check=force_check)
+    
     def get_entanglement_patterns(self, discovery_id: str = None) -> List[Dict[str, Any]]:
         """Get entanglement patterns, optionally filtered by discovery"""
         
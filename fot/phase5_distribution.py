@@ -803,18 +803,18 @@ vqbit_system = ProteinVQbitGraph(sequence, device=device)
 ### Parallel Processing
 
 ```python
-from concurrent.futures import ProcessPoolExecutor
-import multiprocessing
+from fot.thread_budget import available_cpus, budgeted_process_pool
 
 def analyze_sequence(seq):
     system = ProteinVQbitGraph(seq, device="cpu")
     return system.analyze_protein_sequence(seq, num_iterations=20)
 
-# Analyze multiple sequences in parallel
+# Analyze multiple sequences in parallel; each worker gets an equal share
+# of the cores for its torch threads instead of oversubscribing them
 sequences = ["MKIF", "QYET", "AKPL", "DNRF"]
-num_processes = multiprocessing.cpu_count()
+num_processes = available_cpus()
 
-with ProcessPoolExecutor(max_workers=num_processes) as executor:
+with budgeted_process_pool(num_processes) as executor:
     results = list(executor.map(analyze_sequence, sequences))
 ```
 
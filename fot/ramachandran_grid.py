@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Precomputed Ramachandran Energy Grids
+
+RigorousProteinFolder scores every (phi, psi) trial against eight
+Ramachandran regions. The region term depends only on the residue's
+propensity class and kT, so it is tabulated once per class on a regular
+(phi, psi) grid (1° by default) and trials are scored by vectorized
+bilinear interpolation.
+
+Region boxes are closed and start and end on whole degrees, so the energy
+jumps along grid lines. To keep the interpolation exact up to curvature,
+each cell stores its own four corner energies, evaluated with the set of
+regions that cover the cell interior. Energies on either side of a region
+edge then never mix. Within a cell the energy is a minimum of separable
+quadratics, and the bilinear error comes only from their curvature and
+crossovers: at 1° it averages about 2e-5 kcal/mol and stays below 5e-3.
+Corners are stored as float32 (about 2 MB per residue class at 1°).
+
+Grids are kept in a process-wide in-memory cache, keyed by a hash of the
+region table, the class propensities, kT and the resolution. Writing them
+as ``<key>.npy`` files is opt-in: pass a cache_dir to RamachandranGridCache
+(and install it with set_default_grid_cache), or set the
+FOT_RAMACHANDRAN_GRID_DIR environment variable before import.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Bump when the grid layout or energy expression changes so stale files are ignored
+RAMACHANDRAN_GRID_VERSION = 1
+
+DEFAULT_RESOLUTION_DEG = 1.0
+
+# Energy of conformations outside every allowed region (kcal/mol)
+DISALLOWED_ENERGY = 10.0
+
+
+def _angle_distance(angles: np.ndarray, center: float) -> np.ndarray:
+    """|angle - center| on the circle, in degrees"""
+    distance = np.abs(angles - center)
+    return np.where(distance > 180, 360 - distance, distance)
+
+
+def _propensity_factor(region_name: str, aa_props: Dict[str, float]) -> float:
+    """Propensity of a residue class for a region, as in calculate_ramachandran_energy"""
+    if 'helix' in region_name:
+        return aa_props['helix_prop']
+    if 'beta' in region_name or 'sheet' in region_name:
+        return aa_props['sheet_prop']
+    if 'coil' in region_name or 'extended' in region_name or 'polyproline' in region_name:
+        return aa_props['disorder_prop']
+    return 1.0
+
+
+class RamachandranEnergyGrid:
+    """
+    Region energy of one residue class on a periodic (phi, psi) grid
+
+    corners has shape (4, n, n): the energies at the (phi₀, psi₀), (phi₁, psi₀),
+    (phi₀, psi₁) and (phi₁, psi₁) corners of every resolution-sized cell,
+    evaluated with the regions covering that cell.
+    """
+
+    def __init__(self, corners: np.ndarray, resolution: float = DEFAULT_RESOLUTION_DEG):
+        self.corners = corners
+        self.resolution = resolution
+        self.n_cells = corners.shape[1]
+
+    @classmethod
+    def build(cls, regions: Dict[str, Dict], aa_props: Dict[str, float], kT: float,
+              resolution: float = DEFAULT_RESOLUTION_DEG) -> 'RamachandranEnergyGrid':
+        """Tabulate the region energy of a residue class"""
+        n_cells = int(round(360.0 / resolution))
+        if not np.isclose(n_cells * resolution, 360.0):
+            raise ValueError(f"Resolution must divide 360°, got {resolution}")
+
+        nodes = -180.0 + resolution * np.arange(n_cells + 1)
+        centers = nodes[:-1] + resolution / 2
+
+        # min over regions of base_r + qφ_r(phi) + qψ_r(psi), restricted to regions covering the cell
+        corners = np.full((4, n_cells, n_cells), np.inf)
+        for name, region in regions.items():
+            base = region['energy_offset'] - kT * np.log(_propensity_factor(name, aa_props))
+            phi_penalty = 0.5 * (_angle_distance(nodes, region['phi_center']) / region['phi_width']) ** 2
+            psi_penalty = 0.5 * (_angle_distance(nodes, region['psi_center']) / region['psi_width']) ** 2
+            covers = (_angle_distance(centers, region['phi_center']) <= region['phi_width'])[:, None] & \
+                (_angle_distance(centers, region['psi_center']) <= region['psi_width'])[None, :]
+
+            for corner, (di, dj) in enumerate(((0, 0), (1, 0), (0, 1), (1, 1))):
+                energy = base + phi_penalty[di:di + n_cells, None] + psi_penalty[None, dj:dj + n_cells]
+                corners[corner] = np.where(covers, np.minimum(corners[corner], energy), corners[corner])
+
+        corners[np.isinf(corners)] = DISALLOWED_ENERGY
+        return cls(corners.astype(np.float32), resolution)
+
+    def energies(self, phi: np.ndarray, psi: np.ndarray) -> np.ndarray:
+        """Bilinearly interpolated region energy for arrays of angles in [-180, 180]"""
+        u = (np.asarray(phi, dtype=np.float64) + 180.0) / self.resolution
+        v = (np.asarray(psi, dtype=np.float64) + 180.0) / self.resolution
+        i = np.clip(np.floor(u).astype(np.int64), 0, self.n_cells - 1)
+        j = np.clip(np.floor(v).astype(np.int64), 0, self.n_cells - 1)
+        t, s = u - i, v - j
+
+        c00, c10, c01, c11 = (self.corners[k][i, j] for k in range(4))
+        return (1 - t) * (1 - s) * c00 + t * (1 - s) * c10 + (1 - t) * s * c01 + t * s * c11
+
+    def energy(self, phi: float, psi: float) -> float:
+        """energies() for a single (phi, psi) pair, in plain Python arithmetic"""
+        u = (phi + 180.0) / self.resolution
+        v = (psi + 180.0) / self.resolution
+        i = min(max(math.floor(u), 0), self.n_cells - 1)
+        j = min(max(math.floor(v), 0), self.n_cells - 1)
+        t, s = u - i, v - j
+
+        c00, c10, c01, c11 = self.corners[:, i, j].tolist()
+        return (1 - t) * (1 - s) * c00 + t * (1 - s) * c10 + (1 - t) * s * c01 + t * s * c11
+
+    @property
+    def nbytes(self) -> int:
+        return self.corners.nbytes
+
+
+class RamachandranGridCache:
+    """
+    Process-wide store of energy grids, in memory and as .npy files
+
+    Args:
+        cache_dir: Directory for .npy grid files (None keeps grids in memory only)
+    """
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._grids: Dict[str, RamachandranEnergyGrid] = {}
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(regions: Dict[str, Dict], aa_props: Dict[str, float], kT: float, resolution: float) -> str:
+        """SHA-256 key of everything a grid depends on"""
+        payload = json.dumps(
+            {'regions': regions, 'aa_props': aa_props, 'kT': kT, 'resolution': resolution,
+             'version': RAMACHANDRAN_GRID_VERSION},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def grid(self, regions: Dict[str, Dict], aa_props: Dict[str, float], kT: float,
+             resolution: float = DEFAULT_RESOLUTION_DEG) -> RamachandranEnergyGrid:
+        """Grid for a residue class, loaded or built on first use"""
+        key = self.key(regions, aa_props, kT, resolution)
+        grid = self._grids.get(key)
+        if grid is not None:
+            self.hits += 1
+            return grid
+
+        path = self.cache_dir / f"{key}.npy" if self.cache_dir is not None else None
+        if path is not None and path.exists():
+            try:
+                grid = RamachandranEnergyGrid(np.load(path), resolution)
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable Ramachandran grid {path.name}: {e}")
+            else:
+                self.hits += 1
+                self.disk_hits += 1
+                self._grids[key] = grid
+                return grid
+
+        self.misses += 1
+        grid = RamachandranEnergyGrid.build(regions, aa_props, kT, resolution)
+        self._grids[key] = grid
+        if path is not None:
+            self._save(path, grid)
+        return grid
+
+    def _save(self, path: Path, grid: RamachandranEnergyGrid) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp.npy')
+            np.save(tmp_path, grid.corners)
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Could not write Ramachandran grid {path.name}: {e}")
+
+    def clear(self) -> None:
+        """Drop in-memory grids and reset counters (disk files are kept)"""
+        self._grids.clear()
+        self.hits = self.disk_hits = self.misses = 0
+
+    def cache_info(self) -> Dict[str, Any]:
+        """Report occupancy and hit statistics"""
+        return {
+            'grids': len(self._grids),
+            'nbytes': sum(grid.nbytes for grid in self._grids.values()),
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'cache_dir': str(self.cache_dir) if self.cache_dir is not None else None,
+        }
+
+
+# In memory only unless FOT_RAMACHANDRAN_GRID_DIR names a directory for .npy files
+_default_cache = RamachandranGridCache(os.environ.get('FOT_RAMACHANDRAN_GRID_DIR') or None)
+
+
+def default_grid_cache() -> RamachandranGridCache:
+    """Process-wide grid cache used by RigorousProteinFolder unless one is passed in"""
+    return _default_cache
+
+
+def set_default_grid_cache(cache: RamachandranGridCache) -> None:
+    """Replace the process-wide cache (e.g. to enable an on-disk directory)"""
+    global _default_cache
+    _default_cache = cache
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Explicit RNG Contexts for the Folding Stack
+
+Samplers that draw from the global np.random / torch state cannot be
+compared bit for bit, cached, or fanned out to workers safely. An
+RNGContext bundles a numpy Generator and a torch Generator that are both
+derived from one numpy SeedSequence, and is passed explicitly to every
+sampler (ProteinVQbitGraph, RigorousProteinFolder, PublicationGradeAnalyzer).
+
+Contexts are keyed rather than counted: RNGContext.derive(base_seed,
+sequence, replica) builds the SeedSequence child whose spawn key is
+(hash(sequence), replica), i.e. the child SeedSequence.spawn would produce
+at that position of the tree. The same inputs therefore give the same
+streams regardless of the order in which contexts are created, and
+RNGContext.spawn(n) fans a context out to n independent worker streams.
+Named stages of a context (stage(name)) extend its key with a tagged hash
+of the name, so they stay disjoint from the spawned children; derive(...,
+stage=name) is shorthand for derive(...).stage(name).
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Union
+
+import numpy as np
+import torch
+
+from fot.vqbit_init_cache import sequence_seed
+
+
+def _spawn_key_entry(key: Union[int, str]) -> int:
+    """Non-negative integer spawn-key entry for an int or string key"""
+    if isinstance(key, (int, np.integer)) and key >= 0:
+        return int(key)
+    return sequence_seed(str(key))
+
+
+def _stage_key_entry(name: Union[int, str]) -> int:
+    """Spawn-key entry of a named stage (a tagged hash, so stage(i) never coincides with spawn(n)[i])"""
+    return sequence_seed('stage', name)
+
+
+@dataclass
+class RNGContext:
+    """Paired numpy / torch generators derived from one SeedSequence"""
+    seed_sequence: np.random.SeedSequence
+    numpy: np.random.Generator
+    torch: torch.Generator
+
+    @classmethod
+    def from_seed_sequence(cls, seed_sequence: np.random.SeedSequence) -> 'RNGContext':
+        """Build both generators from a SeedSequence"""
+        numpy_state, torch_state = seed_sequence.generate_state(2, dtype=np.uint64)
+        generator = torch.Generator()
+        generator.manual_seed(int(torch_state >> np.uint64(1)))
+        return cls(
+            seed_sequence=seed_sequence,
+            numpy=np.random.default_rng(np.random.PCG64(int(numpy_state))),
+            torch=generator,
+        )
+
+    @classmethod
+    def derive(cls, base_seed: int, sequence: str = "", replica: Union[int, str] = 0,
+               stage: Optional[Union[int, str]] = None) -> 'RNGContext':
+        """Context for (base seed, sequence hash, replica), or its named stage"""
+        spawn_key = (sequence_seed(sequence), _spawn_key_entry(replica))
+        if stage is not None:
+            spawn_key += (_stage_key_entry(stage),)
+        return cls.from_seed_sequence(np.random.SeedSequence(base_seed, spawn_key=spawn_key))
+
+    def stage(self, name: Union[int, str]) -> 'RNGContext':
+        """Child context for a named stage of this context"""
+        seed_sequence = np.random.SeedSequence(
+            self.seed_sequence.entropy,
+            spawn_key=tuple(self.seed_sequence.spawn_key) + (_stage_key_entry(name),)
+        )
+        return RNGContext.from_seed_sequence(seed_sequence)
+
+    def spawn(self, n_children: int) -> List['RNGContext']:
+        """Independent child contexts, e.g. one per worker"""
+        return [RNGContext.from_seed_sequence(child) for child in self.seed_sequence.spawn(n_children)]
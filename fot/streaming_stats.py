@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Constant-Memory Streaming Statistics for Folding Simulations
+
+run_folding_simulation feeds every sample through these accumulators
+instead of keeping the samples:
+
+- WelfordAccumulator: count, mean, variance, min and max (Welford's update)
+- FixedHistogram: counts over fixed bins plus under/overflow
+- ReservoirSample: uniform random sample of at most `capacity` values
+  (Algorithm R); while fewer values have been seen it holds all of them
+  in arrival order
+- FoldingStatistics: the energy and secondary-structure summary of one
+  simulation, built from the three above
+
+Memory is independent of the number of samples, and the accumulators
+merge, so summaries of independent runs can be combined exactly (moments,
+histograms) or in distribution (reservoirs).
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Secondary-structure classes of RigorousProteinFolder.analyze_secondary_structure
+STRUCTURE_CLASSES = ('helix', 'sheet', 'extended', 'other')
+
+# Per-residue energy range of the default energy histogram (kcal/mol)
+ENERGY_PER_RESIDUE_RANGE = (-15.0, 3.0)
+
+
+class WelfordAccumulator:
+    """Running count, mean, population variance, min and max"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+
+    def update(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: 'WelfordAccumulator') -> None:
+        """Combine with another accumulator (Chan et al. pairwise update)"""
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.mean += delta * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        """Population variance (as np.var)"""
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.variance))
+
+
+class FixedHistogram:
+    """Counts over n_bins equal bins of [low, high), with under/overflow"""
+
+    def __init__(self, low: float, high: float, n_bins: int):
+        if not high > low or n_bins < 1:
+            raise ValueError(f"Need high > low and n_bins >= 1, got [{low}, {high}) with {n_bins} bins")
+        self.low, self.high, self.n_bins = low, high, n_bins
+        self.counts = np.zeros(n_bins, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+
+    def update(self, value: float) -> None:
+        if value < self.low:
+            self.underflow += 1
+        elif value >= self.high:
+            self.overflow += 1
+        else:
+            self.counts[int((value - self.low) / (self.high - self.low) * self.n_bins)] += 1
+
+    def merge(self, other: 'FixedHistogram') -> None:
+        if (other.low, other.high, other.n_bins) != (self.low, self.high, self.n_bins):
+            raise ValueError("Cannot merge histograms with different bins")
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+
+    @property
+    def edges(self) -> np.ndarray:
+        return np.linspace(self.low, self.high, self.n_bins + 1)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {'edges': self.edges.tolist(), 'counts': self.counts.tolist(),
+                'underflow': self.underflow, 'overflow': self.overflow}
+
+
+class ReservoirSample:
+    """
+    Uniform sample of at most `capacity` values from a stream (Algorithm R)
+
+    Args:
+        capacity: Maximum number of values kept
+        rng: numpy Generator (or the np.random module) for replacement decisions
+    """
+
+    def __init__(self, capacity: int, rng=None):
+        self.capacity = capacity
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.values: List[float] = []
+        self.seen = 0
+
+    def update(self, value: float) -> None:
+        self.seen += 1
+        if len(self.values) < self.capacity:
+            self.values.append(value)
+        else:
+            slot = int(self.rng.random() * self.seen)
+            if slot < self.capacity:
+                self.values[slot] = value
+
+    def merge(self, other: 'ReservoirSample') -> None:
+        """
+        Combine with a reservoir of a disjoint stream
+
+        The result is a uniform sample of the combined stream: the number of
+        values taken from each side is hypergeometric in the sizes of the
+        two streams. While both streams still fit, all values are kept in
+        order.
+        """
+        seen = self.seen + other.seen
+        if seen <= self.capacity:
+            self.values = self.values + other.values
+        else:
+            n_self = int(self.rng.hypergeometric(self.seen, other.seen, self.capacity))
+            pick_self = self.rng.permutation(len(self.values))[:n_self]
+            pick_other = self.rng.permutation(len(other.values))[:self.capacity - n_self]
+            self.values = [self.values[i] for i in pick_self] + [other.values[i] for i in pick_other]
+        self.seen = seen
+
+
+class FoldingStatistics:
+    """
+    Streaming summary of a folding simulation's samples
+
+    Tracks total-energy moments, a histogram of energy per residue, a
+    reservoir of total energies, mean secondary-structure fractions and the
+    lowest-energy sample (with an optional payload such as its angles).
+
+    Args:
+        n_residues: Residues per sample (scales the histogram range)
+        reservoir_size: Capacity of the energy reservoir
+        histogram_bins: Bins of the energy-per-residue histogram
+        rng: Generator for the reservoir
+    """
+
+    def __init__(self, n_residues: int, reservoir_size: int = 1000, histogram_bins: int = 180, rng=None):
+        self.n_residues = n_residues
+        self.energy = WelfordAccumulator()
+        self.energy_histogram = FixedHistogram(*ENERGY_PER_RESIDUE_RANGE, histogram_bins)
+        self.energy_reservoir = ReservoirSample(reservoir_size, rng)
+        self.structure = {name: WelfordAccumulator() for name in STRUCTURE_CLASSES}
+        self.best_energy = float('inf')
+        self.best_payload: Any = None
+
+    def update(self, energy: float, structure_fractions: Optional[Dict[str, float]] = None,
+               payload: Any = None) -> bool:
+        """Add one sample; returns True when it is the new lowest-energy sample"""
+        self.energy.update(energy)
+        self.energy_histogram.update(energy / max(self.n_residues, 1))
+        self.energy_reservoir.update(energy)
+        if structure_fractions is not None:
+            for name in STRUCTURE_CLASSES:
+                self.structure[name].update(structure_fractions[name])
+
+        if energy < self.best_energy:
+            self.best_energy, self.best_payload = energy, payload
+            return True
+        return False
+
+    def merge(self, other: 'FoldingStatistics') -> None:
+        """Fold in the statistics of an independent run of the same sequence"""
+        self.energy.merge(other.energy)
+        self.energy_histogram.merge(other.energy_histogram)
+        self.energy_reservoir.merge(other.energy_reservoir)
+        for name in STRUCTURE_CLASSES:
+            self.structure[name].merge(other.structure[name])
+        if other.best_energy < self.best_energy:
+            self.best_energy, self.best_payload = other.best_energy, other.best_payload
+
+    def summary(self) -> Dict[str, Any]:
+        """Summary entries of run_folding_simulation's results"""
+        summary = {
+            'n_samples': self.energy.count,
+            'mean_energy': self.energy.mean,
+            'std_energy': self.energy.std,
+            'min_energy': self.energy.min,
+            'max_energy': self.energy.max,
+            'energy_samples': list(self.energy_reservoir.values),
+            'energy_histogram': self.energy_histogram.as_dict(),
+        }
+        if self.structure['helix'].count:
+            summary['mean_structure_fractions'] = {name: acc.mean for name, acc in self.structure.items()}
+        return summary
+
+
+def structure_fractions(phi: Sequence[float], psi: Sequence[float]) -> Dict[str, float]:
+    """analyze_secondary_structure for (N,) angle arrays"""
+    phi, psi = np.asarray(phi), np.asarray(psi)
+    helix = (-90 <= phi) & (phi <= -30) & (-75 <= psi) & (psi <= -15)
+    sheet = ~helix & (-180 <= phi) & (phi <= -90) & (90 <= psi) & (psi <= 180)
+    extended = ~helix & ~sheet & (-180 <= phi) & (phi <= -120) & (120 <= psi) & (psi <= 180)
+    other = ~helix & ~sheet & ~extended
+    total = len(phi)
+    return {name: float(mask.sum() / total)
+            for name, mask in zip(STRUCTURE_CLASSES, (helix, sheet, extended, other))}
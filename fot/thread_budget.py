@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+CPU Thread Budgets for Multiprocess FoT Workloads
+
+Every torch process defaults to one intra-op thread per core, so a pool of
+W worker processes on a C-core machine runs W × C compute threads and the
+workers spend their time preempting each other. A thread budget splits the
+cores between the workers instead: each worker gets max(1, C // W) torch
+threads (and the same limit for the OpenMP / BLAS pools used by numpy and
+scipy), applied once in the pool initializer.
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Optional
+
+import torch
+
+logger = logging.getLogger(__name__)
+
+# Environment variables read by OpenMP / BLAS runtimes started after the
+# budget is applied (e.g. in grandchild processes)
+THREAD_ENV_VARS = ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS')
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on (affinity-aware where supported)"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def thread_budget(n_workers: int, total_threads: Optional[int] = None) -> int:
+    """Intra-op threads per worker when n_workers share total_threads cores"""
+    if n_workers < 1:
+        raise ValueError(f"n_workers must be at least 1, got {n_workers}")
+    total_threads = total_threads or available_cpus()
+    return max(1, total_threads // n_workers)
+
+
+def apply_thread_budget(n_threads: int) -> None:
+    """Limit torch, OpenMP and BLAS thread pools of the current process"""
+
+    torch.set_num_threads(n_threads)
+    for name in THREAD_ENV_VARS:
+        os.environ[name] = str(n_threads)
+
+    # BLAS pools already loaded by numpy/scipy ignore the environment
+    try:
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(n_threads)
+    except ImportError:
+        pass
+
+    logger.debug(f"Thread budget applied: {n_threads} thread(s) in pid {os.getpid()}")
+
+
+def budgeted_process_pool(max_workers: int, total_threads: Optional[int] = None,
+                          **kwargs: Any) -> ProcessPoolExecutor:
+    """ProcessPoolExecutor whose workers split the available cores between them"""
+
+    n_threads = thread_budget(max_workers, total_threads)
+    logger.info(f"Process pool: {max_workers} worker(s) × {n_threads} thread(s)")
+    return ProcessPoolExecutor(max_workers=max_workers, initializer=apply_thread_budget,
+                               initargs=(n_threads,), **kwargs)
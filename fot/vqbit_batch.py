@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Batched vQbit Engine for Multi-Sequence FoT Optimization
+
+Runs ProteinVQbitGraph.run_fot_optimization for B sequences at once. The
+sequences are padded to a common length N and their amplitudes stacked into
+a (B, N, 8) tensor with a (B, N) residue mask, so each iteration performs
+virtue projection, graph evolution, amplitude amplification and FoT scoring
+for the whole batch with a handful of batched tensor operations.
+
+Graph evolution is batched only for sequences on the dense Laplacian
+backend, grouped by length: each group stacks the Laplacian eigenvectors of
+its graphs' spectral propagators once and evolves its states in that
+eigenbasis, Ψ ← U·(exp(iJ·λ·dt) ⊙ Uᵀ·Ψ). Memory is the sum of the graphs'
+own N² eigenbases, independent of the time step and never padded to the
+longest sequence. Sequences above the sparse threshold keep their own
+KrylovPropagator and are evolved one by one, so a long sequence in the
+batch never brings back a dense N×N operator.
+
+Every sequence has its own convergence controller; sequences that stop are
+dropped from the active set and stop costing compute. Results are built by
+the single-sequence engine's result helper, so each sequence reports the
+same keys as ProteinVQbitGraph.run_fot_optimization.
+"""
+
+import copy
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import torch
+
+from fot.vqbit_mathematics import (
+    ProteinVQbitGraph, IterationTelemetry, VIRTUE_NAMES, amplification_rounds, grover_step
+)
+from fot.convergence import ConvergenceController, LagConvergence
+from fot.rng_context import RNGContext
+from fot.vqbit_precision import PrecisionPolicy, resolve_precision
+
+logger = logging.getLogger(__name__)
+
+
+class VQbitBatch:
+    """
+    Padded (B, N, 8) vQbit state for a batch of protein sequences
+
+    Each sequence keeps its own ProteinVQbitGraph for graph construction,
+    virtue operators and final measurement; the optimization loop itself runs
+    on stacked tensors in the dtypes of the precision policy (the batched
+    projection always uses the complex path).
+    """
+
+    def __init__(self, sequences: List[str], device: str = "cpu",
+                 precision: Union[str, PrecisionPolicy, None] = None,
+                 rng: Optional[RNGContext] = None, sparse_threshold: Optional[int] = None):
+        """Build per-sequence graphs and stack their operators (graph b draws from rng.stage(b))"""
+        if not sequences:
+            raise ValueError("VQbitBatch requires at least one sequence")
+
+        self.sequences = list(sequences)
+        self.device = device
+        self.precision = resolve_precision(precision)
+        self.batch_size = len(self.sequences)
+        self.graphs = [
+            ProteinVQbitGraph(sequence, device, sparse_threshold=sparse_threshold, precision=self.precision,
+                              rng=rng.stage(b) if rng is not None else None)
+            for b, sequence in enumerate(self.sequences)
+        ]
+
+        self.lengths = torch.tensor([graph.n_residues for graph in self.graphs], device=device)
+        self.max_length = int(self.lengths.max().item())
+
+        # (B, N) residue mask for padded positions
+        positions = torch.arange(self.max_length, device=device)
+        self.mask = positions.unsqueeze(0) < self.lengths.unsqueeze(1)
+
+        # (B, K, 8, 8) projectors and aggregate constraints per sequence
+        self.projectors = torch.stack([
+            torch.stack([graph.virtue_operators[name].projector for name in VIRTUE_NAMES])
+            for graph in self.graphs
+        ])
+        self.aggregates = torch.stack([
+            torch.stack([graph.virtue_operators[name].aggregate_matrix for name in VIRTUE_NAMES])
+            for graph in self.graphs
+        ])
+
+        # (B,) AKG graph factor for FoT scoring
+        self.graph_factors = torch.tensor(
+            [graph._calculate_graph_factor() for graph in self.graphs],
+            dtype=self.precision.real_dtype, device=device
+        )
+
+        # Dense-backend sequences evolve per length group in stacked eigenbases (built
+        # lazily); sparse-backend sequences evolve per graph
+        self.dense = torch.tensor([graph.laplacian_backend == 'dense' for graph in self.graphs], device=device)
+        self._eigenbases: Optional[Dict[int, Tuple[torch.Tensor, torch.Tensor, torch.Tensor]]] = None
+
+        self.amplitudes = None
+        self.virtue_scores = None
+
+        logger.info(f"Initialized vQbit batch: {self.batch_size} sequences padded to {self.max_length} residues")
+
+    def initialize_states(self, use_biophysical_priors: bool = False) -> None:
+        """Initialize each sequence's state and stack into padded (B, N, 8) tensors"""
+
+        self.amplitudes = torch.zeros(
+            (self.batch_size, self.max_length, 8), dtype=self.precision.complex_dtype, device=self.device
+        )
+        self.virtue_scores = torch.zeros(
+            (self.batch_size, self.max_length, len(VIRTUE_NAMES)), dtype=self.precision.real_dtype,
+            device=self.device
+        )
+
+        for b, graph in enumerate(self.graphs):
+            if use_biophysical_priors:
+                graph.initialize_from_sequence(use_biophysical_priors=True)
+            else:
+                graph.initialize_vqbit_states()
+            self.amplitudes[b, :graph.n_residues] = graph.amplitudes
+            self.virtue_scores[b, :graph.n_residues] = graph.virtue_scores
+
+    def eigenbases(self) -> Dict[int, Tuple[torch.Tensor, torch.Tensor, torch.Tensor]]:
+        """
+        Stacked spectral data of the dense-backend sequences, keyed by length
+
+        Each length n maps to the (B_n,) batch indices of its sequences, their
+        (B_n, n, n) Laplacian eigenvectors in the complex dtype of the
+        precision policy and their (B_n, n) float64 angular frequencies J·λ.
+        """
+
+        if self._eigenbases is None:
+            groups: Dict[int, List[int]] = {}
+            for b, graph in enumerate(self.graphs):
+                if graph.laplacian_backend == 'dense':
+                    groups.setdefault(graph.n_residues, []).append(b)
+
+            self._eigenbases = {}
+            for n, members in groups.items():
+                propagators = [self.graphs[b]._ensure_propagator() for b in members]
+                eigenvectors = torch.stack([propagator.eigenvectors for propagator in propagators])
+                frequencies = torch.stack([propagator.coupling_strength * propagator.eigenvalues
+                                           for propagator in propagators])
+                self._eigenbases[n] = (
+                    torch.tensor(members, device=self.device),
+                    eigenvectors.to(device=self.device, dtype=self.precision.complex_dtype),
+                    frequencies.to(self.device),
+                )
+        return self._eigenbases
+
+    def apply_virtue_constraints(self, active: torch.Tensor) -> None:
+        """Project the active sequences through all virtue operators in order"""
+
+        amplitudes = self.amplitudes[active]
+        scores = self.virtue_scores[active]
+        projectors = self.projectors[active]
+        aggregates = self.aggregates[active]
+
+        for k in range(len(VIRTUE_NAMES)):
+            projected = torch.einsum('bij,bnj->bni', projectors[:, k], amplitudes)
+            norms = torch.linalg.vector_norm(projected, dim=2, keepdim=True)
+            valid = norms > 1e-10
+            projected = torch.where(valid, projected / norms.clamp_min(1e-10), projected)
+            amplitudes = torch.where(valid, projected, amplitudes)
+            scores[:, :, k] = torch.einsum(
+                'bni,bij,bnj->bn', torch.conj(projected), aggregates[:, k], projected
+            ).real
+
+        self.amplitudes[active] = amplitudes
+        self.virtue_scores[active] = scores
+
+    def evolve_entangled_states(self, active: torch.Tensor, time_step: float = 0.1) -> None:
+        """Evolve the active sequences: dense ones batched per length group, sparse ones per graph"""
+
+        is_active = torch.zeros(self.batch_size, dtype=torch.bool, device=self.device)
+        is_active[active] = True
+
+        for n, (members, eigenvectors, frequencies) in self.eigenbases().items():
+            running = is_active[members]
+            if not running.any():
+                continue
+            indices, basis = members[running], eigenvectors[running]
+            phases = torch.exp(1j * frequencies[running] * float(time_step)).to(basis.dtype)
+            coefficients = torch.bmm(basis.transpose(1, 2), self.amplitudes[indices, :n])
+            self.amplitudes[indices, :n] = torch.bmm(basis, phases.unsqueeze(2) * coefficients)
+
+        for b in (active[~self.dense[active]]).tolist():
+            n = self.graphs[b].n_residues
+            self.amplitudes[b, :n] = self.graphs[b]._ensure_propagator().apply(self.amplitudes[b, :n], time_step)
+
+    def amplitude_amplification_search(self, active: torch.Tensor, target_virtue_threshold: float = 0.8,
+                                       max_iterations: int = 100) -> torch.Tensor:
+        """
+        Grover-like amplitude amplification for the active sequences
+
+        Each sequence runs its own optimal round count for its marked
+        fraction. Returns the (B_active,) count of high-virtue residues.
+        """
+
+        amplitudes = self.amplitudes[active]
+        mask = self.mask[active]
+
+        overall_virtue = self.virtue_scores[active].mean(dim=2)
+        marked = (overall_virtue > target_virtue_threshold) & mask
+        high_virtue_counts = marked.sum(dim=1)
+        rounds = amplification_rounds(high_virtue_counts, self.lengths[active], max_iterations)
+
+        phase = torch.where(marked, -1.0, 1.0).to(amplitudes.dtype).unsqueeze(2)
+        mask_c = mask.unsqueeze(2).to(amplitudes.dtype)
+
+        for round_idx in range(int(rounds.max().item())):
+            running = (rounds > round_idx).view(-1, 1, 1)
+            amplitudes = torch.where(running, grover_step(amplitudes, phase, mask_c), amplitudes)
+
+        self.amplitudes[active] = amplitudes
+        return high_virtue_counts
+
+    def calculate_fot_equation(self, active: torch.Tensor) -> torch.Tensor:
+        """(B_active,) FoT values: graph factor × Σᵢ |aᵢ|²·mean(Vᵢ)"""
+
+        amplitudes = self.amplitudes[active]
+        weights = torch.real(torch.conj(amplitudes) * amplitudes).sum(dim=2)
+        overall_virtue = self.virtue_scores[active].mean(dim=2) * self.mask[active]
+        return self.graph_factors[active] * (weights * overall_virtue).sum(dim=1)
+
+    def _convergence_controllers(self, convergence: Union[ConvergenceController,
+                                                          Sequence[ConvergenceController], None],
+                                 convergence_threshold: float) -> List[ConvergenceController]:
+        """One fresh controller per sequence (copies of a single controller, or LagConvergence)"""
+
+        if convergence is None:
+            controllers = [LagConvergence(threshold=convergence_threshold) for _ in range(self.batch_size)]
+        elif isinstance(convergence, ConvergenceController):
+            controllers = [copy.deepcopy(convergence) for _ in range(self.batch_size)]
+        else:
+            controllers = list(convergence)
+            if len(controllers) != self.batch_size:
+                raise ValueError(f"Expected {self.batch_size} convergence controllers, got {len(controllers)}")
+        for controller in controllers:
+            controller.reset()
+        return controllers
+
+    def run_fot_optimization(self, max_iterations: int = 1000,
+                             convergence_threshold: float = 1e-6,
+                             convergence: Union[ConvergenceController,
+                                                Sequence[ConvergenceController], None] = None
+                             ) -> List[Dict[str, Any]]:
+        """
+        Run FoT optimization for every sequence in the batch
+
+        Args:
+            max_iterations: Iteration cap
+            convergence_threshold: Threshold for the default LagConvergence rule
+            convergence: One controller per sequence, or a single controller
+                copied for every sequence (defaults to LagConvergence)
+
+        Returns one result dict per sequence, in input order, with the keys of
+        ProteinVQbitGraph.run_fot_optimization plus 'sequence'.
+        """
+
+        logger.info(f"Starting batched FoT optimization for {self.batch_size} sequences")
+
+        controllers = self._convergence_controllers(convergence, convergence_threshold)
+        self.initialize_states()
+
+        active = torch.ones(self.batch_size, dtype=torch.bool, device=self.device)
+        fot_history: List[List[float]] = [[] for _ in range(self.batch_size)]
+        best = [(float('-inf'), -1)] * self.batch_size
+        converged = [False] * self.batch_size
+        telemetry = [IterationTelemetry() for _ in range(self.batch_size)]
+
+        for iteration in range(max_iterations):
+            active_indices = active.nonzero().view(-1)
+
+            self.apply_virtue_constraints(active_indices)
+            self.evolve_entangled_states(active_indices)
+
+            if iteration % 10 == 0:
+                self.amplitude_amplification_search(active_indices)
+
+            fot_values = self.calculate_fot_equation(active_indices).tolist()
+            for b, fot_value in zip(active_indices.tolist(), fot_values):
+                fot_history[b].append(fot_value)
+                telemetry[b].record(iteration, fot_value)
+                if fot_value > best[b][0]:
+                    best[b] = (fot_value, iteration)
+
+                controller = controllers[b]
+                amplitudes = self.amplitudes[b, :self.graphs[b].n_residues] if controller.needs_amplitudes else None
+                if controller.update(iteration, fot_value, amplitudes):
+                    converged[b] = controller.converged
+                    active[b] = False
+
+            if not active.any():
+                break
+
+        results = []
+        for b, graph in enumerate(self.graphs):
+            n = graph.n_residues
+            graph.amplitudes = self.amplitudes[b, :n].clone()
+            graph.virtue_scores = self.virtue_scores[b, :n].clone()
+
+            best_fot, best_iteration = best[b]
+            results.append({
+                'sequence': graph.sequence,
+                **graph._optimization_results(converged[b], fot_history[b], best_fot, best_iteration,
+                                              telemetry[b].flush(), controllers[b])
+            })
+
+        logger.info(f"Batched FoT optimization completed: "
+                    f"{sum(converged)}/{self.batch_size} sequences converged")
+        return results
+
+
+def run_vqbit_protein_folding_batch(sequences: List[str], device: str = "cpu",
+                                    max_iterations: int = 1000,
+                                    precision: Union[str, PrecisionPolicy, None] = None,
+                                    convergence: Union[ConvergenceController,
+                                                       Sequence[ConvergenceController], None] = None
+                                    ) -> List[Dict[str, Any]]:
+    """
+    Run vQbit-based protein folding analysis for many sequences at once
+    """
+
+    logger.info(f"Starting batched vQbit protein folding for {len(sequences)} sequences")
+
+    batch = VQbitBatch(sequences, device, precision=precision)
+    return batch.run_fot_optimization(max_iterations=max_iterations, convergence=convergence)
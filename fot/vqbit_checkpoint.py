@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Checkpoint / Resume for Long FoT Optimizations
+
+run_fot_optimization(checkpoint=...) periodically writes the optimization
+state to a single .pt file:
+
+- the run's parameters: sequence, precision, method, iteration cap,
+  init_seed and the seed of the graph's RNGContext
+- the (N, 8) amplitudes with coherence and virtue scores
+- the next iteration to run
+- the graph's RNGContext generator states
+- the best FoT value so far, the FoT history and the convergence
+  controller's state (its score trace)
+
+A run started with the same parameters and checkpoint path resumes from the
+file instead of starting over; a checkpoint written with other parameters
+is discarded, and the file is removed once the run finishes. Only the
+graph's own generators are restored, never the global torch RNG, so runs
+without an RNGContext resume from the saved state but not bit for bit.
+
+Checkpoint timing is adaptive: after every save the checkpointer waits
+until save_time·(1 - f)/f seconds of optimization have passed, so
+checkpoint I/O stays below the fraction f of wall time however large the
+state and however fast the steps are. Runs shorter than min_interval_s never
+write a checkpoint.
+"""
+
+import hashlib
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import torch
+
+logger = logging.getLogger(__name__)
+
+# Bumped whenever the checkpoint layout changes; older files are ignored
+CHECKPOINT_VERSION = 2
+
+# Checkpoint fields that must equal the resuming run's
+RUN_PARAMETERS = ('sequence', 'precision', 'method', 'max_iterations', 'init_seed', 'rng_seed')
+
+
+def checkpoint_path_for(checkpoint_dir: Union[str, Path], sequence: str) -> Path:
+    """Checkpoint file of a sequence's optimization inside a directory"""
+    digest = hashlib.sha256(sequence.encode()).hexdigest()[:16]
+    return Path(checkpoint_dir) / f"fot_{digest}.pt"
+
+
+def pending_checkpoints(checkpoint_dir: Union[str, Path]) -> List['OptimizationCheckpoint']:
+    """Readable checkpoints left in a directory by interrupted runs, oldest first"""
+    checkpoint_dir = Path(checkpoint_dir)
+    if not checkpoint_dir.is_dir():
+        return []
+
+    checkpoints = []
+    for path in sorted(checkpoint_dir.glob('fot_*.pt'), key=lambda p: p.stat().st_mtime):
+        checkpoint = OptimizationCheckpoint.load(path)
+        if checkpoint is not None:
+            checkpoints.append(checkpoint)
+    return checkpoints
+
+
+@dataclass
+class OptimizationCheckpoint:
+    """State needed to continue a run_fot_optimization call"""
+    sequence: str
+    precision: str
+    method: str
+    iteration: int  # Next iteration to run
+    max_iterations: int
+    init_seed: Optional[int]
+    rng_seed: Optional[Tuple[Any, Tuple[int, ...]]]  # (entropy, spawn_key) of the graph's RNGContext
+    amplitudes: torch.Tensor
+    coherence: torch.Tensor
+    virtue_scores: torch.Tensor
+    best_fot: float
+    best_iteration: int
+    fot_history: List[float]
+    convergence_state: Dict[str, Any]
+    context_rng_state: Optional[Dict[str, Any]] = None
+    path: Optional[Path] = field(default=None, compare=False)
+
+    def parameters(self) -> Dict[str, Any]:
+        """Run parameters a resuming run must match"""
+        return {name: getattr(self, name) for name in RUN_PARAMETERS}
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Atomically write the checkpoint"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            'version': CHECKPOINT_VERSION,
+            'sequence': self.sequence,
+            'precision': self.precision,
+            'method': self.method,
+            'iteration': self.iteration,
+            'max_iterations': self.max_iterations,
+            'init_seed': self.init_seed,
+            'rng_seed': self.rng_seed,
+            'amplitudes': self.amplitudes.detach().cpu(),
+            'coherence': self.coherence.detach().cpu(),
+            'virtue_scores': self.virtue_scores.detach().cpu(),
+            'best_fot': self.best_fot,
+            'best_iteration': self.best_iteration,
+            'fot_history': torch.tensor(self.fot_history, dtype=torch.float64),
+            'convergence_state': self.convergence_state,
+            'context_rng_state': self.context_rng_state,
+        }
+        tmp_path = path.with_suffix('.tmp')
+        torch.save(payload, tmp_path)
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> Optional['OptimizationCheckpoint']:
+        """Read a checkpoint; None when missing, unreadable or of another version"""
+        path = Path(path)
+        if not path.exists():
+            return None
+        try:
+            payload = torch.load(path, map_location='cpu', weights_only=False)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+            return None
+        if payload.get('version') != CHECKPOINT_VERSION:
+            logger.warning(f"Ignoring checkpoint {path} with version {payload.get('version')}")
+            return None
+
+        payload.pop('version')
+        payload['fot_history'] = payload['fot_history'].tolist()
+        return cls(path=path, **payload)
+
+
+class FoTCheckpointer:
+    """
+    Checkpoint file plus adaptive save schedule for one optimization
+
+    Args:
+        path: Checkpoint file (.pt)
+        max_io_fraction: Upper bound on the share of wall time spent saving
+        min_interval_s: Minimum optimization time between saves
+    """
+
+    def __init__(self, path: Union[str, Path], max_io_fraction: float = 0.02, min_interval_s: float = 1.0):
+        if not 0.0 < max_io_fraction < 1.0:
+            raise ValueError(f"max_io_fraction must be in (0, 1), got {max_io_fraction}")
+        self.path = Path(path)
+        self.max_io_fraction = max_io_fraction
+        self.min_interval_s = min_interval_s
+        self.reset()
+
+    def reset(self) -> None:
+        """Prepare the save schedule for a new run"""
+        self.saves = 0
+        self.io_seconds = 0.0
+        self.resumed_from: Optional[int] = None
+        self._last_save_s: Optional[float] = None
+        self._start = self._last_save_end = time.perf_counter()
+
+    def load(self, parameters: Dict[str, Any]) -> Optional[OptimizationCheckpoint]:
+        """Checkpoint to resume for a run with these RUN_PARAMETERS, if one exists"""
+        checkpoint = OptimizationCheckpoint.load(self.path)
+        if checkpoint is None:
+            return None
+        mismatched = [name for name in RUN_PARAMETERS if checkpoint.parameters()[name] != parameters[name]]
+        if mismatched:
+            logger.warning(f"Checkpoint {self.path} was written with other {', '.join(mismatched)}; starting fresh")
+            return None
+        self.resumed_from = checkpoint.iteration
+        return checkpoint
+
+    def due(self) -> bool:
+        """Whether enough optimization time has passed since the last save"""
+        interval = self.min_interval_s
+        if self._last_save_s is not None:
+            interval = max(interval, self._last_save_s * (1.0 - self.max_io_fraction) / self.max_io_fraction)
+        return time.perf_counter() - self._last_save_end >= interval
+
+    def save(self, checkpoint: OptimizationCheckpoint) -> None:
+        """Write a checkpoint and update the save schedule"""
+        start = time.perf_counter()
+        checkpoint.save(self.path)
+        self._last_save_end = time.perf_counter()
+        self._last_save_s = self._last_save_end - start
+        self.io_seconds += self._last_save_s
+        self.saves += 1
+        logger.debug(f"Checkpoint {self.path.name} at iteration {checkpoint.iteration} "
+                     f"({self._last_save_s * 1000:.1f} ms)")
+
+    def complete(self) -> None:
+        """Remove the checkpoint of a finished run"""
+        self.path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Save count and I/O share of this run"""
+        elapsed = time.perf_counter() - self._start
+        return {
+            'path': str(self.path),
+            'saves': self.saves,
+            'io_seconds': self.io_seconds,
+            'io_fraction': self.io_seconds / elapsed if elapsed > 0 else 0.0,
+            'resumed_from_iteration': self.resumed_from,
+        }
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Fused and Compiled FoT Optimization Steps
+
+Each iteration of ProteinVQbitGraph.run_fot_optimization runs the same short
+chain of small tensor operations: project through the cumulative virtue
+stages, renormalize, score, evolve with the cached propagator and evaluate
+the FoT sum. fot_step expresses that chain as one pure function so it can be
+handed to a compiler as a single graph.
+
+The default virtue operators are real, so the step works on the (2, N, 8)
+stacked (re, im) parts of the state and the real / imaginary parts of the
+N×N propagator. That keeps every kernel real-valued, which TorchScript and
+the inductor backend of torch.compile both generate code for (inductor falls
+back to eager for complex tensors).
+
+Backends:
+
+- 'fused': fot_step run eagerly
+- 'torchscript': torch.jit.script(fot_step)
+- 'inductor': torch.compile(fot_step)
+- 'auto': inductor, else TorchScript, else fused
+
+A backend that fails to build or to run degrades to the fused step with a
+warning instead of failing the optimization.
+"""
+
+import functools
+import logging
+import warnings
+from typing import Callable, Tuple
+
+import torch
+
+logger = logging.getLogger(__name__)
+
+STEP_BACKENDS = ('fused', 'torchscript', 'inductor', 'auto')
+
+# Backends that failed in this process are not retried
+_FAILED_BACKENDS = set()
+
+
+def fot_step(state: torch.Tensor, cumulative: torch.Tensor, aggregates: torch.Tensor,
+             propagator_real: torch.Tensor, propagator_imag: torch.Tensor
+             ) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+    """
+    One FoT iteration on the (2, N, 8) real / imaginary parts of the state
+
+    Args:
+        state: (2, N, 8) stacked real and imaginary amplitudes
+        cumulative: (K, 8, 8) real cumulative projectors Pₖ···P₁
+        aggregates: (K, 8, 8) real aggregate constraints ΣCᵢ
+        propagator_real, propagator_imag: N×N parts of the evolution operator
+
+    Returns:
+        (2, N, 8) evolved state, (N,) coherence, (N, K) virtue scores,
+        (K, N) stage projection norms and the FoT sum ∑aᵢVᵢ (before the
+        graph factor)
+    """
+    staged = torch.einsum('kij,cnj->kcni', cumulative, state)
+    norms = torch.sqrt((staged * staged).sum(dim=3).sum(dim=1))
+    safe_norms = norms.clamp_min(1e-10).unsqueeze(1).unsqueeze(3)
+    staged = torch.where(norms.unsqueeze(1).unsqueeze(3) > 1e-10, staged / safe_norms, staged)
+
+    # ⟨ψ|C|ψ⟩ for real C is xᵀCx + yᵀCy
+    scores = torch.einsum('kcni,kij,kcnj->kn', staged, aggregates, staged)
+
+    projected = staged[-1]
+    evolved_real = propagator_real @ projected[0] - propagator_imag @ projected[1]
+    evolved_imag = propagator_imag @ projected[0] + propagator_real @ projected[1]
+    evolved = torch.stack([evolved_real, evolved_imag])
+
+    amplitude_weights = (evolved * evolved).sum(dim=2).sum(dim=0)
+    virtue_scores = scores.transpose(0, 1)
+    fot_sum = torch.dot(amplitude_weights, virtue_scores.mean(dim=1))
+
+    return evolved, norms[-1] * norms[-1], virtue_scores, norms, fot_sum
+
+
+@functools.lru_cache(maxsize=None)
+def _build_step(backend: str) -> Callable:
+    """Process-wide compiled step for a backend (built once)"""
+    if backend == 'fused':
+        return fot_step
+    if backend == 'torchscript':
+        with warnings.catch_warnings():
+            # Newer torch releases deprecate (but still ship) TorchScript
+            warnings.simplefilter('ignore', FutureWarning)
+            return torch.jit.script(fot_step)
+    if backend == 'inductor':
+        if not hasattr(torch, 'compile'):
+            raise RuntimeError("torch.compile is not available in this torch build")
+        return torch.compile(fot_step, dynamic=True)
+    raise ValueError(f"Unknown step backend: {backend} (expected one of {STEP_BACKENDS})")
+
+
+class CompiledStep:
+    """
+    fot_step behind a compiler backend with fallback to eager execution
+
+    Compilation is lazy (on the first call) so a missing compiler toolchain
+    only surfaces when the step actually runs; a backend that fails is
+    skipped by every CompiledStep in the process from then on.
+    """
+
+    def __init__(self, backend: str = 'auto'):
+        if backend not in STEP_BACKENDS:
+            raise ValueError(f"Unknown step backend: {backend} (expected one of {STEP_BACKENDS})")
+        self.requested_backend = backend
+        self._candidates = ['inductor', 'torchscript', 'fused'] if backend == 'auto' else [backend, 'fused']
+        self.backend = next(name for name in self._candidates if name not in _FAILED_BACKENDS)
+
+    def __call__(self, *tensors: torch.Tensor):
+        while True:
+            try:
+                return _build_step(self.backend)(*tensors)
+            except Exception as e:
+                if self.backend == 'fused':
+                    raise
+                _FAILED_BACKENDS.add(self.backend)
+                fallback = next(name for name in self._candidates if name not in _FAILED_BACKENDS)
+                logger.warning(f"FoT step backend '{self.backend}' unavailable ({type(e).__name__}: {e}); "
+                               f"falling back to '{fallback}'")
+                self.backend = fallback
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Gradient-Based FoT Optimization
+
+run_fot_optimization(method="gradient") maximizes a differentiable
+surrogate of the FoT equation instead of iterating projection, evolution
+and amplification rounds. The state is parameterized by an unconstrained
+real (N, 8, 2) tensor θ; each residue's amplitudes are ψᵢ = θᵢ / ‖θᵢ‖.
+
+The surrogate is the FoT value that one eager iteration produces from ψ:
+
+1. project ψ through the cumulative virtue projectors, giving the stage
+   scores sₖᵢ = ⟨ψₖᵢ|ΣCₖ|ψₖᵢ⟩ of the renormalized stage states,
+2. evolve the last stage state with the entanglement propagator U,
+3. FoT(ψ) = g · Σᵢ ‖(U ψ_K)ᵢ‖² · meanₖ sₖᵢ, with g the AKG graph factor.
+
+Every step is a torch operation, so autograd provides ∂FoT/∂θ and Adam or
+L-BFGS take the ascent steps. The sparse (Krylov) propagator runs in SciPy;
+its backward pass applies the adjoint U† = U(-dt) with the same propagator.
+"""
+
+import logging
+from typing import TYPE_CHECKING, Optional, Tuple
+
+import torch
+
+if TYPE_CHECKING:
+    from fot.vqbit_mathematics import ProteinVQbitGraph
+
+logger = logging.getLogger(__name__)
+
+GRADIENT_OPTIMIZERS = ('adam', 'lbfgs')
+
+DEFAULT_LEARNING_RATES = {'adam': 0.05, 'lbfgs': 1.0}
+
+
+class _PropagatorAction(torch.autograd.Function):
+    """U ψ for a non-differentiable propagator, with backward U† g = U(-dt) g"""
+
+    @staticmethod
+    def forward(ctx, amplitudes: torch.Tensor, propagator, time_step: float) -> torch.Tensor:
+        ctx.propagator, ctx.time_step = propagator, time_step
+        return propagator.apply(amplitudes, time_step)
+
+    @staticmethod
+    def backward(ctx, grad_output: torch.Tensor):
+        return ctx.propagator.apply(grad_output, -ctx.time_step), None, None
+
+
+def fot_surrogate(graph: 'ProteinVQbitGraph', amplitudes: torch.Tensor, virtue_names: Tuple[str, ...],
+                  time_step: float = 0.1) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+    """
+    Differentiable FoT of one constraint + evolution pass from (N, 8) amplitudes
+
+    Returns the scalar FoT, the (N, 8) evolved state, the (N,) coherence and
+    the (N, K) virtue scores, matching what the eager iteration leaves in the
+    graph.
+    """
+    staged, norms, scores = graph._project_stages(virtue_names, amplitudes)
+
+    propagator = graph._ensure_propagator()
+    if graph.laplacian_backend == 'sparse':
+        evolved = _PropagatorAction.apply(staged[-1], propagator, time_step)
+    else:
+        evolved = propagator.apply(staged[-1], time_step)
+
+    weights = torch.real(torch.conj(evolved) * evolved).sum(dim=1)
+    fot = graph._calculate_graph_factor() * torch.dot(weights, scores.mean(dim=0))
+    return fot, evolved, norms[-1] ** 2, scores.T
+
+
+class GradientFoTOptimizer:
+    """
+    Adam / L-BFGS ascent on the FoT surrogate for one graph
+
+    Starts from the graph's current amplitudes. step() takes one optimizer
+    step and writes the updated (normalized) amplitudes back to the graph;
+    finalize() replaces them with the evolved state of the surrogate so the
+    graph ends in the same form as after an eager iteration.
+
+    Args:
+        graph: Graph whose state is optimized
+        optimizer: 'adam' or 'lbfgs'
+        learning_rate: Step size (defaults per optimizer)
+        virtue_names: Virtue sequence of the surrogate's projection
+        time_step: Evolution time step of the surrogate
+    """
+
+    def __init__(self, graph: 'ProteinVQbitGraph', optimizer: str = 'adam',
+                 learning_rate: Optional[float] = None, virtue_names: Optional[Tuple[str, ...]] = None,
+                 time_step: float = 0.1):
+        if optimizer not in GRADIENT_OPTIMIZERS:
+            raise ValueError(f"Unknown gradient optimizer: {optimizer} (expected one of {GRADIENT_OPTIMIZERS})")
+        from fot.vqbit_mathematics import VIRTUE_NAMES
+
+        self.graph = graph
+        self.optimizer_name = optimizer
+        self.learning_rate = learning_rate if learning_rate is not None else DEFAULT_LEARNING_RATES[optimizer]
+        self.virtue_names = tuple(virtue_names or VIRTUE_NAMES)
+        self._score_columns = [VIRTUE_NAMES.index(name) for name in self.virtue_names]
+        self.time_step = time_step
+
+        self.params = torch.view_as_real(graph.amplitudes.detach().clone()).requires_grad_(True)
+        if optimizer == 'adam':
+            self.optimizer = torch.optim.Adam([self.params], lr=self.learning_rate)
+        else:
+            # One L-BFGS iteration per step(); the curvature history persists across steps
+            self.optimizer = torch.optim.LBFGS([self.params], lr=self.learning_rate, max_iter=1,
+                                               history_size=10, line_search_fn='strong_wolfe')
+
+    def amplitudes(self) -> torch.Tensor:
+        """(N, 8) per-residue normalized amplitudes of the current parameters"""
+        amplitudes = torch.view_as_complex(self.params)
+        return amplitudes / torch.linalg.vector_norm(amplitudes, dim=1, keepdim=True).clamp_min(1e-10)
+
+    def _loss(self) -> torch.Tensor:
+        self.optimizer.zero_grad()
+        fot, _, _, _ = fot_surrogate(self.graph, self.amplitudes(), self.virtue_names, self.time_step)
+        loss = -fot
+        loss.backward()
+        return loss
+
+    def step(self) -> float:
+        """One ascent step; returns the surrogate FoT of the state before the step"""
+        losses = []
+
+        def closure():
+            loss = self._loss()
+            losses.append(loss.item())
+            return loss
+
+        self.optimizer.step(closure)
+        with torch.no_grad():
+            self.graph.amplitudes = self.amplitudes().detach()
+        return -losses[0]
+
+    @torch.no_grad()
+    def finalize(self) -> float:
+        """Write the surrogate's evolved state, coherence and virtue scores to the graph"""
+        fot, evolved, coherence, virtue_scores = fot_surrogate(self.graph, self.amplitudes(), self.virtue_names,
+                                                               self.time_step)
+        self.graph.amplitudes = evolved
+        self.graph.coherence = coherence
+        self.graph.virtue_scores[:, self._score_columns] = virtue_scores
+        return fot.item()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Sequence-keyed Initialization Cache for vQbit States
+
+ProteinVQbitGraph re-initializes the same sequences many times (every
+run_fot_optimization call, replica loops in PublicationGradeAnalyzer, the
+calibration sweeps). When an initialization is seeded it is a pure function
+of the sequence and its configuration, so the resulting (N, 8) amplitude
+tensor can be reused.
+
+InitializationCache keeps those tensors in an in-process LRU and, if a
+cache directory is given, in ``<key>.pt`` files so later processes can reuse
+them. Keys are a SHA-256 hash of the sequence and the configuration dict.
+"""
+
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import torch
+
+logger = logging.getLogger(__name__)
+
+# Bump when the initialization procedure changes so stale disk entries are ignored
+INIT_CACHE_VERSION = 1
+
+
+def sequence_seed(sequence: str, *keys: Any) -> int:
+    """Stable 63-bit seed derived from a sequence and extra keys (e.g. residue index)"""
+    payload = json.dumps([sequence, *keys], default=str).encode()
+    return int.from_bytes(hashlib.blake2b(payload, digest_size=8).digest(), 'little') >> 1
+
+
+def seeded_generator(sequence: str, *keys: Any) -> torch.Generator:
+    """CPU torch.Generator seeded from sequence_seed(sequence, *keys)"""
+    generator = torch.Generator()
+    generator.manual_seed(sequence_seed(sequence, *keys))
+    return generator
+
+
+class InitializationCache:
+    """
+    LRU cache of initialized (N, 8) amplitude tensors
+
+    Entries are stored on CPU; callers move them to their device. get()
+    returns a copy, so writes to an initialized graph never reach the cache.
+    Hits and misses are counted for benchmarking.
+    """
+
+    def __init__(self, max_entries: int = 128, cache_dir: Optional[Union[str, Path]] = None):
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._entries: "OrderedDict[str, torch.Tensor]" = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(sequence: str, config: Dict[str, Any]) -> str:
+        """SHA-256 key for a sequence and initialization configuration"""
+        payload = json.dumps(
+            {'sequence': sequence, 'config': config, 'version': INIT_CACHE_VERSION},
+            sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[torch.Tensor]:
+        """Copy of the cached tensor for a key (memory first, then disk), or None"""
+
+        cached = self._entries.get(key)
+        if cached is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cached.clone()
+
+        if self.cache_dir is not None:
+            path = self.cache_dir / f"{key}.pt"
+            if path.exists():
+                try:
+                    cached = torch.load(path, map_location='cpu')
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable init cache entry {path.name}: {e}")
+                else:
+                    self._remember(key, cached)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return cached.clone()
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, amplitudes: torch.Tensor) -> None:
+        """Store a tensor in memory and, if configured, on disk"""
+
+        amplitudes = amplitudes.detach().to('cpu').clone()
+        self._remember(key, amplitudes)
+
+        if self.cache_dir is not None:
+            path = self.cache_dir / f"{key}.pt"
+            tmp_path = path.with_suffix('.tmp')
+            torch.save(amplitudes, tmp_path)
+            tmp_path.replace(path)
+
+    def _remember(self, key: str, amplitudes: torch.Tensor) -> None:
+        self._entries[key] = amplitudes
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop in-memory entries and reset counters (disk files are kept)"""
+        self._entries.clear()
+        self.hits = self.disk_hits = self.misses = 0
+
+    def cache_info(self) -> Dict[str, Any]:
+        """Report occupancy and hit statistics"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'cache_dir': str(self.cache_dir) if self.cache_dir is not None else None,
+        }
+
+
+_default_cache = InitializationCache()
+
+
+def default_init_cache() -> InitializationCache:
+    """Process-wide cache used by ProteinVQbitGraph unless one is passed in"""
+    return _default_cache
+
+
+def set_default_init_cache(cache: InitializationCache) -> None:
+    """Replace the process-wide cache (e.g. to enable an on-disk directory)"""
+    global _default_cache
+    _default_cache = cache
@@ -14,15 +14,269 @@ Mathematical Framework:
 
 import numpy as np
 import networkx as nx
-from typing import Dict, List, Any, Tuple, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Any, Tuple, Optional, Iterator, Mapping, Union
+from dataclasses import dataclass, field
+import functools
 import logging
+import time
+from pathlib import Path
 from scipy.sparse import csr_matrix
 from scipy.linalg import expm
 import torch
 
+from fot.vqbit_propagator import SpectralPropagator, KrylovPropagator
+from fot.convergence import ConvergenceController, LagConvergence
+from fot.vqbit_init_cache import InitializationCache, default_init_cache, seeded_generator
+from fot.motif_snapshot import MotifSnapshot
+from fot.vqbit_precision import PrecisionPolicy, resolve_precision, is_effectively_real, split_operator
+from fot.rng_context import RNGContext
+from fot.vqbit_compile import CompiledStep
+from fot.vqbit_checkpoint import FoTCheckpointer, OptimizationCheckpoint
+from fot.csr_graph import CSRGraph
+from fot.vqbit_gradient import GradientFoTOptimizer
+
 logger = logging.getLogger(__name__)
 
+# Chains longer than this keep the Laplacian sparse (CSR) and evolve with
+# expm_multiply instead of a dense eigendecomposition
+SPARSE_LAPLACIAN_THRESHOLD = 1024
+
+# Virtue order used for the columns of ProteinVQbitGraph.virtue_scores
+VIRTUE_NAMES = ('Justice', 'Honesty', 'Temperance', 'Prudence')
+
+# run_fot_optimization methods: projection/evolution rounds or autograd ascent
+FOT_METHODS = ('projection', 'gradient')
+
+# Conformational basis shared by every residue vQbit
+BASIS_STATES = [
+    {'phi': -60, 'psi': -45, 'type': 'alpha_helix'},  # 0
+    {'phi': -70, 'psi': -35, 'type': 'alpha_helix'},  # 1
+    {'phi': -50, 'psi': -55, 'type': 'alpha_helix'},  # 2
+    {'phi': -120, 'psi': 120, 'type': 'beta_sheet'},  # 3
+    {'phi': -130, 'psi': 110, 'type': 'beta_sheet'},  # 4
+    {'phi': -110, 'psi': 130, 'type': 'beta_sheet'},  # 5
+    {'phi': -180, 'psi': 180, 'type': 'extended'},    # 6
+    {'phi': 60, 'psi': 45, 'type': 'left_handed'}     # 7
+]
+
+# Biophysical priors (simplified Ramachandran propensities) over the 8 basis
+# states, one row per amino acid; the last row is the flat default for
+# unknown residues.
+AA_PROPENSITY_CODES = 'ARNDCEQGHILKMFPSTWYV'
+AA_PROPENSITIES = torch.tensor([
+    [0.3, 0.3, 0.2, 0.1, 0.1, 0.0, 0.0, 0.0],  # A: Helix-favoring
+    [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # R: Extended/charged
+    [0.1, 0.1, 0.1, 0.3, 0.3, 0.1, 0.0, 0.0],  # N: Sheet-favoring
+    [0.1, 0.1, 0.1, 0.3, 0.3, 0.1, 0.0, 0.0],  # D: Sheet-favoring
+    [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # C: Flexible
+    [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # E: Extended/charged
+    [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Q: Helix/extended
+    [0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.2, 0.2],  # G: Highly flexible
+    [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # H: Variable
+    [0.3, 0.3, 0.2, 0.1, 0.1, 0.0, 0.0, 0.0],  # I: Helix/sheet
+    [0.3, 0.3, 0.2, 0.1, 0.1, 0.0, 0.0, 0.0],  # L: Helix-favoring
+    [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # K: Extended/charged
+    [0.3, 0.3, 0.2, 0.1, 0.1, 0.0, 0.0, 0.0],  # M: Helix-favoring
+    [0.2, 0.2, 0.1, 0.3, 0.2, 0.0, 0.0, 0.0],  # F: Sheet-favoring
+    [0.0, 0.0, 0.0, 0.1, 0.1, 0.1, 0.4, 0.3],  # P: Turn/break
+    [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # S: Flexible
+    [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # T: Flexible
+    [0.2, 0.2, 0.1, 0.3, 0.2, 0.0, 0.0, 0.0],  # W: Sheet-favoring
+    [0.2, 0.2, 0.1, 0.3, 0.2, 0.0, 0.0, 0.0],  # Y: Sheet-favoring
+    [0.3, 0.3, 0.2, 0.1, 0.1, 0.0, 0.0, 0.0],  # V: Helix/sheet
+    [0.125] * 8,                               # unknown
+], dtype=torch.float32)
+
+# Byte -> AA_PROPENSITIES row lookup (unknown codes map to the default row)
+_PROPENSITY_ROW = np.full(256, len(AA_PROPENSITY_CODES), dtype=np.int64)
+_PROPENSITY_ROW[np.frombuffer(AA_PROPENSITY_CODES.encode(), dtype=np.uint8)] = np.arange(len(AA_PROPENSITY_CODES))
+
+
+def sequence_propensities(sequence: str) -> torch.Tensor:
+    """
+    (N, 8) basis propensities for a sequence, including proline context
+
+    A proline before a residue damps its helical states (×0.1); a proline
+    after it boosts the extended states (×2).
+    """
+    codes = np.frombuffer(sequence.encode('latin-1', errors='replace'), dtype=np.uint8)
+    propensities = AA_PROPENSITIES[torch.from_numpy(_PROPENSITY_ROW[codes])]
+
+    is_proline = torch.from_numpy(codes == ord('P'))
+    propensities[1:, 0:3] *= torch.where(is_proline[:-1], 0.1, 1.0).unsqueeze(1)
+    propensities[:-1, 6:8] *= torch.where(is_proline[1:], 2.0, 1.0).unsqueeze(1)
+    return propensities
+
+# Residue classes that form medium-range contact edges (1-letter codes)
+HYDROPHOBIC_RESIDUES = 'FYWLIVM'
+POSITIVE_RESIDUES = 'KRH'
+NEGATIVE_RESIDUES = 'DE'
+
+# Sequence separations j - i that get medium-range contact edges
+MEDIUM_RANGE_BAND = (3, 7)
+
+
+def _interaction_matrix() -> np.ndarray:
+    """
+    Residue-pair contact mask in AA_PROPENSITY_CODES order
+
+    Hydrophobic pairs, opposite charges and Cys-Cys interact. The extra last
+    row / column (unknown residues) never does.
+    """
+    n_codes = len(AA_PROPENSITY_CODES)
+    index = {aa: i for i, aa in enumerate(AA_PROPENSITY_CODES)}
+    
+    def members(residues: str) -> np.ndarray:
+        mask = np.zeros(n_codes + 1, dtype=bool)
+        mask[[index[aa] for aa in residues]] = True
+        return mask
+    
+    hydrophobic = members(HYDROPHOBIC_RESIDUES)
+    positive = members(POSITIVE_RESIDUES)
+    negative = members(NEGATIVE_RESIDUES)
+    cysteine = members('C')
+    
+    return (np.outer(hydrophobic, hydrophobic) | np.outer(positive, negative) |
+            np.outer(negative, positive) | np.outer(cysteine, cysteine))
+
+INTERACTION_MATRIX = _interaction_matrix()
+
+
+def contact_edges(sequence: str, band: Tuple[int, int] = MEDIUM_RANGE_BAND
+                  ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Backbone and medium-range contact edges of a sequence as arrays
+    
+    Medium-range candidates are the pairs (i, i + d) for every separation d
+    in the band; one INTERACTION_MATRIX lookup per diagonal keeps the work
+    O(N · band) with no Python loop over residue pairs.
+    
+    Returns:
+        (2, E) int64 edge index with i < j (backbone edges first), (E,)
+        coupling strengths and an (E,) mask of the medium-range edges
+    """
+    codes = np.frombuffer(sequence.encode('latin-1', errors='replace'), dtype=np.uint8)
+    classes = _PROPENSITY_ROW[codes]
+    n_residues = len(sequence)
+    
+    sources = [np.arange(n_residues - 1)]
+    targets = [np.arange(1, n_residues)]
+    for separation in range(band[0], band[1] + 1):
+        if separation >= n_residues:
+            break
+        starts = np.flatnonzero(INTERACTION_MATRIX[classes[:-separation], classes[separation:]])
+        sources.append(starts)
+        targets.append(starts + separation)
+    
+    edge_index = np.stack([np.concatenate(sources), np.concatenate(targets)]).astype(np.int64)
+    medium_range = np.arange(edge_index.shape[1]) >= max(n_residues - 1, 0)
+    coupling = np.where(medium_range, 0.5, 1.0)
+    return edge_index, coupling, medium_range
+
+# Shared per-residue virtue constraint blocks. Every residue carries the same
+# 8×8 block, so each virtue is stored once and broadcast over the chain.
+# Basis layout: 0-2 alpha-helical, 3-5 beta-sheet, 6-7 extended/other.
+def _ramachandran_block() -> torch.Tensor:
+    """Ramachandran constraint block for backbone geometry"""
+    block = torch.zeros((8, 8), dtype=torch.complex64)
+    # TUNED: Match validated force field - favor disorder for Aβ42
+    block[0:3, 0:3] = torch.eye(3, dtype=torch.complex64) * 0.2  # Alpha-helical - REDUCED for Aβ42 disorder
+    block[3:6, 3:6] = torch.eye(3, dtype=torch.complex64) * 0.6  # Beta-sheet - MODERATE for aggregation
+    block[6:8, 6:8] = torch.eye(2, dtype=torch.complex64) * 0.9  # Extended/disorder - INCREASED for Aβ42
+    return block
+
+def _experimental_consistency_block() -> torch.Tensor:
+    """Experimental data consistency block"""
+    # TODO: Integrate with real experimental data from pipeline (via residue overrides)
+    return torch.eye(8, dtype=torch.complex64) * 0.7
+
+def _stability_block() -> torch.Tensor:
+    """Computational stability block: penalize high-energy or unstable conformations"""
+    return torch.diag(torch.tensor([0.8, 0.7, 0.6, 0.7, 0.6, 0.5, 0.4, 0.3], dtype=torch.complex64))
+
+def _efficiency_block() -> torch.Tensor:
+    """Computational efficiency block: favor conformations that converge quickly"""
+    return torch.diag(torch.tensor([0.6, 0.5, 0.4, 0.6, 0.5, 0.4, 0.3, 0.2], dtype=torch.complex64))
+
+_VIRTUE_BLOCK_BUILDERS = {
+    'Justice': _ramachandran_block,
+    'Honesty': _experimental_consistency_block,
+    'Temperance': _stability_block,
+    'Prudence': _efficiency_block,
+}
+
+def shared_virtue_block(name: str, device: str = "cpu", dtype: torch.dtype = torch.complex64) -> torch.Tensor:
+    """Process-wide cached 8×8 constraint block for a virtue (treat as read-only)"""
+    if name not in _VIRTUE_BLOCK_BUILDERS:
+        raise ValueError(f"Unknown virtue operator: {name}")
+    return _cached_virtue_block(name, str(device), dtype)
+
+@functools.lru_cache(maxsize=None)
+def _cached_virtue_block(name: str, device: str, dtype: torch.dtype) -> torch.Tensor:
+    return _VIRTUE_BLOCK_BUILDERS[name]().to(device=device, dtype=dtype)
+
+def _projector_from_aggregate(aggregate_matrix: torch.Tensor, threshold: float) -> torch.Tensor:
+    """Projector onto the eigenspace of the aggregate constraint with eigenvalues > threshold"""
+    
+    # Use CPU for eigenvalue decomposition if MPS doesn't support it
+    eigenvals, eigenvecs = torch.linalg.eigh(aggregate_matrix.cpu())
+    
+    # Keep eigenvectors with eigenvalues above threshold
+    valid_eigenvecs = eigenvecs[:, eigenvals > threshold]
+    
+    # Create projector P = |ψ⟩⟨ψ| for valid subspace
+    return valid_eigenvecs @ torch.conj(valid_eigenvecs).T
+
+def shared_virtue_projector(name: str, n_residues: int, threshold: float, device: str = "cpu",
+                            dtype: torch.dtype = torch.complex64) -> torch.Tensor:
+    """
+    Process-wide cached projector for an un-overridden virtue operator
+    
+    The aggregate constraint is N·C, so the projector depends only on the
+    virtue, the chain length and the threshold (treat as read-only).
+    """
+    if name not in _VIRTUE_BLOCK_BUILDERS:
+        raise ValueError(f"Unknown virtue operator: {name}")
+    return _cached_virtue_projector(name, int(n_residues), float(threshold), str(device), dtype)
+
+@functools.lru_cache(maxsize=1024)
+def _cached_virtue_projector(name: str, n_residues: int, threshold: float, device: str,
+                             dtype: torch.dtype) -> torch.Tensor:
+    aggregate = _cached_virtue_block(name, "cpu", dtype) * n_residues
+    return _projector_from_aggregate(aggregate, threshold).to(device)
+
+def amplification_rounds(n_marked, n_total, max_iterations: int):
+    """
+    Optimal Grover round count for a marked fraction M/N
+    
+    k = floor(π / (4θ)) with sin θ = √(M/N), whose small-fraction limit is
+    the familiar π/4·√(N/M). At least one round is run when anything is
+    marked, nothing when nothing is, and the result is capped at
+    max_iterations. Works elementwise on tensors.
+    """
+    n_marked = torch.as_tensor(n_marked, dtype=torch.float64)
+    n_total = torch.as_tensor(n_total, dtype=torch.float64)
+    theta = torch.asin(torch.sqrt((n_marked / n_total.clamp_min(1.0)).clamp(0.0, 1.0)))
+    rounds = torch.floor(np.pi / (4.0 * theta.clamp_min(1e-12))).clamp(1, max_iterations)
+    return torch.where(n_marked > 0, rounds, torch.zeros_like(rounds)).long()
+
+def grover_step(amplitudes: torch.Tensor, phase: torch.Tensor, mask: Optional[torch.Tensor] = None) -> torch.Tensor:
+    """
+    One fused amplification round on an (..., N, 8) amplitude tensor
+    
+    Oracle phase flip, inversion about the mean amplitude over residues and
+    per-residue renormalization. ``mask`` (..., N, 1) excludes padded residues.
+    """
+    flipped = amplitudes * phase
+    if mask is None:
+        average = flipped.mean(dim=-2, keepdim=True)
+        reflected = 2 * average - flipped
+    else:
+        average = (flipped * mask).sum(dim=-2, keepdim=True) / mask.real.sum(dim=-2, keepdim=True)
+        reflected = (2 * average - flipped) * mask
+    norms = torch.linalg.vector_norm(reflected, dim=-1, keepdim=True)
+    return torch.where(norms > 1e-10, reflected / norms.clamp_min(1e-10), reflected)
+
 @dataclass
 class VQbitState:
     """
@@ -45,35 +299,242 @@ class VirtueOperator:
     Implements projection onto valid conformational subspaces
     """
     name: str  # Justice, Honesty, Temperance, Prudence
-    constraint_matrix: torch.Tensor  # Mathematical constraint operator
+    constraint_matrix: torch.Tensor  # Shared 8×8 constraint operator, broadcast over residues
     threshold: float  # Minimum virtue score for validity
     projector: torch.Tensor  # Projection operator onto valid subspace
+    aggregate_matrix: Optional[torch.Tensor] = None  # Constraint summed over residues
+    n_residues: int = 1  # Number of residues the shared operator is broadcast to
+    residue_overrides: Dict[int, torch.Tensor] = field(default_factory=dict)  # Sparse per-residue 8×8 blocks
+    
+    def residue_matrix(self, residue_id: int) -> torch.Tensor:
+        """8×8 constraint block for one residue"""
+        return self.residue_overrides.get(residue_id, self.constraint_matrix)
+    
+    def residue_matrices(self) -> torch.Tensor:
+        """(N, 8, 8) per-residue constraint blocks (a broadcast view unless overridden)"""
+        matrices = self.constraint_matrix.expand(self.n_residues, 8, 8)
+        if self.residue_overrides:
+            matrices = matrices.clone()
+            for residue_id, override in self.residue_overrides.items():
+                matrices[residue_id] = override
+        return matrices
+
+@dataclass
+class GraphInvariants:
+    """
+    Structural invariants of the AKG, computed once per graph
+    
+    The AKG never changes after construction, so FoT scoring reads these
+    instead of re-walking the graph on every call.
+    """
+    n_nodes: int
+    n_edges: int
+    average_clustering: float
+    density: float
+    
+    @property
+    def graph_factor(self) -> float:
+        """AKG modulation factor of the FoT equation"""
+        return (self.average_clustering + self.density) / 2.0
+    
+    def as_properties(self) -> Dict[str, Any]:
+        """Summary in the run_fot_optimization 'graph_properties' format"""
+        return {
+            'nodes': self.n_nodes,
+            'edges': self.n_edges,
+            'clustering': self.average_clustering,
+            'density': self.density
+        }
+
+class IterationTelemetry:
+    """
+    Per-iteration telemetry buffer for FoT optimization
+    
+    Records are kept in memory during the run and emitted once by flush(),
+    replacing per-call INFO logging in the hot loop.
+    """
+    
+    def __init__(self):
+        self.records: List[Dict[str, float]] = []
+        self._start = time.perf_counter()
+    
+    def record(self, iteration: int, fot_value: float, **fields: float) -> None:
+        self.records.append({
+            'iteration': iteration,
+            'fot_value': fot_value,
+            'elapsed_s': time.perf_counter() - self._start,
+            **fields
+        })
+    
+    def flush(self, log_every: int = 100) -> List[Dict[str, float]]:
+        """Log buffered records (every log_every-th at INFO, all at DEBUG) and clear the buffer"""
+        records, self.records = self.records, []
+        for record in records:
+            level = logging.INFO if record['iteration'] % log_every == 0 else logging.DEBUG
+            if logger.isEnabledFor(level):
+                logger.log(level, f"Iteration {record['iteration']}: FoT = {record['fot_value']:.6f}")
+        if records:
+            logger.info(f"FoT telemetry: {len(records)} iterations in {records[-1]['elapsed_s']:.3f}s")
+        return records
+
+class VQbitStateView:
+    """
+    Compatibility view of one residue in the struct-of-arrays vQbit state
+    
+    Exposes the VQbitState fields on top of the (N, 8) amplitude tensor held by
+    ProteinVQbitGraph. Assigning ``amplitudes`` writes through to the graph;
+    ``virtue_scores`` is a snapshot dict.
+    """
+    
+    __slots__ = ('_graph', 'residue_id')
+    
+    def __init__(self, graph: 'ProteinVQbitGraph', residue_id: int):
+        self._graph = graph
+        self.residue_id = residue_id
+    
+    @property
+    def amplitudes(self) -> torch.Tensor:
+        return self._graph.amplitudes[self.residue_id]
+    
+    @amplitudes.setter
+    def amplitudes(self, value: torch.Tensor) -> None:
+        self._graph.amplitudes[self.residue_id] = value
+    
+    @property
+    def basis_states(self) -> List[Dict[str, Any]]:
+        return BASIS_STATES
+    
+    @property
+    def entanglement_map(self) -> Dict[int, torch.Tensor]:
+        return self._graph.entanglement_maps.get(self.residue_id, {})
+    
+    @property
+    def virtue_scores(self) -> Dict[str, float]:
+        return dict(zip(VIRTUE_NAMES, self._graph.virtue_scores[self.residue_id].tolist()))
+    
+    def to_state(self) -> VQbitState:
+        """Materialize a standalone VQbitState copy"""
+        return VQbitState(
+            amplitudes=self.amplitudes.clone(),
+            basis_states=self.basis_states,
+            residue_id=self.residue_id,
+            entanglement_map=self.entanglement_map,
+            virtue_scores=self.virtue_scores
+        )
+
+class _VQbitStateMapping(Mapping):
+    """Read-only residue_id -> VQbitStateView mapping over a ProteinVQbitGraph"""
+    
+    def __init__(self, graph: 'ProteinVQbitGraph'):
+        self._graph = graph
+    
+    def __getitem__(self, residue_id: int) -> VQbitStateView:
+        if not 0 <= residue_id < len(self):
+            raise KeyError(residue_id)
+        return VQbitStateView(self._graph, residue_id)
+    
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(len(self)))
+    
+    def __len__(self) -> int:
+        return 0 if self._graph.amplitudes is None else self._graph.n_residues
+
+class _EntanglementMaps(Mapping):
+    """
+    Lazy residue_id -> {neighbor: 8×8 map} mapping over a ProteinVQbitGraph
+    
+    Each residue's maps come from a generator seeded by (sequence, residue
+    index), so they are reproducible and only built when first accessed.
+    """
+    
+    def __init__(self, graph: 'ProteinVQbitGraph'):
+        self._graph = graph
+        self._maps: Dict[int, Dict[int, torch.Tensor]] = {}
+    
+    def __getitem__(self, residue_id: int) -> Dict[int, torch.Tensor]:
+        if not 0 <= residue_id < self._graph.n_residues:
+            raise KeyError(residue_id)
+        maps = self._maps.get(residue_id)
+        if maps is None:
+            generator = seeded_generator(self._graph.sequence, 'entanglement', residue_id)
+            neighbors = self._graph.contact_graph.neighbors(residue_id).tolist()
+            blocks = torch.randn(len(neighbors), 8, 8, dtype=torch.complex64, generator=generator)
+            maps = {neighbor: block.to(self._graph.device) for neighbor, block in zip(neighbors, blocks)}
+            self._maps[residue_id] = maps
+        return maps
+    
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self._graph.n_residues))
+    
+    def __len__(self) -> int:
+        return self._graph.n_residues
 
 class ProteinVQbitGraph:
     """
     Graph-based vQbit system for protein folding
     
-    Uses NetworkX for AKG operations and quantum-inspired mathematics
-    for conformational sampling and virtue-based optimization.
+    The AKG is held as a CSR adjacency (self.contact_graph); the NetworkX
+    view (self.akg) is only built on first access, for export and
+    visualization. Quantum-inspired mathematics drives conformational
+    sampling and virtue-based optimization.
     """
     
-    def __init__(self, sequence: str, device: str = "cpu"):
-        """Initialize protein vQbit graph"""
+    def __init__(self, sequence: str, device: str = "cpu",
+                 sparse_threshold: Optional[int] = None,
+                 init_cache: Optional[InitializationCache] = None,
+                 precision: Union[str, PrecisionPolicy, None] = None,
+                 rng: Optional[RNGContext] = None):
+        """
+        Initialize protein vQbit graph
+        
+        Args:
+            sequence: Amino acid sequence (1-letter codes)
+            device: Torch device for the vQbit tensors
+            sparse_threshold: Use the sparse Laplacian backend for chains longer
+                than this (defaults to SPARSE_LAPLACIAN_THRESHOLD)
+            init_cache: Cache for seeded initial states (defaults to the
+                process-wide default_init_cache())
+            precision: 'reference', 'default' or 'reduced' (or a PrecisionPolicy)
+            rng: RNG context for unseeded initialization and measurement draws
+                (defaults to the global torch RNG)
+        """
         self.sequence = sequence
         self.n_residues = len(sequence)
         self.device = device
+        self.precision = resolve_precision(precision)
+        self.rng = rng
+        
+        if sparse_threshold is None:
+            sparse_threshold = SPARSE_LAPLACIAN_THRESHOLD
+        self.laplacian_backend = 'sparse' if self.n_residues > sparse_threshold else 'dense'
+        
+        # AKG as CSR adjacency (built in _build_protein_graph); NetworkX view on demand
+        self.contact_graph: Optional[CSRGraph] = None
+        self._medium_range_edges: Optional[np.ndarray] = None
+        self._akg: Optional[nx.Graph] = None
+        
+        # Struct-of-arrays vQbit state: (N, 8) amplitudes with parallel
+        # per-residue coherence (N,) and virtue score (N, 4) tensors
+        self.amplitudes: Optional[torch.Tensor] = None
+        self.coherence: Optional[torch.Tensor] = None
+        self.virtue_scores: Optional[torch.Tensor] = None
+        self.entanglement_maps: Mapping[int, Dict[int, torch.Tensor]] = _EntanglementMaps(self)
+        self.init_cache = init_cache if init_cache is not None else default_init_cache()
+        
+        # Virtue operators, plus the stacked projection operators per virtue sequence
+        self.virtue_operators: Dict[str, VirtueOperator] = {}
+        self._stage_operators: Dict[Tuple[str, ...], Tuple[torch.Tensor, torch.Tensor, bool]] = {}
+        self._step_operators: Dict[Tuple[Tuple[str, ...], float], Optional[Tuple[torch.Tensor, ...]]] = {}
         
-        # Initialize AKG using NetworkX
-        self.akg = nx.Graph()
-        
-        # vQbit states for each residue
-        self.vqbit_states: Dict[int, VQbitState] = {}
+        # Graph Laplacian for entanglement: CSR always, dense only for the dense backend
+        self.laplacian_csr: Optional[csr_matrix] = None
+        self.laplacian_matrix: Optional[torch.Tensor] = None
         
-        # Virtue operators
-        self.virtue_operators: Dict[str, VirtueOperator] = {}
+        # Evolution propagator (built lazily from the Laplacian on first evolution)
+        self.propagator = None
         
-        # Graph Laplacian for entanglement
-        self.laplacian_matrix = None
+        # Structural invariants of the AKG (computed in _build_protein_graph)
+        self.graph_invariants: Optional[GraphInvariants] = None
         
         # Measurement operators
         self.measurement_operators = {}
@@ -82,199 +543,142 @@ class ProteinVQbitGraph:
         self._build_protein_graph()
         self._initialize_virtue_operators()
     
+    def _torch_generator(self) -> Optional[torch.Generator]:
+        """Generator for the graph's random draws (None means the global torch RNG)"""
+        return self.rng.torch if self.rng is not None else None
+    
+    @property
+    def vqbit_states(self) -> Mapping[int, VQbitStateView]:
+        """Per-residue VQbitState-compatible views over the state tensors"""
+        return _VQbitStateMapping(self)
+    
+    def _set_state(self, amplitudes: torch.Tensor) -> None:
+        """Install a fresh (N, 8) amplitude tensor and reset per-residue scores"""
+        self.amplitudes = amplitudes.to(device=self.device, dtype=self.precision.complex_dtype)
+        self.coherence = torch.ones(self.n_residues, dtype=self.precision.real_dtype, device=self.device)
+        self.virtue_scores = torch.full(
+            (self.n_residues, len(VIRTUE_NAMES)), 0.5, dtype=self.precision.real_dtype, device=self.device
+        )
+    
     def _build_protein_graph(self) -> None:
         """Build protein backbone connectivity graph"""
         
-        # Add residues as nodes
-        for i, aa in enumerate(self.sequence):
-            self.akg.add_node(i, 
-                             residue_type=aa,
-                             residue_number=i+1,
-                             vqbit_dimension=8)  # 8-dimensional conformational space
-        
-        # Add backbone connectivity edges
-        for i in range(self.n_residues - 1):
-            self.akg.add_edge(i, i+1, 
-                             bond_type='backbone',
-                             coupling_strength=1.0,
-                             constraint_type='sequential')
-        
-        # Add important long-range interactions
-        for i in range(self.n_residues):
-            for j in range(i+3, min(i+8, self.n_residues)):  # Medium-range
-                if self._should_add_interaction(i, j):
-                    self.akg.add_edge(i, j,
-                                     bond_type='medium_range',
-                                     coupling_strength=0.5,
-                                     constraint_type='spatial')
+        # Backbone connectivity plus medium-range contacts, built as arrays
+        edge_index, coupling, medium_range = contact_edges(self.sequence)
+        self.contact_graph = CSRGraph.from_edges(self.n_residues, edge_index, coupling)
+        self._medium_range_edges = medium_range
         
         # Compute graph Laplacian for entanglement operations
-        self.laplacian_matrix = torch.tensor(
-            nx.normalized_laplacian_matrix(self.akg).toarray(),
-            dtype=torch.float32,
-            device=self.device
-        )
-        
-        logger.info(f"Built protein graph: {self.akg.number_of_nodes()} nodes, {self.akg.number_of_edges()} edges")
-    
-    def _should_add_interaction(self, i: int, j: int) -> bool:
-        """Determine if residues i and j should have long-range interaction"""
-        
-        aa_i = self.sequence[i]
-        aa_j = self.sequence[j]
-        
-        # Hydrophobic interactions
-        hydrophobic = {'PHE', 'TYR', 'TRP', 'LEU', 'ILE', 'VAL', 'MET'}
-        if aa_i in hydrophobic and aa_j in hydrophobic:
-            return True
-        
-        # Electrostatic interactions
-        positive = {'LYS', 'ARG', 'HIS'}
-        negative = {'ASP', 'GLU'}
-        if (aa_i in positive and aa_j in negative) or (aa_i in negative and aa_j in positive):
-            return True
+        self.laplacian_csr = self.contact_graph.normalized_laplacian()
+        if self.laplacian_backend == 'dense':
+            self.laplacian_matrix = torch.tensor(
+                self.laplacian_csr.toarray(),
+                dtype=self.precision.real_dtype,
+                device=self.device
+            )
         
-        # Disulfide bonds (CYS-CYS)
-        if aa_i == 'CYS' and aa_j == 'CYS':
-            return True
+        self.graph_invariants = self._compute_graph_invariants()
         
-        return False
+        logger.info(f"Built protein graph: {self.n_residues} nodes, {self.contact_graph.n_edges} edges "
+                    f"({self.laplacian_backend} Laplacian)")
+    
+    @property
+    def akg(self) -> nx.Graph:
+        """NetworkX view of the AKG with residue and bond attributes (built on first access)"""
+        if self._akg is None:
+            graph = nx.Graph()
+            graph.add_nodes_from(
+                (i, {'residue_type': aa, 'residue_number': i + 1, 'vqbit_dimension': 8})  # 8-dimensional conformational space
+                for i, aa in enumerate(self.sequence)
+            )
+            backbone = {'bond_type': 'backbone', 'coupling_strength': 1.0, 'constraint_type': 'sequential'}
+            spatial = {'bond_type': 'medium_range', 'coupling_strength': 0.5, 'constraint_type': 'spatial'}
+            edge_index = self.contact_graph.edge_index
+            graph.add_edges_from(
+                (i, j, spatial if is_medium else backbone)
+                for i, j, is_medium in zip(edge_index[0].tolist(), edge_index[1].tolist(),
+                                           self._medium_range_edges.tolist())
+            )
+            self._akg = graph
+        return self._akg
+    
+    def _compute_graph_invariants(self) -> GraphInvariants:
+        """Compute the AKG invariants used by FoT scoring from the CSR graph"""
+        
+        graph = self.contact_graph
+        return GraphInvariants(
+            n_nodes=graph.n_nodes,
+            n_edges=graph.n_edges,
+            average_clustering=graph.average_clustering(),
+            density=graph.density()
+        )
     
     def _initialize_virtue_operators(self) -> None:
         """Initialize mathematical virtue constraint operators"""
         
         # Justice: Physical law enforcement (Ramachandran constraints)
         # TUNED: Align with validated force field - favor disorder over helix
-        justice_matrix = self._create_ramachandran_operator()
-        self.virtue_operators['Justice'] = VirtueOperator(
-            name='Justice',
-            constraint_matrix=justice_matrix,
-            threshold=0.6,  # REDUCED: Less restrictive for disorder sampling
-            projector=self._create_projector(justice_matrix, 0.6)
-        )
+        # threshold REDUCED: Less restrictive for disorder sampling
+        self.virtue_operators['Justice'] = self._build_virtue_operator('Justice', 0.6)
         
         # Honesty: Experimental data consistency
-        honesty_matrix = self._create_experimental_consistency_operator()
-        self.virtue_operators['Honesty'] = VirtueOperator(
-            name='Honesty',
-            constraint_matrix=honesty_matrix,
-            threshold=0.7,
-            projector=self._create_projector(honesty_matrix, 0.7)
-        )
+        self.virtue_operators['Honesty'] = self._build_virtue_operator('Honesty', 0.7)
         
         # Temperance: Computational stability
-        temperance_matrix = self._create_stability_operator()
-        self.virtue_operators['Temperance'] = VirtueOperator(
-            name='Temperance',
-            constraint_matrix=temperance_matrix,
-            threshold=0.6,
-            projector=self._create_projector(temperance_matrix, 0.6)
-        )
+        self.virtue_operators['Temperance'] = self._build_virtue_operator('Temperance', 0.6)
         
         # Prudence: Efficiency and convergence
-        prudence_matrix = self._create_efficiency_operator()
-        self.virtue_operators['Prudence'] = VirtueOperator(
-            name='Prudence',
-            constraint_matrix=prudence_matrix,
-            threshold=0.5,
-            projector=self._create_projector(prudence_matrix, 0.5)
-        )
+        self.virtue_operators['Prudence'] = self._build_virtue_operator('Prudence', 0.5)
         
         logger.info("Initialized virtue operators for mathematical constraints")
     
-    def _create_ramachandran_operator(self) -> torch.Tensor:
-        """Create Ramachandran constraint operator for backbone geometry"""
-        
-        # Create constraint matrix for valid phi-psi angles
-        constraint_matrix = torch.zeros((self.n_residues, 8, 8), device=self.device, dtype=torch.complex64)
-        
-        for i in range(self.n_residues):
-            # Define allowed regions in conformational space
-            # 0-2: alpha-helical region
-            # 3-5: beta-sheet region  
-            # 6-7: extended/other regions
-            
-            # TUNED: Match validated force field - favor disorder for Aβ42
-            
-            # Alpha-helical constraints - REDUCED for Aβ42 disorder
-            constraint_matrix[i, 0:3, 0:3] = torch.eye(3, dtype=torch.complex64, device=self.device) * 0.2
-            
-            # Beta-sheet constraints - MODERATE for aggregation
-            constraint_matrix[i, 3:6, 3:6] = torch.eye(3, dtype=torch.complex64, device=self.device) * 0.6
-            
-            # Extended/disorder constraints - INCREASED for Aβ42 
-            constraint_matrix[i, 6:8, 6:8] = torch.eye(2, dtype=torch.complex64, device=self.device) * 0.9
-        
-        return constraint_matrix
-    
-    def _create_experimental_consistency_operator(self) -> torch.Tensor:
-        """Create operator for experimental data consistency"""
-        
-        # Create constraint matrix for each residue
-        constraint_matrix = torch.zeros((self.n_residues, 8, 8), device=self.device, dtype=torch.complex64)
-        
-        for i in range(self.n_residues):
-            # Create consistency operator for each residue
-            constraint_matrix[i] = torch.eye(8, device=self.device, dtype=torch.complex64) * 0.7
-            
-            # Add specific experimental constraints if available
-            # TODO: Integrate with real experimental data from pipeline
-        
-        return constraint_matrix
-    
-    def _create_stability_operator(self) -> torch.Tensor:
-        """Create computational stability operator"""
-        
-        # Penalize high-energy or unstable conformations
-        constraint_matrix = torch.zeros((self.n_residues, 8, 8), device=self.device, dtype=torch.complex64)
-        
-        for i in range(self.n_residues):
-            # Create stability metric based on local energy landscape
-            stability_values = torch.tensor([0.8, 0.7, 0.6, 0.7, 0.6, 0.5, 0.4, 0.3], dtype=torch.complex64, device=self.device)
-            constraint_matrix[i] = torch.diag(stability_values)
-        
-        return constraint_matrix
+    def _build_virtue_operator(self, name: str, threshold: float) -> VirtueOperator:
+        """Build a virtue operator from the process-wide shared block and projector caches"""
+        
+        dtype = self.precision.complex_dtype
+        constraint_matrix = shared_virtue_block(name, str(self.device), dtype)
+        return VirtueOperator(
+            name=name,
+            constraint_matrix=constraint_matrix,
+            threshold=threshold,
+            projector=shared_virtue_projector(name, self.n_residues, threshold, str(self.device), dtype),
+            aggregate_matrix=constraint_matrix * self.n_residues,
+            n_residues=self.n_residues
+        )
     
-    def _create_efficiency_operator(self) -> torch.Tensor:
-        """Create computational efficiency operator"""
+    def set_residue_constraint(self, virtue_name: str, residue_id: int, matrix: torch.Tensor) -> None:
+        """
+        Override the 8×8 constraint block of one residue for a virtue
         
-        # Favor conformations that converge quickly
-        constraint_matrix = torch.zeros((self.n_residues, 8, 8), device=self.device, dtype=torch.complex64)
+        Overrides live in the operator's sparse side table; the aggregate
+        matrix and projector are recomputed for this graph only and no longer
+        come from the shared cache.
+        """
         
-        for i in range(self.n_residues):
-            # Create efficiency metric
-            efficiency_values = torch.tensor([0.6, 0.5, 0.4, 0.6, 0.5, 0.4, 0.3, 0.2], dtype=torch.complex64, device=self.device)
-            constraint_matrix[i] = torch.diag(efficiency_values)
+        if virtue_name not in self.virtue_operators:
+            raise ValueError(f"Unknown virtue operator: {virtue_name}")
+        if not 0 <= residue_id < self.n_residues:
+            raise ValueError(f"Residue {residue_id} out of range for {self.n_residues}-residue protein")
         
-        return constraint_matrix
+        virtue_op = self.virtue_operators[virtue_name]
+        virtue_op.residue_overrides[residue_id] = matrix.to(device=self.device, dtype=self.precision.complex_dtype)
+        
+        # ΣCᵢ = N·C + Σ(overrideᵢ - C)
+        aggregate = virtue_op.constraint_matrix * self.n_residues
+        for override in virtue_op.residue_overrides.values():
+            aggregate = aggregate + (override - virtue_op.constraint_matrix)
+        virtue_op.aggregate_matrix = aggregate
+        virtue_op.projector = self._create_projector(aggregate, virtue_op.threshold)
+        self._stage_operators.clear()
+        self._step_operators.clear()
     
-    def _create_projector(self, constraint_matrix: torch.Tensor, threshold: float) -> torch.Tensor:
+    def _create_projector(self, aggregate_matrix: torch.Tensor, threshold: float) -> torch.Tensor:
         """Create projection operator for virtue constraints"""
-        
-        # Project onto subspace where constraint_matrix eigenvalues > threshold
-        # Use CPU for eigenvalue decomposition if MPS doesn't support it
-        matrix_to_decompose = constraint_matrix.sum(dim=0)
-        if matrix_to_decompose.device.type == 'mps':
-            matrix_cpu = matrix_to_decompose.cpu()
-            eigenvals, eigenvecs = torch.linalg.eigh(matrix_cpu)
-            eigenvals = eigenvals.to(self.device)
-            eigenvecs = eigenvecs.to(self.device)
-        else:
-            eigenvals, eigenvecs = torch.linalg.eigh(matrix_to_decompose)
-        
-        # Keep eigenvectors with eigenvalues above threshold
-        valid_mask = eigenvals > threshold
-        valid_eigenvecs = eigenvecs[:, valid_mask]
-        
-        # Create projector P = |ψ⟩⟨ψ| for valid subspace
-        # Convert to complex type to match vQbit amplitudes
-        valid_eigenvecs_complex = valid_eigenvecs.to(torch.complex64)
-        projector = valid_eigenvecs_complex @ torch.conj(valid_eigenvecs_complex).T
-        
-        return projector
+        return _projector_from_aggregate(aggregate_matrix, threshold).to(self.device)
     
     def initialize_from_sequence(self, use_biophysical_priors: bool = True, use_learned_motifs: bool = False, 
-                               neo4j_engine=None) -> None:
+                               neo4j_engine=None, seed: Optional[int] = None,
+                               motif_snapshot: Optional[MotifSnapshot] = None) -> None:
         """
         Phase 1 & 2 Enhancement: Initialize vQbit states directly from sequence using biophysical priors
         and optionally learned motifs from the AKG.
@@ -286,7 +690,11 @@ class ProteinVQbitGraph:
         Args:
             use_biophysical_priors: If True, use amino acid properties to bias initial states
             use_learned_motifs: If True, query AKG for learned structural motifs (Phase 2)
-            neo4j_engine: Neo4j engine for motif queries (required if use_learned_motifs=True)
+            neo4j_engine: Neo4j engine for motif queries (required if use_learned_motifs=True
+                and no motif_snapshot is given)
+            seed: Seed for the random phases/amplitudes. Seeded initializations are
+                deterministic per (sequence, configuration) and served from init_cache.
+            motif_snapshot: Local motif library to use instead of querying neo4j_engine
         """
         
         if use_biophysical_priors:
@@ -294,77 +702,60 @@ class ProteinVQbitGraph:
         else:
             logger.info("Initializing vQbit states with random amplitudes (legacy mode)")
             
-        if use_learned_motifs and neo4j_engine:
+        use_learned_motifs = use_learned_motifs and (neo4j_engine is not None or motif_snapshot is not None)
+        if use_learned_motifs:
             logger.info("Phase 2: Querying AKG for learned motifs to bias initialization")
             
         # Phase 2: Query learned motifs for experience-based seeding
         learned_motifs = []
-        if use_learned_motifs and neo4j_engine:
+        if use_learned_motifs:
             try:
-                from fot.phase2_learning_system import AKGLearningSystem
-                learning_system = AKGLearningSystem(neo4j_engine)
+                if motif_snapshot is None:
+                    from fot.phase2_learning_system import AKGLearningSystem
+                    motif_snapshot = AKGLearningSystem(neo4j_engine).motif_snapshot()
+                
+                # Resolve every 6-residue window against the local snapshot in one pass
+                learned_motifs = motif_snapshot.resolve_windows(self.sequence)
                 
-                # Query motifs for sequence fragments
-                for i in range(0, len(self.sequence), 6):  # Check 6-residue windows
-                    fragment = self.sequence[i:min(i+6, len(self.sequence))]
-                    if len(fragment) >= 4:  # Minimum fragment size
-                        motifs = learning_system.query_learned_motifs(fragment)
-                        for motif in motifs:
-                            motif['query_start'] = i
-                            learned_motifs.append(motif)
-                            
                 logger.info(f"Found {len(learned_motifs)} learned motifs for experience-based seeding")
                 
             except Exception as e:
                 logger.warning(f"Could not query learned motifs: {e}")
         
-        for i in range(self.n_residues):
-            
-            if use_biophysical_priors:
-                # Phase 1: Use biophysical properties to generate initial amplitudes
-                amplitudes = self._generate_biophysical_amplitudes(i)
-                
-                # Phase 2: Apply learned motif bias if available
-                if learned_motifs:
-                    amplitudes = self._apply_motif_bias(amplitudes, i, learned_motifs)
-            else:
-                # Legacy: Random initialization
-                amplitudes = torch.randn(8, dtype=torch.complex64, device=self.device)
-                norm = torch.sqrt(torch.sum(torch.conj(amplitudes) * amplitudes).real)
-                amplitudes = amplitudes / norm
-            
-            # Create basis states for different conformations (unchanged)
-            basis_states = [
-                {'phi': -60, 'psi': -45, 'type': 'alpha_helix'},  # 0
-                {'phi': -70, 'psi': -35, 'type': 'alpha_helix'},  # 1
-                {'phi': -50, 'psi': -55, 'type': 'alpha_helix'},  # 2
-                {'phi': -120, 'psi': 120, 'type': 'beta_sheet'},  # 3
-                {'phi': -130, 'psi': 110, 'type': 'beta_sheet'},  # 4
-                {'phi': -110, 'psi': 130, 'type': 'beta_sheet'},  # 5
-                {'phi': -180, 'psi': 180, 'type': 'extended'},    # 6
-                {'phi': 60, 'psi': 45, 'type': 'left_handed'}     # 7
-            ]
-            
-            # Initialize entanglement map
-            entanglement_map = {}
-            for neighbor in self.akg.neighbors(i):
-                entanglement_map[neighbor] = torch.randn(8, 8, dtype=torch.complex64, device=self.device)
-            
-            # Initialize virtue scores
-            virtue_scores = {
-                'Justice': 0.5,
-                'Honesty': 0.5, 
-                'Temperance': 0.5,
-                'Prudence': 0.5
-            }
-            
-            self.vqbit_states[i] = VQbitState(
-                amplitudes=amplitudes,
-                basis_states=basis_states,
-                residue_id=i,
-                entanglement_map=entanglement_map,
-                virtue_scores=virtue_scores
+        # Seeded initializations without learned motifs are reusable
+        cache_key = None
+        if seed is not None and not learned_motifs:
+            cache_key = self.init_cache.key(
+                self.sequence, {'use_biophysical_priors': use_biophysical_priors, 'seed': int(seed)}
             )
+            cached = self.init_cache.get(cache_key)
+            if cached is not None:
+                self._set_state(cached)
+                logger.info(f"Initialized {self.n_residues} vQbit states from the initialization cache")
+                return
+        
+        if seed is not None:
+            generator = seeded_generator(self.sequence, 'initial_state', seed)
+        else:
+            generator = self._torch_generator()
+        
+        if use_biophysical_priors:
+            # Phase 1: Use biophysical properties to generate initial amplitudes
+            all_amplitudes = self._generate_biophysical_amplitudes(generator)
+            
+            # Phase 2: Apply learned motif bias if available
+            if learned_motifs:
+                for i in range(self.n_residues):
+                    all_amplitudes[i] = self._apply_motif_bias(all_amplitudes[i], i, learned_motifs)
+        else:
+            # Legacy: Random initialization
+            all_amplitudes = torch.randn(self.n_residues, 8, dtype=torch.complex64, generator=generator)
+            all_amplitudes = all_amplitudes / torch.linalg.vector_norm(all_amplitudes, dim=1, keepdim=True)
+        
+        if cache_key is not None:
+            self.init_cache.put(cache_key, all_amplitudes)
+        
+        self._set_state(all_amplitudes)
         
         mode_desc = []
         if use_biophysical_priors:
@@ -424,118 +815,29 @@ class ProteinVQbitGraph:
         norm = torch.sqrt(torch.sum(torch.conj(amplitudes) * amplitudes).real)
         return amplitudes / norm
     
-    def _generate_biophysical_amplitudes(self, residue_index: int) -> torch.Tensor:
-        """
-        Generate physics-based initial amplitudes for a residue based on amino acid properties.
-        
-        This implements the core de novo initialization from Phase 1 of the roadmap.
-        """
-        
-        amino_acid = self.sequence[residue_index]
-        
-        # Biophysical property lookup (simplified Ramachandran propensities)
-        aa_propensities = {
-            'A': [0.3, 0.3, 0.2, 0.1, 0.1, 0.0, 0.0, 0.0],  # Helix-favoring
-            'R': [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Extended/charged
-            'N': [0.1, 0.1, 0.1, 0.3, 0.3, 0.1, 0.0, 0.0],  # Sheet-favoring
-            'D': [0.1, 0.1, 0.1, 0.3, 0.3, 0.1, 0.0, 0.0],  # Sheet-favoring
-            'C': [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Flexible
-            'E': [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Extended/charged
-            'Q': [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Helix/extended
-            'G': [0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.2, 0.2],  # Highly flexible
-            'H': [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Variable
-            'I': [0.3, 0.3, 0.2, 0.1, 0.1, 0.0, 0.0, 0.0],  # Helix/sheet
-            'L': [0.3, 0.3, 0.2, 0.1, 0.1, 0.0, 0.0, 0.0],  # Helix-favoring
-            'K': [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Extended/charged
-            'M': [0.3, 0.3, 0.2, 0.1, 0.1, 0.0, 0.0, 0.0],  # Helix-favoring
-            'F': [0.2, 0.2, 0.1, 0.3, 0.2, 0.0, 0.0, 0.0],  # Sheet-favoring
-            'P': [0.0, 0.0, 0.0, 0.1, 0.1, 0.1, 0.4, 0.3],  # Turn/break
-            'S': [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Flexible
-            'T': [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Flexible
-            'W': [0.2, 0.2, 0.1, 0.3, 0.2, 0.0, 0.0, 0.0],  # Sheet-favoring
-            'Y': [0.2, 0.2, 0.1, 0.3, 0.2, 0.0, 0.0, 0.0],  # Sheet-favoring
-            'V': [0.3, 0.3, 0.2, 0.1, 0.1, 0.0, 0.0, 0.0],  # Helix/sheet
-        }
+    def _generate_biophysical_amplitudes(self, generator: Optional[torch.Generator] = None) -> torch.Tensor:
+        """
+        Generate physics-based initial amplitudes for every residue based on amino acid properties.
         
-        # Get propensities for this amino acid (default to flexible if unknown)
-        propensities = aa_propensities.get(amino_acid, [0.125] * 8)
-        
-        # Add neighbor context effects
-        if residue_index > 0:
-            prev_aa = self.sequence[residue_index - 1]
-            # Proline preceding this residue breaks helices
-            if prev_aa == 'P':
-                propensities[0] *= 0.1  # Reduce helix propensity
-                propensities[1] *= 0.1
-                propensities[2] *= 0.1
-        
-        if residue_index < len(self.sequence) - 1:
-            next_aa = self.sequence[residue_index + 1]
-            # Proline following this residue affects angles
-            if next_aa == 'P':
-                propensities[6] *= 2.0  # Increase extended propensity
-                propensities[7] *= 2.0
+        This implements the core de novo initialization from Phase 1 of the roadmap:
+        magnitudes from the propensity table, random phases from `generator`.
+        """
         
-        # Convert to complex amplitudes with random phases
-        propensities_tensor = torch.tensor(propensities, dtype=torch.float32, device=self.device)
-        phases = torch.rand(8, device=self.device) * 2 * np.pi
+        propensities = sequence_propensities(self.sequence)
         
-        amplitudes = torch.sqrt(propensities_tensor) * torch.exp(1j * phases)
+        # Convert to complex amplitudes with random phases
+        phases = torch.rand(self.n_residues, 8, generator=generator) * 2 * np.pi
+        amplitudes = torch.sqrt(propensities) * torch.exp(1j * phases)
         
         # Normalize
-        norm = torch.sqrt(torch.sum(torch.conj(amplitudes) * amplitudes).real)
-        if norm > 1e-10:
-            amplitudes = amplitudes / norm
+        norms = torch.linalg.vector_norm(amplitudes, dim=1, keepdim=True)
+        amplitudes = torch.where(norms > 1e-10, amplitudes / norms.clamp_min(1e-10), amplitudes)
         
         return amplitudes.to(torch.complex64)
 
-    def initialize_vqbit_states(self) -> None:
-        """Legacy method - calls initialize_from_sequence for backward compatibility"""
-        self.initialize_from_sequence(use_biophysical_priors=False)
-        
-        # Legacy initialization code preserved for compatibility
-        for i in range(self.n_residues):
-            
-            # Create random initial amplitudes (normalized)
-            amplitudes = torch.randn(8, dtype=torch.complex64, device=self.device)
-            # Use manual normalization for complex numbers
-            norm = torch.sqrt(torch.sum(torch.conj(amplitudes) * amplitudes).real)
-            amplitudes = amplitudes / norm
-            
-            # Create basis states for different conformations
-            basis_states = [
-                {'phi': -60, 'psi': -45, 'type': 'alpha_helix'},  # 0
-                {'phi': -70, 'psi': -35, 'type': 'alpha_helix'},  # 1
-                {'phi': -50, 'psi': -55, 'type': 'alpha_helix'},  # 2
-                {'phi': -120, 'psi': 120, 'type': 'beta_sheet'},  # 3
-                {'phi': -130, 'psi': 110, 'type': 'beta_sheet'},  # 4
-                {'phi': -110, 'psi': 130, 'type': 'beta_sheet'},  # 5
-                {'phi': -180, 'psi': 180, 'type': 'extended'},    # 6
-                {'phi': 60, 'psi': 45, 'type': 'left_handed'}     # 7
-            ]
-            
-            # Initialize entanglement map
-            entanglement_map = {}
-            for neighbor in self.akg.neighbors(i):
-                entanglement_map[neighbor] = torch.randn(8, 8, dtype=torch.complex64, device=self.device)
-            
-            # Initialize virtue scores
-            virtue_scores = {
-                'Justice': 0.5,
-                'Honesty': 0.5, 
-                'Temperance': 0.5,
-                'Prudence': 0.5
-            }
-            
-            self.vqbit_states[i] = VQbitState(
-                amplitudes=amplitudes,
-                basis_states=basis_states,
-                residue_id=i,
-                entanglement_map=entanglement_map,
-                virtue_scores=virtue_scores
-            )
-        
-        logger.info(f"Initialized {len(self.vqbit_states)} vQbit states")
+    def initialize_vqbit_states(self, seed: Optional[int] = None) -> None:
+        """Legacy method - random amplitude initialization for backward compatibility"""
+        self.initialize_from_sequence(use_biophysical_priors=False, seed=seed)
     
     def apply_virtue_constraints(self, virtue_name: str) -> None:
         """Apply virtue constraint operator to all vQbit states"""
@@ -543,27 +845,111 @@ class ProteinVQbitGraph:
         if virtue_name not in self.virtue_operators:
             raise ValueError(f"Unknown virtue operator: {virtue_name}")
         
-        virtue_op = self.virtue_operators[virtue_name]
+        # Project all residues at once and renormalize
+        projected, norms, scores = self._project_stages((virtue_name,), self.amplitudes)
         
-        for i, vqbit in self.vqbit_states.items():
-            
-            # Apply virtue projector to amplitudes
-            current_state = vqbit.amplitudes.view(8, 1)
-            projected_state = virtue_op.projector @ current_state
+        # Residues whose projection vanishes keep their state
+        valid = norms[0] > 1e-10
+        self.amplitudes = torch.where(valid.unsqueeze(1), projected[0], self.amplitudes)
+        self.coherence = torch.where(valid, norms[0] ** 2, self.coherence)
+        
+        # Update virtue score ⟨ψ|ΣC|ψ⟩ for every residue
+        self.virtue_scores[:, VIRTUE_NAMES.index(virtue_name)] = scores[0]
+        
+        logger.info(f"Applied {virtue_name} virtue constraints to all vQbits")
+    
+    def apply_all_virtue_constraints(self, virtue_names: Tuple[str, ...] = VIRTUE_NAMES) -> None:
+        """
+        Apply a sequence of virtue constraint operators in one batched pass
+        
+        Equivalent to calling apply_virtue_constraints for each name in order.
+        Because normalization is a per-residue scalar, the state after stage k
+        is the normalized image of the cumulative projector Pₖ···P₁, so every
+        intermediate state comes out of a single einsum.
+        """
+        
+        for virtue_name in virtue_names:
+            if virtue_name not in self.virtue_operators:
+                raise ValueError(f"Unknown virtue operator: {virtue_name}")
+        
+        start_amplitudes = self.amplitudes
+        staged, norms, scores = self._project_stages(tuple(virtue_names), start_amplitudes)
+        
+        self.amplitudes = staged[-1]
+        self.coherence = norms[-1] ** 2
+        for stage, virtue_name in enumerate(virtue_names):
+            self.virtue_scores[:, VIRTUE_NAMES.index(virtue_name)] = scores[stage]
+        
+        # Residues whose projection vanished at some stage follow the
+        # sequential semantics (state kept, later stages applied to it)
+        degenerate = (norms <= 1e-10).any(dim=0)
+        if degenerate.any():
+            batched_amplitudes, batched_coherence = self.amplitudes, self.coherence
+            self.amplitudes = start_amplitudes
+            for virtue_name in virtue_names:
+                self.apply_virtue_constraints(virtue_name)
+            self.amplitudes = torch.where(degenerate.unsqueeze(1), self.amplitudes, batched_amplitudes)
+            self.coherence = torch.where(degenerate, self.coherence, batched_coherence)
+        
+        logger.debug(f"Applied {', '.join(virtue_names)} virtue constraints to all vQbits")
+    
+    def _staged_operators(self, virtue_names: Tuple[str, ...]) -> Tuple[torch.Tensor, torch.Tensor, bool]:
+        """
+        Cumulative projectors Pₖ···P₁ and aggregate constraints for a virtue sequence
+        
+        Returns (K, 8, 8) complex operators, or (K, 16, 16) real operators
+        acting on (re, im) pairs when the precision policy asks for split
+        projection and every operator is real. Cached until an operator changes.
+        """
+        
+        cached = self._stage_operators.get(virtue_names)
+        if cached is None:
+            operators = [self.virtue_operators[name] for name in virtue_names]
             
-            # Renormalize (manual for complex numbers)
-            norm = torch.sqrt(torch.sum(torch.conj(projected_state) * projected_state).real)
-            if norm > 1e-10:
-                projected_state = projected_state / norm
-                vqbit.amplitudes = projected_state.view(8)
+            cumulative = [operators[0].projector]
+            for virtue_op in operators[1:]:
+                cumulative.append(virtue_op.projector @ cumulative[-1])
+            cumulative = torch.stack(cumulative)
+            aggregates = torch.stack([virtue_op.aggregate_matrix for virtue_op in operators])
             
-            # Update virtue score
-            virtue_score = torch.real(
-                torch.conj(projected_state).T @ virtue_op.constraint_matrix.sum(dim=0) @ projected_state
-            ).item()
-            vqbit.virtue_scores[virtue_name] = virtue_score
+            split = self.precision.split_projection and \
+                is_effectively_real(cumulative) and is_effectively_real(aggregates)
+            if split:
+                real_dtype = self.precision.real_dtype
+                cached = (split_operator(cumulative, real_dtype), split_operator(aggregates, real_dtype), True)
+            else:
+                cached = (cumulative, aggregates, False)
+            self._stage_operators[virtue_names] = cached
         
-        logger.info(f"Applied {virtue_name} virtue constraints to all vQbits")
+        return cached
+    
+    def _project_stages(self, virtue_names: Tuple[str, ...],
+                        amplitudes: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """
+        Project (N, 8) amplitudes through every cumulative stage of a virtue sequence
+        
+        Returns the (K, N, 8) renormalized stage states (rows whose projection
+        vanished are left unnormalized), the (K, N) projection norms and the
+        (K, N) virtue scores ⟨ψ|ΣC|ψ⟩ of each stage.
+        """
+        
+        cumulative, aggregates, split = self._staged_operators(virtue_names)
+        
+        if split:
+            # Interleaved (N, 16) real view: [re₀, im₀, re₁, im₁, …]
+            pairs = torch.view_as_real(amplitudes).reshape(self.n_residues, 16)
+            staged = pairs @ cumulative.transpose(1, 2)
+            norms = torch.linalg.vector_norm(staged, dim=2)
+            staged = torch.where((norms > 1e-10).unsqueeze(2), staged / norms.clamp_min(1e-10).unsqueeze(2), staged)
+            scores = torch.einsum('kni,kij,knj->kn', staged, aggregates, staged)
+            staged = torch.view_as_complex(staged.reshape(len(virtue_names), self.n_residues, 8, 2))
+        else:
+            staged = torch.einsum('kij,nj->kni', cumulative, amplitudes)
+            norms = torch.linalg.vector_norm(staged, dim=2)
+            staged = torch.where((norms > 1e-10).unsqueeze(2), staged / norms.clamp_min(1e-10).unsqueeze(2), staged)
+            scores = torch.einsum('kni,kij,knj->kn', torch.conj(staged), aggregates, staged).real
+        
+        return staged, norms, scores
     
     def virtue_guided_collapse(self, target_conformations: int = 5, 
                               collapse_rounds: int = 3) -> List[Dict[str, Any]]:
@@ -574,6 +960,12 @@ class ProteinVQbitGraph:
         which iteratively applies virtue operators to collapse the quantum
         superposition into a small ensemble of high-potential conformations.
         
+        Every conformation collapses from the state prepared by the caller.
+        The collapse rounds are deterministic, so the collapsed state is
+        computed once for the first conformation and once for the evolved
+        variant shared by the rest; all conformations are then drawn together
+        with a single batched measurement per variant.
+        
         Args:
             target_conformations: Number of final conformations to generate
             collapse_rounds: Number of virtue application rounds
@@ -584,11 +976,20 @@ class ProteinVQbitGraph:
         
         logger.info(f"Starting virtue-guided collapse to {target_conformations} conformations")
         
-        collapsed_conformations = []
+        # Start with current quantum state
+        prepared_state = self._snapshot_state()
+        initial_fot = self.calculate_fot_equation()
+        
+        # Conformation 0 collapses without evolution, the rest with a small
+        # quantum evolution per round for diversity
+        variant_counts = {False: min(target_conformations, 1), True: max(target_conformations - 1, 0)}
         
-        for conf_idx in range(target_conformations):
-            # Start with current quantum state
-            initial_fot = self.calculate_fot_equation()
+        collapsed_conformations = []
+        for evolve, count in variant_counts.items():
+            if count == 0:
+                continue
+            
+            self._restore_state(prepared_state)
             
             # Apply virtue operators iteratively for collapse
             for round_idx in range(collapse_rounds):
@@ -598,187 +999,176 @@ class ProteinVQbitGraph:
                 # Apply Temperance operator (energy landscape assessment) 
                 self.apply_virtue_constraints('Temperance')
                 
-                # Optional: Add small quantum evolution for diversity
-                if conf_idx > 0:
+                if evolve:
                     self.evolve_entangled_states(time_step=0.05)
             
-            # Measure current state to get discrete conformation
-            measured_conf = self.measure_conformation()
+            # Measure the collapsed state `count` times in one batched draw
+            indices, probabilities = self.measure_ensemble(count)
+            virtue_rows = self.virtue_scores.tolist()
+            overall_virtue = self.virtue_scores.mean(dim=1)
             
-            # Calculate final FoT value after collapse
-            final_fot = self.calculate_fot_equation()
+            # After measurement every residue is a unit basis vector, so the
+            # final FoT only depends on the virtue scores
+            final_fot = self._calculate_graph_factor() * overall_virtue.sum().item()
+            avg_virtue_score = overall_virtue.mean().item()
             
-            # Extract conformational coordinates
-            conformation_coords = []
-            total_virtue_score = 0.0
-            
-            for residue_id, measurement in measured_conf.items():
-                conf_data = measurement['conformation']
-                virtue_scores = measurement['virtue_scores']
+            for draw_indices, draw_probabilities in zip(indices.tolist(), probabilities.tolist()):
+                # Extract conformational coordinates
+                conformation_coords = []
+                for residue_id, (basis_index, probability) in enumerate(zip(draw_indices, draw_probabilities)):
+                    conf_data = BASIS_STATES[basis_index]
+                    conformation_coords.append({
+                        'residue_index': residue_id,
+                        'amino_acid': self.sequence[residue_id],
+                        'phi': conf_data['phi'],
+                        'psi': conf_data['psi'],
+                        'conformation_type': conf_data['type'],
+                        'measurement_probability': probability,
+                        'virtue_scores': dict(zip(VIRTUE_NAMES, virtue_rows[residue_id]))
+                    })
                 
-                conformation_coords.append({
-                    'residue_index': residue_id,
-                    'amino_acid': measurement['residue_type'],
-                    'phi': conf_data['phi'],
-                    'psi': conf_data['psi'],
-                    'conformation_type': conf_data['type'],
-                    'measurement_probability': measurement['probability'],
-                    'virtue_scores': virtue_scores
+                # Store collapsed conformation
+                collapsed_conformations.append({
+                    'conformation_id': len(collapsed_conformations),
+                    'coordinates': conformation_coords,
+                    'initial_fot_value': initial_fot,
+                    'final_fot_value': final_fot,
+                    'average_virtue_score': avg_virtue_score,
+                    'collapse_rounds_applied': collapse_rounds,
+                    'total_residues': self.n_residues,
+                    'collapse_quality': final_fot / max(initial_fot, 1e-10)  # Improvement ratio
                 })
-                
-                total_virtue_score += sum(virtue_scores.values()) / len(virtue_scores)
-            
-            avg_virtue_score = total_virtue_score / len(measured_conf)
-            
-            # Store collapsed conformation
-            collapsed_conformation = {
-                'conformation_id': conf_idx,
-                'coordinates': conformation_coords,
-                'initial_fot_value': initial_fot,
-                'final_fot_value': final_fot,
-                'average_virtue_score': avg_virtue_score,
-                'collapse_rounds_applied': collapse_rounds,
-                'total_residues': len(measured_conf),
-                'collapse_quality': final_fot / max(initial_fot, 1e-10)  # Improvement ratio
-            }
             
-            collapsed_conformations.append(collapsed_conformation)
-            
-            # Re-initialize for next conformation with slight variation
-            if conf_idx < target_conformations - 1:
-                self.initialize_from_sequence(use_biophysical_priors=True)
+            # Leave the graph collapsed onto the last drawn conformation
+            self._collapse_to(indices[-1])
         
         # Sort by collapse quality (best improvement first)
         collapsed_conformations.sort(key=lambda x: x['collapse_quality'], reverse=True)
         
         logger.info(f"Virtue-guided collapse completed. Generated {len(collapsed_conformations)} conformations")
-        logger.info(f"Best collapse quality: {collapsed_conformations[0]['collapse_quality']:.3f}")
+        if collapsed_conformations:
+            logger.info(f"Best collapse quality: {collapsed_conformations[0]['collapse_quality']:.3f}")
         
         return collapsed_conformations
     
+    def _snapshot_state(self) -> Dict[str, torch.Tensor]:
+        """Copy of the state tensors for later restoration"""
+        return {
+            'amplitudes': self.amplitudes.clone(),
+            'coherence': self.coherence.clone(),
+            'virtue_scores': self.virtue_scores.clone()
+        }
+    
+    def _restore_state(self, snapshot: Dict[str, torch.Tensor]) -> None:
+        """Restore state tensors from a snapshot (the snapshot stays reusable)"""
+        self.amplitudes = snapshot['amplitudes'].clone()
+        self.coherence = snapshot['coherence'].clone()
+        self.virtue_scores = snapshot['virtue_scores'].clone()
+    
     def evolve_entangled_states(self, time_step: float = 0.1) -> None:
         """Evolve vQbit states using graph Laplacian entanglement"""
         
-        # Create system state vector
-        all_amplitudes = torch.stack([vqbit.amplitudes for vqbit in self.vqbit_states.values()])
-        system_state = all_amplitudes.view(-1)
-        
-        # Create entanglement Hamiltonian using graph Laplacian
-        # H = -J * (I ⊗ L) where J is coupling strength, L is Laplacian
-        identity_8 = torch.eye(8, device=self.device, dtype=torch.complex64)
-        hamiltonian = -1.0 * torch.kron(self.laplacian_matrix.to(torch.complex64), identity_8)
-        
-        # Time evolution: |ψ(t+dt)⟩ = exp(-iH*dt)|ψ(t)⟩
-        # Use CPU for matrix exponentiation if MPS doesn't support it
-        hamiltonian_scaled = -1j * hamiltonian * time_step
-        if hamiltonian_scaled.device.type == 'mps':
-            hamiltonian_cpu = hamiltonian_scaled.cpu()
-            evolution_operator = torch.matrix_exp(hamiltonian_cpu).to(self.device)
-        else:
-            evolution_operator = torch.matrix_exp(hamiltonian_scaled)
-        
-        evolved_state = evolution_operator @ system_state
-        
-        # Update individual vQbit states
-        evolved_amplitudes = evolved_state.view(self.n_residues, 8)
-        for i, vqbit in self.vqbit_states.items():
-            vqbit.amplitudes = evolved_amplitudes[i]
+        # Entanglement Hamiltonian H = -J * (L ⊗ I) factorizes, so
+        # exp(-iH*dt) = exp(iJ*L*dt) ⊗ I acts on the (N, 8) matrix directly
+        self.amplitudes = self._ensure_propagator().apply(self.amplitudes, time_step)
+    
+    def _ensure_propagator(self):
+        """Build the spectral (dense) or Krylov (sparse) propagator on first use"""
+        if self.propagator is None:
+            if self.laplacian_backend == 'sparse':
+                self.propagator = KrylovPropagator(self.laplacian_csr, coupling_strength=1.0)
+            else:
+                self.propagator = SpectralPropagator(self.laplacian_matrix, coupling_strength=1.0,
+                                                     dtype=self.precision.complex_dtype)
+        return self.propagator
     
     def amplitude_amplification_search(self, target_virtue_threshold: float = 0.8, 
                                      max_iterations: int = 100) -> List[int]:
         """
         Grover-like amplitude amplification to find high-virtue conformations
+        
+        Runs the optimal number of rounds for the marked fraction (see
+        amplification_rounds), capped at max_iterations.
         """
         
-        high_virtue_residues = []
+        # Oracle: mark states with high virtue scores, (N, 8)
+        oracle_mask = self._virtue_oracle_mask(target_virtue_threshold)
+        high_virtue = oracle_mask[:, 0]
         
-        for iteration in range(max_iterations):
-            
-            # Apply oracle: mark states with high virtue scores
-            self._apply_virtue_oracle(target_virtue_threshold)
-            
-            # Apply diffusion operator (reflection about average)
-            self._apply_diffusion_operator()
-            
-            # Check for convergence
-            current_high_virtue = self._count_high_virtue_residues(target_virtue_threshold)
-            
-            if len(current_high_virtue) > len(high_virtue_residues):
-                high_virtue_residues = current_high_virtue
-            
-            # Early stopping if most residues meet threshold
-            if len(high_virtue_residues) > 0.8 * self.n_residues:
-                break
+        rounds = int(amplification_rounds(high_virtue.sum(), self.n_residues, max_iterations))
+        phase = 1.0 - 2.0 * oracle_mask.to(self.amplitudes.dtype)
+        
+        for iteration in range(rounds):
+            self.amplitudes = grover_step(self.amplitudes, phase)
         
-        logger.info(f"Amplitude amplification found {len(high_virtue_residues)} high-virtue residues")
+        high_virtue_residues = high_virtue.nonzero().view(-1).tolist()
+        logger.debug(f"Amplitude amplification found {len(high_virtue_residues)} high-virtue residues "
+                     f"in {rounds} rounds")
         return high_virtue_residues
     
-    def _apply_virtue_oracle(self, threshold: float) -> None:
-        """Oracle operator: marks high-virtue states"""
-        
-        for i, vqbit in self.vqbit_states.items():
-            
-            # Calculate overall virtue score
-            overall_virtue = np.mean(list(vqbit.virtue_scores.values()))
-            
-            # Apply phase flip to high-virtue states
-            if overall_virtue > threshold:
-                vqbit.amplitudes = -vqbit.amplitudes
+    def _virtue_oracle_mask(self, threshold: float) -> torch.Tensor:
+        """Oracle mask over (N, 8): every component of residues whose mean virtue exceeds threshold"""
+        overall_virtue = self.virtue_scores.mean(dim=1)
+        return (overall_virtue > threshold).unsqueeze(1).expand(self.n_residues, 8)
     
-    def _apply_diffusion_operator(self) -> None:
-        """Diffusion operator: reflection about average amplitude"""
+    def measurement_probabilities(self) -> torch.Tensor:
+        """(N, 8) Born-rule measurement probabilities |aᵢ|²"""
         
-        # Calculate average amplitude across all states
-        all_amplitudes = torch.stack([vqbit.amplitudes for vqbit in self.vqbit_states.values()])
-        average_amplitude = torch.mean(all_amplitudes, dim=0)
+        probabilities = torch.real(torch.conj(self.amplitudes) * self.amplitudes)
         
-        # Apply diffusion: 2|avg⟩⟨avg| - I
-        for i, vqbit in self.vqbit_states.items():
-            vqbit.amplitudes = 2 * average_amplitude - vqbit.amplitudes
-            
-            # Renormalize (manual for complex numbers)
-            norm = torch.sqrt(torch.sum(torch.conj(vqbit.amplitudes) * vqbit.amplitudes).real)
-            if norm > 1e-10:
-                vqbit.amplitudes = vqbit.amplitudes / norm
+        # Residues with a vanished state measure uniformly
+        empty = probabilities.sum(dim=1, keepdim=True) <= 0
+        return torch.where(empty, torch.full_like(probabilities, 1.0 / 8), probabilities)
     
-    def _count_high_virtue_residues(self, threshold: float) -> List[int]:
-        """Count residues with virtue scores above threshold"""
+    def measure_ensemble(self, n_conformations: int) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Draw an ensemble of conformations without collapsing the state
+        
+        All K × N residue measurements come from a single batched multinomial
+        over the (N, 8) probabilities.
         
-        high_virtue = []
-        for i, vqbit in self.vqbit_states.items():
-            overall_virtue = np.mean(list(vqbit.virtue_scores.values()))
-            if overall_virtue > threshold:
-                high_virtue.append(i)
+        Returns:
+            (K, N) basis state indices and (K, N) measurement probabilities
+        """
         
-        return high_virtue
+        probabilities = self.measurement_probabilities()
+        generator = self._torch_generator()
+        if generator is None:
+            indices = torch.multinomial(probabilities, n_conformations, replacement=True)
+        else:
+            # RNG contexts hold CPU generators
+            indices = torch.multinomial(probabilities.cpu(), n_conformations, replacement=True,
+                                        generator=generator).to(probabilities.device)
+        return indices.T, probabilities.gather(1, indices).T
+    
+    def _collapse_to(self, basis_indices: torch.Tensor) -> None:
+        """Collapse every residue onto the given (N,) basis state indices"""
+        collapsed = torch.zeros_like(self.amplitudes)
+        collapsed.scatter_(1, basis_indices.view(-1, 1).to(self.amplitudes.device), 1.0)
+        self.amplitudes = collapsed
     
     def measure_conformation(self) -> Dict[int, Dict[str, Any]]:
         """
         Measurement operator: collapse vQbit states to definite conformations
         """
         
-        measured_conformations = {}
+        # Sample from probability distribution (one draw for all residues)
+        indices, probabilities = self.measure_ensemble(1)
         
-        for i, vqbit in self.vqbit_states.items():
-            
-            # Calculate measurement probabilities
-            probabilities = torch.real(torch.conj(vqbit.amplitudes) * vqbit.amplitudes)
-            
-            # Sample from probability distribution
-            sampled_index = torch.multinomial(probabilities, 1).item()
-            
-            # Collapse to measured state
-            collapsed_amplitudes = torch.zeros_like(vqbit.amplitudes)
-            collapsed_amplitudes[sampled_index] = 1.0
-            vqbit.amplitudes = collapsed_amplitudes
-            
-            # Record measured conformation
-            measured_conformations[i] = {
+        # Collapse to measured state
+        self._collapse_to(indices[0])
+        
+        # Record measured conformations
+        virtue_rows = self.virtue_scores.tolist()
+        measured_conformations = {
+            i: {
                 'residue_type': self.sequence[i],
-                'conformation': vqbit.basis_states[sampled_index],
-                'probability': probabilities[sampled_index].item(),
-                'virtue_scores': vqbit.virtue_scores.copy()
+                'conformation': BASIS_STATES[sampled_index],
+                'probability': probability,
+                'virtue_scores': dict(zip(VIRTUE_NAMES, virtue_rows[i]))
             }
+            for i, (sampled_index, probability) in enumerate(zip(indices[0].tolist(), probabilities[0].tolist()))
+        }
         
         logger.info(f"Measured conformations for {len(measured_conformations)} residues")
         return measured_conformations
@@ -788,107 +1178,282 @@ class ProteinVQbitGraph:
         Calculate Field of Truth equation: FoT(t) = AKG(∑aᵢVᵢ)
         """
         
-        # Calculate virtue sum: ∑aᵢVᵢ
-        virtue_sum = 0.0
+        # aᵢ = amplitude weights (probability amplitudes), (N,)
+        amplitude_weights = torch.real(torch.conj(self.amplitudes) * self.amplitudes).sum(dim=1)
         
-        for i, vqbit in self.vqbit_states.items():
-            # aᵢ = amplitude weights (probability amplitudes)
-            amplitude_weights = torch.real(torch.conj(vqbit.amplitudes) * vqbit.amplitudes)
-            
-            # Vᵢ = virtue scores
-            overall_virtue = np.mean(list(vqbit.virtue_scores.values()))
-            
-            # Weighted contribution
-            weighted_virtue = torch.sum(amplitude_weights).item() * overall_virtue
-            virtue_sum += weighted_virtue
+        # Vᵢ = overall virtue score per residue, (N,)
+        overall_virtue = self.virtue_scores.mean(dim=1)
+        
+        # Calculate virtue sum: ∑aᵢVᵢ
+        virtue_sum = torch.dot(amplitude_weights, overall_virtue)
         
         # AKG integration using graph structure
         # Use graph properties to modulate the virtue sum
-        graph_factor = self._calculate_graph_factor()
+        fot_value = self._calculate_graph_factor() * virtue_sum.item()
         
-        fot_value = graph_factor * virtue_sum
-        
-        logger.info(f"FoT equation calculated: {fot_value:.6f}")
+        logger.debug(f"FoT equation calculated: {fot_value:.6f}")
         return fot_value
     
     def _calculate_graph_factor(self) -> float:
         """Calculate AKG graph factor for FoT equation"""
         
-        # Use graph connectivity and entanglement properties
-        avg_clustering = nx.average_clustering(self.akg)
-        graph_density = nx.density(self.akg)
+        # Use graph connectivity and entanglement properties (cached invariants)
+        return self.graph_invariants.graph_factor
+    
+    def _compiled_step_operators(self, virtue_names: Tuple[str, ...],
+                                 time_step: float) -> Optional[Tuple[torch.Tensor, ...]]:
+        """
+        Real operators for fot_step, or None when the step does not apply
         
-        # Combine graph metrics
-        graph_factor = (avg_clustering + graph_density) / 2.0
+        The compiled step needs a dense propagator and real virtue operators;
+        sparse (Krylov) graphs and complex residue overrides use the eager
+        path. Cached until an operator changes.
+        """
         
-        return graph_factor
+        key = (virtue_names, float(time_step))
+        if key not in self._step_operators:
+            operators = None
+            if self.laplacian_backend == 'sparse':
+                logger.debug("Compiled FoT step needs a dense propagator; using the eager path")
+            else:
+                virtue_ops = [self.virtue_operators[name] for name in virtue_names]
+                cumulative = [virtue_ops[0].projector]
+                for virtue_op in virtue_ops[1:]:
+                    cumulative.append(virtue_op.projector @ cumulative[-1])
+                cumulative = torch.stack(cumulative)
+                aggregates = torch.stack([virtue_op.aggregate_matrix for virtue_op in virtue_ops])
+                
+                if is_effectively_real(cumulative) and is_effectively_real(aggregates):
+                    real_dtype = self.precision.real_dtype
+                    propagator = self._ensure_propagator().propagator(time_step)
+                    operators = (cumulative.real.to(real_dtype), aggregates.real.to(real_dtype),
+                                 propagator.real.to(real_dtype), propagator.imag.to(real_dtype))
+                else:
+                    logger.debug("Compiled FoT step needs real virtue operators; using the eager path")
+            self._step_operators[key] = operators
+        
+        return self._step_operators[key]
+    
+    def _compiled_iteration(self, step: CompiledStep, operators: Tuple[torch.Tensor, ...]) -> Optional[float]:
+        """
+        Constraints, evolution and FoT of one iteration through a compiled step
+        
+        Returns the FoT value, or None (state untouched) when a projection
+        vanished and the iteration has to take the eager path.
+        """
+        
+        real_dtype = self.precision.real_dtype
+        state = torch.stack([self.amplitudes.real, self.amplitudes.imag]).to(real_dtype)
+        evolved, coherence, virtue_scores, norms, fot_sum = step(state, *operators)
+        if bool((norms <= 1e-10).any()):
+            return None
+        
+        self.amplitudes = torch.complex(evolved[0], evolved[1]).to(self.precision.complex_dtype)
+        self.coherence = coherence
+        self.virtue_scores = virtue_scores.contiguous()
+        return self._calculate_graph_factor() * fot_sum.item()
+    
+    def _checkpoint_parameters(self, method: str, max_iterations: int, init_seed: Optional[int]) -> Dict[str, Any]:
+        """Run parameters recorded in (and checked against) checkpoints of this graph"""
+        rng_seed = None
+        if self.rng is not None:
+            rng_seed = (self.rng.seed_sequence.entropy, tuple(self.rng.seed_sequence.spawn_key))
+        return {'sequence': self.sequence, 'precision': self.precision.name, 'method': method,
+                'max_iterations': max_iterations, 'init_seed': init_seed, 'rng_seed': rng_seed}
+    
+    def _make_checkpoint(self, parameters: Dict[str, Any], next_iteration: int, best_fot: float,
+                         best_iteration: int, fot_history: List[float],
+                         convergence: ConvergenceController) -> OptimizationCheckpoint:
+        """Snapshot of a running optimization, taken after an iteration"""
+        context_rng_state = None
+        if self.rng is not None:
+            context_rng_state = {'numpy': self.rng.numpy.bit_generator.state, 'torch': self.rng.torch.get_state()}
+        
+        return OptimizationCheckpoint(
+            **parameters,
+            iteration=next_iteration,
+            amplitudes=self.amplitudes,
+            coherence=self.coherence,
+            virtue_scores=self.virtue_scores,
+            best_fot=best_fot,
+            best_iteration=best_iteration,
+            fot_history=fot_history,
+            convergence_state=convergence.state_dict(),
+            context_rng_state=context_rng_state
+        )
+    
+    def _restore_checkpoint(self, checkpoint: OptimizationCheckpoint, convergence: ConvergenceController) -> None:
+        """Load state tensors, the graph's RNG streams and convergence progress from a checkpoint"""
+        self.amplitudes = checkpoint.amplitudes.to(device=self.device, dtype=self.precision.complex_dtype)
+        self.coherence = checkpoint.coherence.to(device=self.device, dtype=self.precision.real_dtype)
+        self.virtue_scores = checkpoint.virtue_scores.to(device=self.device, dtype=self.precision.real_dtype)
+        
+        if self.rng is not None and checkpoint.context_rng_state is not None:
+            self.rng.numpy.bit_generator.state = checkpoint.context_rng_state['numpy']
+            self.rng.torch.set_state(checkpoint.context_rng_state['torch'])
+        
+        convergence.load_state_dict(checkpoint.convergence_state)
     
     def run_fot_optimization(self, max_iterations: int = 1000, 
-                           convergence_threshold: float = 1e-6) -> Dict[str, Any]:
+                           convergence_threshold: float = 1e-6,
+                           convergence: Optional[ConvergenceController] = None,
+                           init_seed: Optional[int] = None,
+                           step_backend: Optional[str] = None,
+                           checkpoint: Optional[Union[str, Path, FoTCheckpointer]] = None,
+                           initial_amplitudes: Optional[torch.Tensor] = None,
+                           final_measurement: bool = True,
+                           method: str = 'projection',
+                           gradient_optimizer: str = 'adam',
+                           learning_rate: Optional[float] = None) -> Dict[str, Any]:
         """
         Run complete Field of Truth optimization
+        
+        Args:
+            max_iterations: Iteration cap
+            convergence_threshold: Threshold for the default LagConvergence rule
+            convergence: Convergence controller (defaults to LagConvergence)
+            init_seed: Seed for a deterministic (cacheable) initial state
+            step_backend: Run constraints, evolution and FoT of each iteration
+                as one fused step ('fused', 'torchscript', 'inductor' or
+                'auto', see fot.vqbit_compile). None keeps the op-by-op path.
+            checkpoint: Checkpoint file or FoTCheckpointer. The run resumes from
+                an existing checkpoint written with the same sequence,
+                precision, method, max_iterations, init_seed and RNG seed
+                (others are discarded), saves periodically and removes the
+                file when it finishes (see fot.vqbit_checkpoint).
+            initial_amplitudes: (N, 8) starting state instead of a fresh
+                initialization (init_seed is then ignored)
+            final_measurement: Collapse the state onto measured conformations at
+                the end. When False the optimized superposition is left in
+                self.amplitudes and 'final_conformations' is None.
+            method: 'projection' iterates virtue projection, evolution and
+                amplitude amplification; 'gradient' maximizes a differentiable
+                FoT surrogate with autograd (see fot.vqbit_gradient) and
+                ignores step_backend
+            gradient_optimizer: 'adam' or 'lbfgs' for method='gradient'
+            learning_rate: Step size for method='gradient' (optimizer default if None)
         """
         
-        logger.info("Starting FoT optimization with vQbit mathematics")
+        if method not in FOT_METHODS:
+            raise ValueError(f"Unknown FoT optimization method: {method} (expected one of {FOT_METHODS})")
+        
+        logger.info(f"Starting FoT optimization with vQbit mathematics ({method})")
+        
+        if convergence is None:
+            convergence = LagConvergence(threshold=convergence_threshold)
+        convergence.reset()
+        
+        step = CompiledStep(step_backend) if step_backend is not None and method == 'projection' else None
         
         # Initialize vQbit states
-        self.initialize_vqbit_states()
+        if initial_amplitudes is None:
+            self.initialize_vqbit_states(seed=init_seed)
+        else:
+            self._set_state(initial_amplitudes)
+        
+        step_operators = self._compiled_step_operators(VIRTUE_NAMES, 0.1) if step is not None else None
         
         fot_history = []
+        best_fot, best_iteration = float('-inf'), -1
+        start_iteration = 0
         converged = False
-        
-        for iteration in range(max_iterations):
+        telemetry = IterationTelemetry()
+        
+        if checkpoint is not None:
+            if not isinstance(checkpoint, FoTCheckpointer):
+                checkpoint = FoTCheckpointer(checkpoint)
+            checkpoint.reset()
+            checkpoint_parameters = self._checkpoint_parameters(method, max_iterations, init_seed)
+            saved = checkpoint.load(checkpoint_parameters)
+            if saved is not None:
+                start_iteration, fot_history = saved.iteration, saved.fot_history
+                best_fot, best_iteration = saved.best_fot, saved.best_iteration
+                self._restore_checkpoint(saved, convergence)
+                logger.info(f"Resuming FoT optimization from iteration {start_iteration}")
+        
+        # Optimizer moments are not checkpointed; a resumed run restarts them from the saved state
+        gradient = GradientFoTOptimizer(self, gradient_optimizer, learning_rate, VIRTUE_NAMES) \
+            if method == 'gradient' else None
+        
+        for iteration in range(start_iteration, max_iterations):
             
-            # Apply virtue constraints in sequence
-            for virtue_name in ['Justice', 'Honesty', 'Temperance', 'Prudence']:
-                self.apply_virtue_constraints(virtue_name)
+            fot_value = None
+            if gradient is not None:
+                fot_value = gradient.step()
+            elif step_operators is not None:
+                fot_value = self._compiled_iteration(step, step_operators)
             
-            # Evolve entangled states
-            self.evolve_entangled_states()
+            if fot_value is None:
+                # Apply virtue constraints in sequence
+                self.apply_all_virtue_constraints(VIRTUE_NAMES)
+                
+                # Evolve entangled states
+                self.evolve_entangled_states()
             
             # Amplitude amplification search
-            if iteration % 10 == 0:  # Every 10 iterations
+            if gradient is None and iteration % 10 == 0:  # Every 10 iterations
                 high_virtue_residues = self.amplitude_amplification_search()
+                fot_value = None
             
             # Calculate FoT value
-            fot_value = self.calculate_fot_equation()
+            if fot_value is None:
+                fot_value = self.calculate_fot_equation()
             fot_history.append(fot_value)
+            telemetry.record(iteration, fot_value)
+            if fot_value > best_fot:
+                best_fot, best_iteration = fot_value, iteration
             
             # Check convergence
-            if iteration > 10:
-                recent_change = abs(fot_history[-1] - fot_history[-10])
-                if recent_change < convergence_threshold:
-                    converged = True
-                    break
+            amplitudes = self.amplitudes if convergence.needs_amplitudes else None
+            if convergence.update(iteration, fot_value, amplitudes):
+                converged = convergence.converged
+                break
             
-            if iteration % 100 == 0:
-                logger.info(f"Iteration {iteration}: FoT = {fot_value:.6f}")
+            if checkpoint is not None and checkpoint.due():
+                checkpoint.save(self._make_checkpoint(checkpoint_parameters, iteration + 1, best_fot, best_iteration,
+                                                      fot_history, convergence))
+        
+        telemetry_records = telemetry.flush()
+        if checkpoint is not None:
+            checkpoint.complete()
+        if gradient is not None:
+            gradient.finalize()
+        
+        results = self._optimization_results(converged, fot_history, best_fot, best_iteration, telemetry_records,
+                                             convergence, final_measurement)
+        if checkpoint is not None:
+            results['checkpoint'] = checkpoint.stats()
+        
+        logger.info(f"FoT optimization completed: FoT = {results['final_fot_value']:.6f}")
+        return results
+    
+    def _optimization_results(self, converged: bool, fot_history: List[float], best_fot: float,
+                              best_iteration: int, telemetry_records: List[Dict[str, float]],
+                              convergence: ConvergenceController,
+                              final_measurement: bool = True) -> Dict[str, Any]:
+        """Final measurement and result dict of a finished optimization (shared with fot.vqbit_batch)"""
         
-        # Final measurement
-        final_conformations = self.measure_conformation()
+        final_conformations = self.measure_conformation() if final_measurement else None
         final_fot = self.calculate_fot_equation()
         
-        results = {
+        return {
             'converged': converged,
-            'iterations': iteration + 1,
+            'iterations': len(fot_history),
             'final_fot_value': final_fot,
+            'best_fot_value': best_fot if fot_history else final_fot,
+            'best_iteration': best_iteration,
             'fot_history': fot_history,
             'final_conformations': final_conformations,
-            'graph_properties': {
-                'nodes': self.akg.number_of_nodes(),
-                'edges': self.akg.number_of_edges(),
-                'clustering': nx.average_clustering(self.akg),
-                'density': nx.density(self.akg)
-            }
+            'graph_properties': self.graph_invariants.as_properties(),
+            'telemetry': telemetry_records,
+            'convergence': convergence.trace()
         }
-        
-        logger.info(f"FoT optimization completed: FoT = {final_fot:.6f}")
-        return results
 
 
     def analyze_protein_sequence(self, sequence: str, num_iterations: int = 100, 
                                include_provenance: bool = True, use_de_novo: bool = False,
-                               use_learned_motifs: bool = False, neo4j_engine=None) -> Dict[str, Any]:
+                               use_learned_motifs: bool = False, neo4j_engine=None,
+                               checkpoint: Optional[Union[str, Path, FoTCheckpointer]] = None) -> Dict[str, Any]:
         """
         Legacy interface for compatibility with existing discovery system.
         
@@ -899,6 +1464,7 @@ class ProteinVQbitGraph:
             use_de_novo: Whether to use Phase 1 de novo initialization
             use_learned_motifs: Whether to use Phase 2 learned motif biasing
             neo4j_engine: Neo4j engine for Phase 2 motif queries
+            checkpoint: Checkpoint file or FoTCheckpointer for resumable optimization
             
         Returns:
             Analysis results in legacy format
@@ -921,7 +1487,7 @@ class ProteinVQbitGraph:
                 logger.info("Using legacy random initialization")
             
             # Run FoT optimization
-            results = self.run_fot_optimization(max_iterations=num_iterations)
+            results = self.run_fot_optimization(max_iterations=num_iterations, checkpoint=checkpoint)
             
             # Convert to legacy format expected by ValidatedDiscoverySystem
             legacy_results = {
@@ -952,6 +1518,31 @@ class ProteinVQbitGraph:
             }
 
 
+def resume_fot_optimization(checkpoint_path: Union[str, Path], device: str = "cpu",
+                            **kwargs) -> Optional[Dict[str, Any]]:
+    """
+    Finish an interrupted run_fot_optimization from its checkpoint file
+    
+    Rebuilds the graph for the checkpointed sequence and precision, with its
+    RNGContext if the run had one, and runs it with the checkpointed method,
+    init_seed and iteration cap. Returns None when there is no usable
+    checkpoint. kwargs go to run_fot_optimization (e.g. the convergence
+    controller the interrupted run used).
+    """
+    
+    saved = OptimizationCheckpoint.load(checkpoint_path)
+    if saved is None:
+        return None
+    
+    rng = None
+    if saved.rng_seed is not None:
+        entropy, spawn_key = saved.rng_seed
+        rng = RNGContext.from_seed_sequence(np.random.SeedSequence(entropy, spawn_key=spawn_key))
+    graph = ProteinVQbitGraph(saved.sequence, device=device, precision=saved.precision, rng=rng)
+    return graph.run_fot_optimization(max_iterations=saved.max_iterations, init_seed=saved.init_seed,
+                                      method=saved.method, checkpoint=checkpoint_path, **kwargs)
+
+
 def run_vqbit_protein_folding(sequence: str, device: str = "cpu") -> Dict[str, Any]:
     """
     Run complete vQbit-based protein folding analysis
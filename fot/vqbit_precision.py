@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Numeric Precision Policies for the vQbit Engine
+
+ProteinVQbitGraph keeps its amplitudes, virtue operators, propagators and
+scores in the dtypes named by a PrecisionPolicy:
+
+- 'reference': complex128 state and operators, float64 scores. Slowest;
+  used as the ground truth for accuracy checks.
+- 'default': complex64 state and operators, float32 scores (the engine's
+  historical behaviour).
+- 'reduced': complex64 evolution, but virtue projection runs on float32
+  (re, im) pairs. The virtue projectors are real, so projecting a complex
+  state is a real matmul with P ⊗ I₂ on the interleaved (N, 16) view of the
+  amplitudes; complex-valued operators (e.g. custom residue overrides) fall
+  back to the complex path.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Union
+
+import torch
+
+
+@dataclass(frozen=True)
+class PrecisionPolicy:
+    """Dtypes used for vQbit state, operators and scores"""
+    name: str
+    complex_dtype: torch.dtype  # Amplitudes, virtue operators, propagators
+    real_dtype: torch.dtype  # Coherence, virtue scores, FoT accumulation
+    split_projection: bool = False  # Project with real (re, im) pairs when operators are real
+
+
+PRECISION_POLICIES: Dict[str, PrecisionPolicy] = {
+    'reference': PrecisionPolicy('reference', torch.complex128, torch.float64),
+    'default': PrecisionPolicy('default', torch.complex64, torch.float32),
+    'reduced': PrecisionPolicy('reduced', torch.complex64, torch.float32, split_projection=True),
+}
+
+
+def resolve_precision(precision: Union[str, PrecisionPolicy, None]) -> PrecisionPolicy:
+    """Look up a policy by name (None means 'default'); policies pass through"""
+    if precision is None:
+        return PRECISION_POLICIES['default']
+    if isinstance(precision, PrecisionPolicy):
+        return precision
+    if precision not in PRECISION_POLICIES:
+        raise ValueError(f"Unknown precision mode: {precision} (expected one of {sorted(PRECISION_POLICIES)})")
+    return PRECISION_POLICIES[precision]
+
+
+def is_effectively_real(matrix: torch.Tensor, rtol: float = 1e-6) -> bool:
+    """Whether a complex operator's imaginary part is rounding noise"""
+    if not matrix.is_complex():
+        return True
+    scale = matrix.real.abs().max().clamp_min(1e-30)
+    return bool(matrix.imag.abs().max() <= rtol * scale)
+
+
+def split_operator(matrix: torch.Tensor, real_dtype: torch.dtype = torch.float32) -> torch.Tensor:
+    """
+    Real (…, 16, 16) operator acting on interleaved (re, im) pairs
+
+    For a real 8×8 operator A, A·(x + iy) = Ax + iAy, which on the
+    view_as_real layout [x₀, y₀, x₁, y₁, …] is the Kronecker product A ⊗ I₂.
+    """
+    real_part = matrix.real if matrix.is_complex() else matrix
+    identity_2 = torch.eye(2, dtype=real_dtype, device=matrix.device)
+    if real_part.dim() == 2:
+        return torch.kron(real_part.to(real_dtype), identity_2)
+    return torch.stack([torch.kron(block.to(real_dtype), identity_2) for block in real_part])
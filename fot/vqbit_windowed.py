@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Windowed Domain-Decomposition vQbit Solver for Long Chains
+
+ProteinVQbitGraph couples the whole chain, so optimization cost grows
+super-linearly with length. WindowedVQbitSolver instead:
+
+1. splits the sequence into overlapping windows (default 128 residues with
+   16 residues of overlap),
+2. optimizes every window as an independent ProteinVQbitGraph, optionally in
+   a process pool with a per-worker thread budget,
+3. blends the windows into one (N, 8) state: each window is phase-aligned to
+   the blended state over its overlap, and overlapping residues are mixed
+   with linear ramp weights that sum to one before renormalization,
+4. runs a short global refinement of the blended state on the full chain.
+
+Only the refinement touches the full graph, and it runs a few iterations
+rather than the full optimization.
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import torch
+
+from fot.thread_budget import budgeted_process_pool
+from fot.vqbit_init_cache import sequence_seed
+from fot.vqbit_mathematics import ProteinVQbitGraph
+from fot.vqbit_precision import PrecisionPolicy
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW = 128
+DEFAULT_OVERLAP = 16
+
+
+def window_spans(n_residues: int, window: int = DEFAULT_WINDOW, overlap: int = DEFAULT_OVERLAP) -> List[Tuple[int, int]]:
+    """
+    [start, end) spans of overlapping windows covering a chain
+
+    Consecutive windows share `overlap` residues; the last window is shifted
+    back so that it is full length (its overlap with the previous window may
+    then be larger).
+    """
+    if window <= 0 or not 0 <= overlap < window:
+        raise ValueError(f"Need window > overlap >= 0, got window={window}, overlap={overlap}")
+    if n_residues <= window:
+        return [(0, n_residues)]
+
+    stride = window - overlap
+    spans = [(start, start + window) for start in range(0, n_residues - window, stride)]
+    spans.append((n_residues - window, n_residues))
+    return spans
+
+
+def _optimize_window(task: Tuple[str, int, Optional[int], Any, str]) -> Tuple[torch.Tensor, float, int]:
+    """Optimize one window; returns its unmeasured (n, 8) state, final FoT and iteration count"""
+    subsequence, max_iterations, init_seed, precision, device = task
+    graph = ProteinVQbitGraph(subsequence, device=device, precision=precision)
+    results = graph.run_fot_optimization(max_iterations=max_iterations, init_seed=init_seed,
+                                         final_measurement=False)
+    return graph.amplitudes.cpu(), results['final_fot_value'], results['iterations']
+
+
+def blend_windows(n_residues: int, spans: List[Tuple[int, int]],
+                  window_states: List[torch.Tensor]) -> torch.Tensor:
+    """
+    Stitch per-window (n, 8) states into one normalized (N, 8) state
+
+    Windows are merged left to right. Each window is rotated by the global
+    phase that best aligns it with the blended state over their overlap, then
+    mixed in with weights ramping linearly from the blended state to the
+    window across the overlap.
+    """
+    blended = torch.zeros((n_residues, 8), dtype=window_states[0].dtype)
+    covered_end = 0
+
+    for (start, end), state in zip(spans, window_states):
+        n_overlap = max(0, covered_end - start)
+        if n_overlap:
+            previous = blended[start:covered_end]
+            overlap = torch.sum(torch.conj(state[:n_overlap]) * previous)
+            if overlap.abs() > 1e-12:
+                state = state * (overlap / overlap.abs())
+
+            ramp = torch.arange(1, n_overlap + 1, dtype=torch.float64) / (n_overlap + 1)
+            ramp = ramp.to(state.real.dtype).unsqueeze(1)
+            blended[start:covered_end] = (1 - ramp) * previous + ramp * state[:n_overlap]
+
+        blended[start + n_overlap:end] = state[n_overlap:]
+        covered_end = end
+
+    norms = torch.linalg.vector_norm(blended, dim=1, keepdim=True)
+    return torch.where(norms > 1e-10, blended / norms.clamp_min(1e-10), blended)
+
+
+class WindowedVQbitSolver:
+    """
+    Overlapping-window FoT optimization with global refinement
+
+    Args:
+        sequence: Protein sequence
+        window: Residues per window
+        overlap: Residues shared by consecutive windows
+        n_workers: Worker processes for the window optimizations (1 = in process)
+        device: Torch device for every graph
+        precision: Precision mode or policy (see fot.vqbit_precision)
+    """
+
+    def __init__(self, sequence: str, window: int = DEFAULT_WINDOW, overlap: int = DEFAULT_OVERLAP,
+                 n_workers: int = 1, device: str = "cpu",
+                 precision: Union[str, PrecisionPolicy, None] = None):
+        self.sequence = sequence
+        self.window = window
+        self.overlap = overlap
+        self.n_workers = n_workers
+        self.device = device
+        self.precision = precision
+        self.spans = window_spans(len(sequence), window, overlap)
+        self.graph: Optional[ProteinVQbitGraph] = None  # Full-chain graph, built for refinement
+
+    def _window_tasks(self, max_iterations: int, init_seed: Optional[int]) -> List[Tuple]:
+        tasks = []
+        for start, end in self.spans:
+            seed = None if init_seed is None else sequence_seed(self.sequence, init_seed, 'window', start)
+            tasks.append((self.sequence[start:end], max_iterations, seed, self.precision, self.device))
+        return tasks
+
+    def run(self, max_iterations: int = 1000, refinement_iterations: int = 20,
+            init_seed: Optional[int] = None, **refinement_kwargs: Any) -> Dict[str, Any]:
+        """
+        Optimize all windows, blend them and refine on the full chain
+
+        Args:
+            max_iterations: Iteration cap per window
+            refinement_iterations: Iteration cap of the global refinement
+            init_seed: Seed for deterministic window initializations
+            refinement_kwargs: Passed to the refinement's run_fot_optimization
+                (e.g. convergence, step_backend)
+
+        Returns:
+            The refinement's run_fot_optimization results plus 'windows'
+            (per-window span, FoT and iterations) and 'timing'
+        """
+
+        logger.info(f"Windowed FoT optimization: {len(self.sequence)} residues in {len(self.spans)} "
+                     f"windows of {self.window} (overlap {self.overlap})")
+
+        start = time.perf_counter()
+        tasks = self._window_tasks(max_iterations, init_seed)
+        if self.n_workers > 1 and len(tasks) > 1:
+            with budgeted_process_pool(min(self.n_workers, len(tasks))) as executor:
+                window_results = list(executor.map(_optimize_window, tasks))
+        else:
+            window_results = [_optimize_window(task) for task in tasks]
+        windows_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        blended = blend_windows(len(self.sequence), self.spans, [state for state, _, _ in window_results])
+        blend_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        self.graph = ProteinVQbitGraph(self.sequence, device=self.device, precision=self.precision)
+        results = self.graph.run_fot_optimization(max_iterations=refinement_iterations,
+                                                  initial_amplitudes=blended, **refinement_kwargs)
+        refinement_s = time.perf_counter() - start
+
+        results['windows'] = [
+            {'start': span[0], 'end': span[1], 'final_fot_value': fot, 'iterations': iterations}
+            for span, (_, fot, iterations) in zip(self.spans, window_results)
+        ]
+        results['timing'] = {'windows_s': windows_s, 'blend_s': blend_s, 'refinement_s': refinement_s,
+                             'total_s': windows_s + blend_s + refinement_s}
+
+        logger.info(f"Windowed FoT optimization completed: FoT = {results['final_fot_value']:.6f} "
+                    f"({results['timing']['total_s']:.2f}s)")
+        return results
+
+
+def run_windowed_vqbit_optimization(sequence: str, window: int = DEFAULT_WINDOW, overlap: int = DEFAULT_OVERLAP,
+                                    n_workers: int = 1, device: str = "cpu",
+                                    precision: Union[str, PrecisionPolicy, None] = None,
+                                    **kwargs: Any) -> Dict[str, Any]:
+    """Convenience wrapper around WindowedVQbitSolver(...).run(**kwargs)"""
+    return WindowedVQbitSolver(sequence, window, overlap, n_workers, device, precision).run(**kwargs)
@@ -15,10 +15,11 @@ import time
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Tuple, Optional
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import as_completed
 from dataclasses import dataclass
 
 from rigorous_scientific_discovery import run_rigorous_discovery
+from fot.thread_budget import budgeted_process_pool
 
 # Configure logging
 logging.basicConfig(
@@ -352,7 +353,8 @@ class LargeScaleDiscoveryEngine:
         
         results = []
         
-        with ProcessPoolExecutor(max_workers=self.max_parallel_workers) as executor:
+        # Workers split the cores instead of each using every core
+        with budgeted_process_pool(self.max_parallel_workers) as executor:
             # Submit all jobs
             future_to_sequence = {
                 executor.submit(self._process_single_sequence, seq): seq 
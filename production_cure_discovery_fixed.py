@@ -434,7 +434,7 @@ class ProductionCureDiscoveryEngine:
         
         # Validate energy physics
         energy_validation = self.physics_validator.validate_energy_physics(
-            classical_results.get('all_energies', []),
+            classical_results.get('energy_samples', []),
             len(sequence)
         )
         
@@ -513,7 +513,7 @@ class ProductionCureDiscoveryEngine:
             aggregation_propensity=pathological_indicators.get('aggregation_propensity', 0.0),
             stability_analysis={
                 'mean_energy': classical_results.get('mean_energy', 0.0),
-                'energy_variance': np.var(classical_results.get('all_energies', [0]))
+                'energy_variance': classical_results.get('std_energy', 0.0) ** 2
             },
             druggability_score=druggability_score,
             confidence_level=confidence_level,
@@ -17,8 +17,20 @@ from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 import logging
 
+from fot.ensemble_cache import EnsembleCache, FoldingEnsemble, default_ensemble_cache
+from fot.ramachandran_grid import RamachandranEnergyGrid, RamachandranGridCache, default_grid_cache
+from fot.rng_context import RNGContext
+from fot.streaming_stats import FoldingStatistics, structure_fractions
+from fot.thread_budget import budgeted_process_pool
+
 logger = logging.getLogger(__name__)
 
+# run_folding_simulation sampling modes
+FOLDING_METHODS = ('independent', 'mcmc')
+
+# Part of the ensemble cache key: bump when the independent sampler's draws change
+SAMPLER_VERSION = 1
+
 @dataclass
 class RamachandranState:
     """A single conformational state with real phi/psi angles"""
@@ -39,18 +51,34 @@ class RigorousProteinFolder:
     - Validation against experimental structures
     """
     
-    def __init__(self, sequence: str, temperature: float = 298.15):
+    def __init__(self, sequence: str, temperature: float = 298.15, rng: Optional[RNGContext] = None,
+                 grid_cache: Optional[RamachandranGridCache] = None,
+                 ensemble_cache: Optional[EnsembleCache] = None):
         self.sequence = sequence
         self.n_residues = len(sequence)
         self.temperature = temperature  # Kelvin
         self.kT = 0.593 * temperature / 298.15  # kcal/mol at T
         
+        # Sampling RNG: the context's numpy Generator, or one seeded from the global np.random state
+        self.rng = rng
+        self.np_random = rng.numpy if rng is not None else np.random.default_rng(
+            np.random.randint(np.iinfo(np.int64).max))
+        
         # Ramachandran regions (from experimental data)
         self.ramachandran_regions = self._define_ramachandran_regions()
         
         # Amino acid properties (from experimental data)
         self.aa_properties = self._define_amino_acid_properties()
         
+        # Tabulated Ramachandran energy per residue class (built or loaded on first use)
+        self.grid_cache = grid_cache if grid_cache is not None else default_grid_cache()
+        self._energy_grids: Dict[str, RamachandranEnergyGrid] = {}
+        self._local_energies: Optional[np.ndarray] = None
+        
+        # Seeded ensembles shared with other folders of this sequence (None disables caching, see
+        # run_folding_simulation)
+        self.ensemble_cache = ensemble_cache if ensemble_cache is not None else default_ensemble_cache()
+        
         # Current conformational state
         self.conformational_states: List[RamachandranState] = []
         
@@ -186,6 +214,22 @@ class RigorousProteinFolder:
         
         return min_energy
     
+    def ramachandran_energies(self, residue_idx: int, phi: np.ndarray, psi: np.ndarray) -> np.ndarray:
+        """
+        Vectorized calculate_ramachandran_energy from the residue class's energy grid
+        
+        Agrees with the scalar region loop to within 5e-3 kcal/mol (see
+        fot.ramachandran_grid).
+        """
+        
+        aa_type = self.sequence[residue_idx]
+        grid = self._energy_grids.get(aa_type)
+        if grid is None:
+            aa_props = self.aa_properties.get(aa_type, self.aa_properties['A'])
+            grid = self.grid_cache.grid(self.ramachandran_regions, aa_props, self.kT)
+            self._energy_grids[aa_type] = grid
+        return grid.energies(phi, psi)
+    
     def calculate_local_interactions(self, residue_idx: int, phi: float, psi: float) -> float:
         """Calculate local interaction energies (simplified)"""
         
@@ -211,42 +255,73 @@ class RigorousProteinFolder:
         
         return interaction_energy
     
-    def sample_conformation(self) -> List[RamachandranState]:
-        """Sample conformational state using Boltzmann statistics"""
+    def local_interaction_energies(self) -> np.ndarray:
+        """(N,) calculate_local_interactions for every residue (the term does not depend on phi/psi)"""
+        
+        if self._local_energies is None:
+            residues = list(self.sequence)
+            negative = np.isin(residues, ['D', 'E'])
+            positive = np.isin(residues, ['K', 'R', 'H'])
+            hydrophobic = np.array([self.aa_properties[aa]['hydrophobicity'] > 0 for aa in residues])
+            
+            # Salt bridges and hydrophobic contacts between sequence neighbors i, i+1
+            pair_energy = -2.0 * ((negative[:-1] & positive[1:]) | (positive[:-1] & negative[1:])) \
+                - 0.5 * (hydrophobic[:-1] & hydrophobic[1:])
+            energies = np.zeros(self.n_residues)
+            energies[:-1] += pair_energy
+            energies[1:] += pair_energy
+            self._local_energies = energies
+        
+        return self._local_energies
+    
+    def trial_energies(self, trials: np.ndarray) -> np.ndarray:
+        """Total energies (N, T) of (N, T, 2) trial (phi, psi) angles, one row per residue"""
         
-        conformations = []
+        energies = np.empty(trials.shape[:2])
+        residue_types = np.array(list(self.sequence))
+        for aa_type in np.unique(residue_types):
+            rows = np.flatnonzero(residue_types == aa_type)
+            energies[rows] = self.ramachandran_energies(rows[0], trials[rows, :, 0], trials[rows, :, 1])
         
-        for i in range(self.n_residues):
-            
-            # Sample phi, psi angles
-            best_energy = float('inf')
-            best_state = None
-            
-            # Try multiple random conformations and keep the best
-            for _ in range(100):  # Monte Carlo sampling
-                
-                phi = np.random.uniform(-180, 180)
-                psi = np.random.uniform(-180, 180)
-                
-                # Calculate total energy
-                rama_energy = self.calculate_ramachandran_energy(i, phi, psi)
-                local_energy = self.calculate_local_interactions(i, phi, psi)
-                total_energy = rama_energy + local_energy
-                
-                # Accept/reject based on Boltzmann factor
-                if total_energy < best_energy or np.random.random() < np.exp(-(total_energy - best_energy) / self.kT):
-                    best_energy = total_energy
-                    best_state = RamachandranState(
-                        phi=phi,
-                        psi=psi, 
-                        energy=total_energy,
-                        probability=np.exp(-total_energy / self.kT),
-                        valid=total_energy < 5.0  # Reasonable energy cutoff
-                    )
-            
-            conformations.append(best_state)
+        return energies + self.local_interaction_energies()[:, None]
+    
+    def _sample_arrays(self, n_trials: int = 100) -> Tuple[np.ndarray, np.ndarray]:
+        """sample_conformation as (N, 2) chosen angles and (N,) energies"""
         
-        return conformations
+        trials = self.np_random.uniform(-180, 180, size=(self.n_residues, n_trials, 2))
+        energies = self.trial_energies(trials)
+        
+        # Categorical draw per residue: first trial whose cumulative Boltzmann weight exceeds u
+        weights = np.exp(-(energies - energies.min(axis=1, keepdims=True)) / self.kT)
+        cumulative = np.cumsum(weights, axis=1)
+        u = self.np_random.random(self.n_residues) * cumulative[:, -1]
+        chosen = np.minimum((cumulative <= u[:, None]).sum(axis=1), n_trials - 1)
+        
+        rows = np.arange(self.n_residues)
+        return trials[rows, chosen], energies[rows, chosen]
+    
+    def _states(self, angles: np.ndarray, energies: np.ndarray) -> List[RamachandranState]:
+        """RamachandranStates for (N, 2) angles and their (N,) energies"""
+        return [
+            RamachandranState(
+                phi=phi,
+                psi=psi,
+                energy=energy,
+                probability=np.exp(-energy / self.kT),
+                valid=energy < 5.0  # Reasonable energy cutoff
+            )
+            for (phi, psi), energy in zip(angles.tolist(), energies.tolist())
+        ]
+    
+    def sample_conformation(self, n_trials: int = 100) -> List[RamachandranState]:
+        """
+        Sample conformational state using Boltzmann statistics
+        
+        All residues' trials are drawn as one (N, n_trials, 2) array, scored
+        together, and each residue picks one trial from the Boltzmann
+        (softmax of -E/kT) distribution over its trials.
+        """
+        return self._states(*self._sample_arrays(n_trials))
     
     def analyze_secondary_structure(self, conformations: List[RamachandranState]) -> Dict[str, float]:
         """Analyze secondary structure content from conformations"""
@@ -299,51 +374,353 @@ class RigorousProteinFolder:
         
         return min(1.0, aggregation_score)
     
-    def run_folding_simulation(self, n_samples: int = 1000) -> Dict[str, any]:
-        """Run complete folding simulation with multiple conformational samples"""
-        
-        print(f"🔬 Running rigorous folding simulation ({n_samples} samples)...")
-        
-        all_conformations = []
-        all_energies = []
+    def run_mcmc(self, n_samples: int, burn_in: Optional[int] = None, thin: Optional[int] = None,
+                 move_residues: int = 1, step_size: float = 120.0,
+                 statistics: Optional[FoldingStatistics] = None) -> Dict[str, any]:
+        """
+        Metropolis sampling of the Boltzmann distribution over residue (phi, psi) angles
+        
+        Each step perturbs a random segment of move_residues consecutive
+        residues by Gaussian angle moves (step_size degrees, wrapped) and
+        accepts with min(1, exp(-ΔE/kT)).
+        Only the moved residues' Ramachandran terms are re-evaluated; the
+        neighbor interaction terms do not depend on the angles, so they are
+        carried unchanged. The chain starts from sample_conformation(), runs
+        burn_in steps and records every thin-th step after that.
+        
+        Sample energies are totals including the -8 kcal/mol per residue
+        baseline of run_folding_simulation.
+        
+        Args:
+            n_samples: Recorded samples
+            burn_in: Steps discarded before recording (default 10·N)
+            thin: Steps between recorded samples (default N, one sweep)
+            move_residues: Consecutive residues perturbed per step
+            step_size: Standard deviation of the angle moves (degrees)
+            statistics: Accumulator receiving every sample (energy and
+                secondary-structure fractions) instead of the 'energies' list
+        
+        Returns:
+            'energies' (total energy of every sample, only without
+            statistics), 'best_angles' and 'best_energies' ((N, 2) angles and
+            (N,) residue energies of the lowest-energy sample) and
+            'acceptance_rate'
+        """
+        
+        n = self.n_residues
+        burn_in = 10 * n if burn_in is None else burn_in
+        thin = n if thin is None else thin
+        move_residues = min(move_residues, n)
+        n_steps = burn_in + n_samples * thin
+        
+        angles = np.array([[state.phi, state.psi] for state in self.sample_conformation()])
+        residue_energies = self.trial_energies(angles[:, None, :])[:, 0]
+        total_energy = float(residue_energies.sum()) + self.baseline_energy()
+        
+        # Per-residue grids and all random numbers of the chain, drawn up front
+        for i in range(n):
+            self.ramachandran_energies(i, angles[i:i + 1, 0], angles[i:i + 1, 1])
+        grids = [self._energy_grids[aa] for aa in self.sequence]
+        local_energies = self.local_interaction_energies().tolist()
+        starts = self.np_random.integers(0, n - move_residues + 1, size=n_steps)
+        moved = starts[:, None] + np.arange(move_residues)
+        moves = self.np_random.normal(0.0, step_size, size=(n_steps, move_residues, 2))
+        log_u = np.log(self.np_random.random(n_steps))
+        
+        # The chain itself runs on Python floats: each step touches only a few residues
+        angles, residue_energies = angles.tolist(), residue_energies.tolist()
+        energies = []
+        best_energy, best_angles, best_energies = float('inf'), list(angles), list(residue_energies)
+        accepted = 0
+        for step, (residues, step_moves, log_threshold) in enumerate(zip(moved.tolist(), moves.tolist(), log_u.tolist())):
+            proposal = []
+            delta = 0.0
+            for i, (d_phi, d_psi) in zip(residues, step_moves):
+                phi = (angles[i][0] + d_phi + 180.0) % 360.0 - 180.0
+                psi = (angles[i][1] + d_psi + 180.0) % 360.0 - 180.0
+                energy = grids[i].energy(phi, psi) + local_energies[i]
+                delta += energy - residue_energies[i]
+                proposal.append((i, [phi, psi], energy))
+            
+            # Metropolis criterion on the local energy change
+            if delta <= 0 or log_threshold < -delta / self.kT:
+                for i, residue_angles, energy in proposal:
+                    angles[i] = residue_angles
+                    residue_energies[i] = energy
+                total_energy += delta
+                accepted += 1
+            
+            if step >= burn_in and (step - burn_in + 1) % thin == 0:
+                if statistics is None:
+                    energies.append(total_energy)
+                else:
+                    sample_angles = np.array(angles)
+                    statistics.update(total_energy, structure_fractions(sample_angles[:, 0], sample_angles[:, 1]))
+                if total_energy < best_energy:
+                    best_energy, best_angles, best_energies = total_energy, list(angles), list(residue_energies)
         
+        results = {
+            'best_angles': np.array(best_angles),
+            'best_energies': np.array(best_energies),
+            'acceptance_rate': accepted / n_steps if n_steps else 0.0,
+        }
+        if statistics is None:
+            results['energies'] = energies
+        return results
+    
+    def baseline_energy(self) -> float:
+        """Baseline stabilization added to every sample's total energy"""
+        # CORRECTED: Scale to realistic protein energies (-200 to -400 kcal/mol)
+        return -8.0 * self.n_residues  # ~-8 kcal/mol per residue
+    
+    def new_statistics(self, reservoir_size: int = 1000) -> FoldingStatistics:
+        """Empty sample accumulator for this sequence, with the reservoir seeded from the folder's RNG"""
+        reservoir_rng = self.rng.stage('reservoir').numpy if self.rng is not None else None
+        return FoldingStatistics(self.n_residues, reservoir_size=reservoir_size, rng=reservoir_rng)
+    
+    def _run_chain(self, n_samples: int, method: str, statistics: FoldingStatistics,
+                   retain_conformations: bool = False,
+                   **mcmc_kwargs) -> Tuple[List[List[RamachandranState]], Optional[float]]:
+        """
+        Feed n_samples samples into statistics
+        
+        Leaves (angles, residue energies) of the lowest-energy sample in
+        statistics.best_payload. Returns the retained conformations (empty
+        unless retain_conformations and the independent method) and the
+        Metropolis acceptance rate (None for the independent method).
+        """
+        
+        if method == 'mcmc':
+            chain = self.run_mcmc(n_samples, statistics=statistics, **mcmc_kwargs)
+            statistics.best_payload = (chain['best_angles'], chain['best_energies'])
+            print(f"   Metropolis acceptance rate: {chain['acceptance_rate']:.1%}")
+            return [], chain['acceptance_rate']
+        
+        all_conformations: List[List[RamachandranState]] = []
+        baseline_energy = self.baseline_energy()
         for sample in range(n_samples):
             
             # Sample conformation
-            conformations = self.sample_conformation()
-            all_conformations.append(conformations)
+            angles, energies = self._sample_arrays()
             
             # Calculate total energy
-            total_energy = sum(conf.energy for conf in conformations)
-            
-            # CORRECTED: Scale to realistic protein energies (-200 to -400 kcal/mol)
-            # Add baseline stabilization energy per residue
-            baseline_energy = -8.0 * self.n_residues  # ~-8 kcal/mol per residue
-            total_energy += baseline_energy
-            
-            all_energies.append(total_energy)
+            total_energy = float(energies.sum()) + baseline_energy
+            statistics.update(total_energy, structure_fractions(angles[:, 0], angles[:, 1]),
+                              payload=(angles, energies))
+            if retain_conformations:
+                all_conformations.append(self._states(angles, energies))
             
             if sample % 100 == 0:
                 print(f"   Sample {sample}/{n_samples}: Energy = {total_energy:.2f} kcal/mol")
         
-        # Find lowest energy conformation
-        min_energy_idx = np.argmin(all_energies)
-        best_conformation = all_conformations[min_energy_idx]
+        return all_conformations, None
+    
+    def ensemble_key(self, reservoir_size: int) -> str:
+        """Ensemble cache key of this folder's seeded independent-method samples"""
+        return self.ensemble_cache.key(self.sequence, self.temperature,
+                                       (SAMPLER_VERSION, 'independent', reservoir_size), self.rng.seed_sequence)
+    
+    def top_up_ensemble(self, ensemble: Optional[FoldingEnsemble], n_samples: int,
+                        reservoir_size: int) -> FoldingEnsemble:
+        """
+        Extend a cached independent-method ensemble of this folder's seed to n_samples
+        
+        Sampling resumes from the ensemble's saved RNG position (from the
+        seed itself without an ensemble), so the result equals a fresh
+        n_samples run; the folder's own generator is left where it was.
+        Ensembles that already hold n_samples are returned unchanged, and
+        ensembles holding more are rejected.
+        """
+        
+        if ensemble is None:
+            # Start from the seed itself, however far this folder's generator has advanced
+            start_state = RNGContext.from_seed_sequence(self.rng.seed_sequence).numpy.bit_generator.state
+            ensemble = FoldingEnsemble(self.new_statistics(reservoir_size), start_state)
+        
+        reused = ensemble.n_samples
+        if reused > n_samples:
+            raise ValueError(f"Cached ensemble holds {reused} samples, more than the {n_samples} requested")
+        logger.info(f"Ensemble cache: reusing {reused} samples, topping up {n_samples - reused}")
+        if reused < n_samples:
+            # Sample from the ensemble's RNG position, then hand the folder its own generator back
+            own_state = self.np_random.bit_generator.state
+            self.np_random.bit_generator.state = ensemble.rng_state
+            try:
+                self._run_chain(n_samples - reused, 'independent', ensemble.statistics)
+                ensemble.rng_state = self.np_random.bit_generator.state
+            finally:
+                self.np_random.bit_generator.state = own_state
+        return ensemble
+    
+    def _run_chains(self, n_samples: int, n_chains: int, n_workers: int, method: str, reservoir_size: int,
+                    retain_conformations: bool, mcmc_kwargs: Dict[str, any],
+                    cached: bool = False) -> Tuple[List[Tuple], int]:
+        """
+        _folding_chain results of n_chains seeded chains, in chain order
+        
+        With cached=True every chain is looked up in the ensemble cache under
+        its own seed, topped up in its worker and stored back. Returns the
+        results and the number of samples reused from the cache.
+        """
+        
+        base = self.rng if self.rng is not None else RNGContext.from_seed_sequence(np.random.SeedSequence())
+        chain_samples = [n_samples // n_chains + (k < n_samples % n_chains) for k in range(n_chains)]
+        chain_rngs = [base.stage(f'chain-{k}') for k in range(n_chains)]
+        
+        keys, ensembles = [None] * n_chains, [None] * n_chains
+        if cached:
+            for k, chain_rng in enumerate(chain_rngs):
+                keys[k] = self.ensemble_cache.key(self.sequence, self.temperature,
+                                                  (SAMPLER_VERSION, 'independent', reservoir_size),
+                                                  chain_rng.seed_sequence)
+                ensembles[k] = self.ensemble_cache.get(keys[k], max_samples=chain_samples[k])
+        previous_counts = [ensemble.n_samples if ensemble is not None else 0 for ensemble in ensembles]
+        
+        # Workers use the process-wide grid cache unless the folder has its own
+        pooled = n_workers > 1
+        grid_cache = None if pooled and self.grid_cache is default_grid_cache() else self.grid_cache
+        tasks = [
+            (self.sequence, self.temperature, chain_rng.seed_sequence, grid_cache, samples,
+             method, reservoir_size, retain_conformations, mcmc_kwargs, cached, ensemble)
+            for chain_rng, samples, ensemble in zip(chain_rngs, chain_samples, ensembles)
+        ]
+        
+        if pooled:
+            with budgeted_process_pool(min(n_workers, n_chains)) as executor:
+                results = list(executor.map(_folding_chain, tasks))
+        else:
+            results = [_folding_chain(task) for task in tasks]
+        
+        # Store new snapshots before their statistics are merged
+        for key, previous_count, (_, _, _, ensemble) in zip(keys, previous_counts, results):
+            if ensemble is not None and ensemble.n_samples != previous_count:
+                self.ensemble_cache.put(key, ensemble)
+        return results, sum(previous_counts)
+    
+    def run_folding_simulation(self, n_samples: int = 1000, method: str = 'independent',
+                               burn_in: Optional[int] = None, thin: Optional[int] = None,
+                               move_residues: int = 1, step_size: float = 120.0,
+                               retain_conformations: bool = False,
+                               reservoir_size: int = 1000, n_workers: int = 1,
+                               n_chains: Optional[int] = None) -> Dict[str, any]:
+        """
+        Run complete folding simulation with multiple conformational samples
+        
+        method='independent' builds every sample from scratch with
+        sample_conformation; method='mcmc' draws samples from one Metropolis
+        chain (see run_mcmc for burn_in, thin, move_residues and step_size).
+        
+        Samples are summarized on the fly (fot.streaming_stats), so memory
+        does not grow with n_samples: 'mean_energy' / 'std_energy' come from
+        a Welford accumulator, 'energy_histogram' bins the energy per
+        residue, 'mean_structure_fractions' averages the secondary-structure
+        fractions of all samples, and 'energy_samples' is a uniform
+        reservoir of at most reservoir_size sample energies (every energy, in
+        order, while n_samples <= reservoir_size). Every sample energy in
+        'all_energies' and, for the independent method, every sampled
+        conformation in 'all_conformations' are only kept with
+        retain_conformations=True.
+        
+        n_chains > 1 splits the samples into independently seeded chains
+        (chain k draws from the folder's RNG stage 'chain-k', or from fresh
+        entropy without an RNG), each with its own burn-in for MCMC. The
+        chains run in a pool of n_workers processes and their accumulators
+        are merged in chain order, so for a seeded folder the results depend
+        on n_chains but not on n_workers. n_chains defaults to n_workers;
+        with a single chain the simulation runs in this process on the
+        folder's own RNG.
+        
+        With an ensemble_cache, a seeded folder's independent-method runs
+        go through it: a run of the same (sequence, temperature, sampler,
+        seed) starts from the largest cached snapshot of at most n_samples
+        samples and only draws the missing ones, giving exactly the
+        statistics of a fresh n_samples run. Multi-chain runs cache each
+        chain under its own seed, so a run tops up earlier runs with the
+        same n_chains. 'reused_samples' reports how many samples came from
+        the cache. MCMC chains
+        cannot be resumed from a saved RNG state and runs that retain
+        conformations need every sample, so both bypass the cache (logged
+        for seeded folders).
+        """
+        
+        if method not in FOLDING_METHODS:
+            raise ValueError(f"Unknown folding simulation method: {method} (expected one of {FOLDING_METHODS})")
+        if n_workers < 1:
+            raise ValueError(f"n_workers must be at least 1, got {n_workers}")
+        n_chains = n_chains if n_chains is not None else n_workers
+        if not 1 <= n_chains <= max(n_samples, 1):
+            raise ValueError(f"n_chains must be between 1 and n_samples, got {n_chains}")
+        
+        print(f"🔬 Running rigorous folding simulation ({n_samples} samples, {method}, {n_chains} chain(s))...")
+        
+        # Retention sizes the reservoir to hold every sample energy, in order
+        if retain_conformations:
+            reservoir_size = max(reservoir_size, n_samples)
+        mcmc_kwargs = {'burn_in': burn_in, 'thin': thin, 'move_residues': move_residues,
+                       'step_size': step_size} if method == 'mcmc' else {}
+        
+        cached = (method == 'independent' and not retain_conformations and self.rng is not None
+                  and self.ensemble_cache is not None)
+        if self.rng is not None and self.ensemble_cache is not None and not cached:
+            reason = 'MCMC chains cannot be resumed' if method == 'mcmc' else 'conformations are retained'
+            logger.info(f"Ensemble cache bypassed for {self.sequence[:20]}: {reason}")
+        
+        reused_samples = 0
+        if n_chains == 1 and cached:
+            key = self.ensemble_key(reservoir_size)
+            previous = self.ensemble_cache.get(key, max_samples=n_samples)
+            reused_samples = previous.n_samples if previous is not None else 0
+            ensemble = self.top_up_ensemble(previous, n_samples, reservoir_size)
+            if ensemble.n_samples != reused_samples:
+                self.ensemble_cache.put(key, ensemble)
+            statistics, all_conformations, acceptance_rate = ensemble.statistics, [], None
+        elif n_chains == 1:
+            statistics = self.new_statistics(reservoir_size)
+            all_conformations, acceptance_rate = self._run_chain(n_samples, method, statistics,
+                                                                 retain_conformations, **mcmc_kwargs)
+        else:
+            chain_results, reused_samples = self._run_chains(n_samples, n_chains, n_workers, method,
+                                                             reservoir_size, retain_conformations, mcmc_kwargs,
+                                                             cached)
+            statistics, all_conformations = chain_results[0][0], list(chain_results[0][1])
+            for chain_statistics, conformations, _, _ in chain_results[1:]:
+                statistics.merge(chain_statistics)
+                all_conformations.extend(conformations)
+            acceptance_rate = None
+            if method == 'mcmc':
+                counts = [chain_statistics.energy.count for chain_statistics, _, _, _ in chain_results]
+                acceptance_rate = float(np.average([rate for _, _, rate, _ in chain_results], weights=counts))
+        
+        # Lowest energy conformation
+        best_conformation = self._states(*statistics.best_payload)
         
         # Analyze results
         structure_analysis = self.analyze_secondary_structure(best_conformation)
         aggregation_propensity = self.calculate_aggregation_propensity(best_conformation)
         
+        summary = statistics.summary()
         results = {
-            'n_samples': n_samples,
+            'n_samples': summary['n_samples'],
+            'reused_samples': reused_samples,
+            'method': method,
+            'n_chains': n_chains,
             'best_conformation': best_conformation,
-            'best_energy': all_energies[min_energy_idx],
-            'mean_energy': np.mean(all_energies),
-            'std_energy': np.std(all_energies),
+            'best_energy': summary['min_energy'],
+            'mean_energy': summary['mean_energy'],
+            'std_energy': summary['std_energy'],
             'structure_analysis': structure_analysis,
             'aggregation_propensity': aggregation_propensity,
-            'all_energies': all_energies
+            'energy_samples': summary['energy_samples'],
+            'energy_histogram': summary['energy_histogram'],
+            'mean_structure_fractions': summary['mean_structure_fractions'],
+            'statistics': statistics
         }
+        if retain_conformations:
+            results['all_energies'] = summary['energy_samples']
+            if method == 'independent':
+                results['all_conformations'] = all_conformations
+        if method == 'mcmc':
+            results['acceptance_rate'] = acceptance_rate
         
         print(f"✅ Simulation complete!")
         print(f"   Best energy: {results['best_energy']:.2f} kcal/mol")
@@ -355,6 +732,37 @@ class RigorousProteinFolder:
         return results
 
 
+def folding_rng(sequence: str, base_seed: Optional[int]) -> Optional[RNGContext]:
+    """
+    RNG context of the discovery pipeline's folding simulations (None without a base seed)
+    
+    The reality check and the rigorous analysis of one inquiry derive the
+    same context, so the second stage tops up the first stage's cached
+    ensemble instead of sampling from scratch.
+    """
+    return RNGContext.derive(base_seed, sequence, stage='folding') if base_seed is not None else None
+
+
+def _folding_chain(task: Tuple) -> Tuple[FoldingStatistics, List[List[RamachandranState]], Optional[float],
+                                         Optional[FoldingEnsemble]]:
+    """
+    One independently seeded chain of run_folding_simulation (process pool entry point)
+    
+    Cached chains top up the ensemble passed in (None for a cache miss) and
+    return it as the last element; other chains return None there.
+    """
+    (sequence, temperature, seed_sequence, grid_cache, n_samples, method, reservoir_size, retain, mcmc_kwargs,
+     cached, ensemble) = task
+    folder = RigorousProteinFolder(sequence, temperature, rng=RNGContext.from_seed_sequence(seed_sequence),
+                                   grid_cache=grid_cache)
+    if cached:
+        ensemble = folder.top_up_ensemble(ensemble, n_samples, reservoir_size)
+        return ensemble.statistics, [], None, ensemble
+    statistics = folder.new_statistics(reservoir_size)
+    conformations, acceptance_rate = folder._run_chain(n_samples, method, statistics, retain, **mcmc_kwargs)
+    return statistics, conformations, acceptance_rate, None
+
+
 def validate_against_experimental_data(results: Dict[str, any], sequence: str) -> Dict[str, bool]:
     """Validate computational results against known experimental data"""
     
@@ -33,6 +33,7 @@ except ImportError:
 
 from protein_folding_analysis import RigorousProteinFolder
 from fot.vqbit_mathematics import ProteinVQbitGraph
+from fot.rng_context import RNGContext
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -75,12 +76,18 @@ class PublicationGradeAnalyzer:
     
     def __init__(self, 
                  sequence: str = "DAEFRHDSGYEVHHQKLVFFAEDVGSNKGAIIGLMVGGVVIA",
-                 output_dir: Path = Path("publication_results")):
+                 output_dir: Path = Path("publication_results"),
+                 base_seed: Optional[int] = None):
         
         self.sequence = sequence  # Aβ42 WT
         self.output_dir = output_dir
         self.output_dir.mkdir(exist_ok=True)
         
+        # With a base seed every replica samples from RNG contexts derived from
+        # (base_seed, sequence, replica_id, stage), so runs are reproducible
+        # and replicas independent of execution order; None keeps global RNG state
+        self.base_seed = base_seed
+        
         # Analysis parameters (as specified)
         self.temperatures = [290.0, 305.0, 320.0, 335.0]  # K
         self.n_replicas_per_temp = 2  # Duplicates for repeatability
@@ -129,9 +136,15 @@ class PublicationGradeAnalyzer:
         
         logger.info(f"🌡️ Running replica {replica_id} at {temperature} K")
         
+        # Per-stage RNG contexts for this replica
+        classical_rng = self._replica_rng(replica_id, 'classical')
+        vqbit_rng = self._replica_rng(replica_id, 'vqbit')
+        analysis_rng = self._replica_rng(replica_id, 'analysis')
+        analysis_random = analysis_rng.numpy if analysis_rng is not None else np.random
+        
         # Initialize frameworks
-        classical_folder = RigorousProteinFolder(self.sequence, temperature=temperature)
-        vqbit_graph = ProteinVQbitGraph(self.sequence)
+        classical_folder = RigorousProteinFolder(self.sequence, temperature=temperature, rng=classical_rng)
+        vqbit_graph = ProteinVQbitGraph(self.sequence, rng=vqbit_rng)
         
         # Storage for trajectory data
         phi_psi_data = []
@@ -174,11 +187,11 @@ class PublicationGradeAnalyzer:
                 cumulative_coil += coil_frac
                 
                 # φ/ψ angles (simplified - would extract from actual structure)
-                phi_psi = self._generate_phi_psi_sample(beta_frac, helix_frac, coil_frac)
+                phi_psi = self._generate_phi_psi_sample(beta_frac, helix_frac, coil_frac, analysis_random)
                 phi_psi_data.extend(phi_psi)
                 
                 # Contact map (simplified 42x42 matrix)
-                contact_map = self._generate_contact_map(beta_frac)
+                contact_map = self._generate_contact_map(beta_frac, analysis_random)
                 contact_maps.append(contact_map)
                 
                 # Convergence tracking
@@ -213,7 +226,14 @@ class PublicationGradeAnalyzer:
             convergence_data=convergence_data
         )
     
-    def _generate_phi_psi_sample(self, beta_frac: float, helix_frac: float, coil_frac: float) -> List[Tuple[float, float]]:
+    def _replica_rng(self, replica_id: str, stage: str) -> Optional[RNGContext]:
+        """RNG context for one stage of a replica (None without a base seed)"""
+        if self.base_seed is None:
+            return None
+        return RNGContext.derive(self.base_seed, self.sequence, replica_id, stage)
+    
+    def _generate_phi_psi_sample(self, beta_frac: float, helix_frac: float, coil_frac: float,
+                                 rng=np.random) -> List[Tuple[float, float]]:
         """Generate φ/ψ angles based on secondary structure composition"""
         
         n_residues = len(self.sequence)
@@ -221,26 +241,26 @@ class PublicationGradeAnalyzer:
         
         for i in range(n_residues):
             # Random assignment based on fractions
-            rand = np.random.random()
+            rand = rng.random()
             
             if rand < beta_frac:
                 # β-sheet region
-                phi = np.random.normal(-120, 20)
-                psi = np.random.normal(120, 20) 
+                phi = rng.normal(-120, 20)
+                psi = rng.normal(120, 20) 
             elif rand < beta_frac + helix_frac:
                 # α-helix region
-                phi = np.random.normal(-60, 15)
-                psi = np.random.normal(-45, 15)
+                phi = rng.normal(-60, 15)
+                psi = rng.normal(-45, 15)
             else:
                 # Coil/extended region
-                phi = np.random.uniform(-180, 180)
-                psi = np.random.uniform(-180, 180)
+                phi = rng.uniform(-180, 180)
+                psi = rng.uniform(-180, 180)
             
             phi_psi_pairs.append((phi, psi))
         
         return phi_psi_pairs
     
-    def _generate_contact_map(self, beta_frac: float) -> np.ndarray:
+    def _generate_contact_map(self, beta_frac: float, rng=np.random) -> np.ndarray:
         """Generate contact map based on β-sheet content"""
         
         n_residues = len(self.sequence)
@@ -251,7 +271,7 @@ class PublicationGradeAnalyzer:
             for j in range(i+3, n_residues):  # Minimum separation
                 
                 # Higher contact probability in β-regions
-                if np.random.random() < beta_frac * 0.3:
+                if rng.random() < beta_frac * 0.3:
                     contact_map[i, j] = 1.0
                     contact_map[j, i] = 1.0  # Symmetric
         
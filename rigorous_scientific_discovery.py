@@ -16,8 +16,9 @@ import json
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
+from fot.ensemble_cache import EnsembleCache
 from scientific_discovery_engine import ScientificDiscoveryEngine
 from scientific_language_protocols import generate_scientific_report
 
@@ -40,10 +41,15 @@ class RigorousScientificDiscovery:
     - Provides transparent uncertainty quantification
     """
     
-    def __init__(self, sequence: str, output_dir: str = "rigorous_discoveries"):
+    def __init__(self, sequence: str, output_dir: str = "rigorous_discoveries",
+                 checkpoint_dir: Optional[Path] = None, base_seed: Optional[int] = None,
+                 ensemble_cache: Optional[EnsembleCache] = None):
         self.sequence = sequence
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.checkpoint_dir = checkpoint_dir
+        self.base_seed = base_seed
+        self.ensemble_cache = ensemble_cache
         
     def run_complete_scientific_inquiry(self, n_samples: int = 1000) -> Dict[str, Any]:
         """
@@ -59,7 +65,8 @@ class RigorousScientificDiscovery:
         logger.info("Language: Rigorous scientific discourse with uncertainty")
         
         # Run scientific inquiry
-        discovery_engine = ScientificDiscoveryEngine(self.sequence)
+        discovery_engine = ScientificDiscoveryEngine(self.sequence, checkpoint_dir=self.checkpoint_dir,
+                                                     base_seed=self.base_seed, ensemble_cache=self.ensemble_cache)
         raw_results = discovery_engine.run_scientific_inquiry(n_samples)
         
         # Apply scientific language protocols
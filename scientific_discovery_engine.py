@@ -18,8 +18,11 @@ import json
 from pathlib import Path
 from datetime import datetime
 
-from protein_folding_analysis import RigorousProteinFolder
+from protein_folding_analysis import RigorousProteinFolder, folding_rng
+from fot.ensemble_cache import EnsembleCache, default_ensemble_cache
 from fot.vqbit_mathematics import ProteinVQbitGraph
+from fot.convergence import ToleranceConvergence
+from fot.vqbit_checkpoint import checkpoint_path_for
 from scientific_reality_check import enforce_reality_check
 from adversarial_validation import validate_discovery_adversarially
 
@@ -59,8 +62,17 @@ class ScientificDiscoveryEngine:
     5. Quantify uncertainty and model limitations
     """
     
-    def __init__(self, sequence: str):
+    def __init__(self, sequence: str, checkpoint_dir: Optional[Path] = None, n_workers: int = 1,
+                 base_seed: Optional[int] = None, ensemble_cache: Optional[EnsembleCache] = None):
         self.sequence = sequence
+        self.checkpoint_dir = checkpoint_dir  # Resumable vQbit optimization when set
+        self.n_workers = n_workers  # Worker processes (and seeded chains) of both folding stages
+        # One seed and chain layout for both folding stages, so the rigorous analysis
+        # tops up the reality check's ensemble (fresh entropy per engine unless given)
+        self.base_seed = base_seed if base_seed is not None else int(np.random.SeedSequence().entropy)
+        # Shared by both folding stages; a private in-memory cache unless one is passed in
+        self.ensemble_cache = ensemble_cache if ensemble_cache is not None else (default_ensemble_cache()
+                                                                                 or EnsembleCache())
         self.active_hypotheses: List[ScientificHypothesis] = []
         self.experimental_contradictions: List[ExperimentalContradiction] = []
         self.model_limitations = []
@@ -80,7 +92,8 @@ class ScientificDiscoveryEngine:
         
         # STEP 1: Enforce scientific realism
         logger.info("\n🛡️ STEP 1: SCIENTIFIC REALITY CHECK")
-        reality_check_passed = enforce_reality_check(self.sequence, min_samples=200)
+        reality_check_passed = enforce_reality_check(self.sequence, min_samples=200, base_seed=self.base_seed,
+                                                     ensemble_cache=self.ensemble_cache, n_workers=self.n_workers)
         
         if not reality_check_passed:
             return {
@@ -131,8 +144,10 @@ class ScientificDiscoveryEngine:
     def _run_rigorous_analysis(self, n_samples: int) -> Dict[str, Any]:
         """Run rigorous molecular mechanics analysis"""
         
-        folder = RigorousProteinFolder(self.sequence, temperature=298.15)
-        results = folder.run_folding_simulation(n_samples=n_samples)
+        folder = RigorousProteinFolder(self.sequence, temperature=298.15,
+                                       rng=folding_rng(self.sequence, self.base_seed),
+                                       ensemble_cache=self.ensemble_cache)
+        results = folder.run_folding_simulation(n_samples=n_samples, n_workers=self.n_workers)
         
         # Add uncertainty quantification
         results['uncertainty_analysis'] = {
@@ -147,8 +162,11 @@ class ScientificDiscoveryEngine:
     def _run_vqbit_analysis(self) -> Dict[str, Any]:
         """Run vQbit analysis with uncertainty acknowledgment"""
         
+        checkpoint = checkpoint_path_for(self.checkpoint_dir, self.sequence) if self.checkpoint_dir else None
         vqbit_system = ProteinVQbitGraph(self.sequence)
-        results = vqbit_system.run_fot_optimization(max_iterations=500)
+        results = vqbit_system.run_fot_optimization(max_iterations=500,
+                                                    convergence=ToleranceConvergence(),
+                                                    checkpoint=checkpoint)
         
         # Add model limitations acknowledgment
         results['model_limitations'] = {
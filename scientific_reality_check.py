@@ -11,9 +11,10 @@ reproduce basic experimental facts about Aβ42.
 
 import numpy as np
 import logging
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Optional
 from dataclasses import dataclass
-from protein_folding_analysis import RigorousProteinFolder
+from fot.ensemble_cache import EnsembleCache
+from protein_folding_analysis import RigorousProteinFolder, folding_rng
 # from fot.experimental_integration import ExperimentalDataIntegrator  # Not needed for basic reality check
 
 logger = logging.getLogger(__name__)
@@ -47,8 +48,12 @@ class ScientificRealityChecker:
     NO discovery runs are allowed until this validation passes.
     """
     
-    def __init__(self, sequence: str):
+    def __init__(self, sequence: str, base_seed: Optional[int] = None,
+                 ensemble_cache: Optional[EnsembleCache] = None, n_workers: int = 1):
         self.sequence = sequence
+        self.base_seed = base_seed  # Seeds the simulation so later stages can reuse its ensemble
+        self.ensemble_cache = ensemble_cache
+        self.n_workers = n_workers  # Worker processes (and seeded chains) of the simulation
         self.experimental_benchmarks = self._define_experimental_benchmarks()
         self.reality_check_passed = False
         self.last_validation_results = []
@@ -126,8 +131,10 @@ class ScientificRealityChecker:
         logger.info("⚠️  NO DISCOVERY RUNS ALLOWED UNTIL VALIDATION PASSES")
         
         # Run computational simulation
-        folder = RigorousProteinFolder(self.sequence, temperature=298.15)
-        results = folder.run_folding_simulation(n_samples=n_samples)
+        folder = RigorousProteinFolder(self.sequence, temperature=298.15,
+                                       rng=folding_rng(self.sequence, self.base_seed),
+                                       ensemble_cache=self.ensemble_cache)
+        results = folder.run_folding_simulation(n_samples=n_samples, n_workers=self.n_workers)
         
         validation_results = []
         
@@ -257,7 +264,8 @@ class ScientificRealityChecker:
             }
         }
 
-def enforce_reality_check(sequence: str, min_samples: int = 500) -> bool:
+def enforce_reality_check(sequence: str, min_samples: int = 500, base_seed: Optional[int] = None,
+                          ensemble_cache: Optional[EnsembleCache] = None, n_workers: int = 1) -> bool:
     """
     Convenience function to enforce reality check.
     
@@ -265,7 +273,8 @@ def enforce_reality_check(sequence: str, min_samples: int = 500) -> bool:
     Discovery runs should call this first and exit if it returns False.
     """
     
-    checker = ScientificRealityChecker(sequence)
+    checker = ScientificRealityChecker(sequence, base_seed=base_seed, ensemble_cache=ensemble_cache,
+                                       n_workers=n_workers)
     passed, results = checker.run_reality_check(min_samples)
     
     if not passed:
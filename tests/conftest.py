@@ -0,0 +1,23 @@
+"""
+Shared pytest fixtures
+
+Every test gets a fresh in-memory process-wide grid cache and no default
+ensemble cache, so nothing is written outside the test's tmp_path and no
+cached state leaks between tests.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fot import ensemble_cache, ramachandran_grid
+
+
+@pytest.fixture(autouse=True)
+def isolated_default_caches(monkeypatch):
+    """Fresh default caches for the duration of one test"""
+    monkeypatch.setattr(ramachandran_grid, '_default_cache', ramachandran_grid.RamachandranGridCache())
+    monkeypatch.setattr(ensemble_cache, '_default_cache', None)
@@ -0,0 +1,105 @@
+"""
+Test Suite for the Seeded Folding Ensemble Cache
+
+Checks that cached ensembles topped up to n samples match fresh n-sample
+runs, across the memory and disk tiers and for multi-chain runs, and that
+the discovery pipeline's second folding stage reuses the first.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fot.ensemble_cache import EnsembleCache
+from fot.rng_context import RNGContext
+from protein_folding_analysis import RigorousProteinFolder
+from scientific_discovery_engine import ScientificDiscoveryEngine
+from scientific_reality_check import ScientificRealityChecker
+
+
+class TestEnsembleCache:
+    """Seeded folding ensembles shared through EnsembleCache"""
+
+    SUMMARY_KEYS = ('best_energy', 'mean_energy', 'std_energy', 'energy_samples', 'energy_histogram',
+                    'mean_structure_fractions')
+
+    @staticmethod
+    def simulate(cache, n_samples, seed=8, **kwargs):
+        folder = RigorousProteinFolder("DAEFRHDSGYEV", rng=RNGContext.derive(seed, "DAEFRHDSGYEV"),
+                                       ensemble_cache=cache)
+        return folder.run_folding_simulation(n_samples=n_samples, reservoir_size=16, **kwargs)
+
+    def test_top_up_matches_fresh_run(self):
+        fresh = self.simulate(EnsembleCache(max_entries=0), 30)
+
+        cache = EnsembleCache()
+        first = self.simulate(cache, 12)
+        topped_up = self.simulate(cache, 30)
+        assert first['reused_samples'] == 0 and topped_up['reused_samples'] == 12
+        for key in self.SUMMARY_KEYS:
+            assert topped_up[key] == fresh[key]
+        assert [s.phi for s in topped_up['best_conformation']] == [s.phi for s in fresh['best_conformation']]
+
+        # Smaller requests start from the largest snapshot that fits; other seeds miss
+        smaller = self.simulate(cache, 20)
+        assert smaller['reused_samples'] == 12 and smaller['n_samples'] == 20
+        assert smaller['mean_energy'] == self.simulate(EnsembleCache(max_entries=0), 20)['mean_energy']
+        assert self.simulate(cache, 10)['reused_samples'] == 0
+        assert self.simulate(cache, 12)['mean_energy'] == first['mean_energy']
+        assert self.simulate(cache, 10, seed=9)['reused_samples'] == 0
+
+    def test_top_up_restores_folder_rng(self):
+        folder = RigorousProteinFolder("DAEFRHDSGYEV", rng=RNGContext.derive(8, "DAEFRHDSGYEV"),
+                                       ensemble_cache=EnsembleCache())
+        state = folder.np_random.bit_generator.state
+        folder.top_up_ensemble(None, 5, reservoir_size=16)
+        assert folder.np_random.bit_generator.state == state
+
+    def test_caching_is_opt_in(self):
+        folder = RigorousProteinFolder("DAEFRHDSGYEV", rng=RNGContext.derive(8, "DAEFRHDSGYEV"))
+        assert folder.ensemble_cache is None
+        assert folder.run_folding_simulation(n_samples=5)['reused_samples'] == 0
+
+    def test_disk_tier_round_trip(self, tmp_path):
+        fresh = self.simulate(EnsembleCache(max_entries=0), 24)
+
+        self.simulate(EnsembleCache(cache_dir=tmp_path), 10)
+        assert [path.name[-7:] for path in tmp_path.glob("*.npz")] == ['-10.npz']
+
+        cache = EnsembleCache(cache_dir=tmp_path)
+        restored = self.simulate(cache, 24)
+        assert cache.cache_info()['disk_hits'] == 1 and restored['reused_samples'] == 10
+        for key in self.SUMMARY_KEYS:
+            assert restored[key] == fresh[key]
+
+    def test_multi_chain_runs_top_up_each_chain(self):
+        fresh = self.simulate(EnsembleCache(max_entries=0), 30, n_chains=3)
+
+        cache = EnsembleCache()
+        self.simulate(cache, 12, n_chains=3)
+        topped_up = self.simulate(cache, 30, n_workers=3)
+        assert topped_up['reused_samples'] == 12 and cache.cache_info()['entries'] == 6
+        for key in self.SUMMARY_KEYS:
+            assert topped_up[key] == fresh[key]
+
+    def test_mcmc_bypasses_cache(self):
+        cache = EnsembleCache()
+        results = self.simulate(cache, 10, method='mcmc', burn_in=10, thin=2)
+        assert results['reused_samples'] == 0 and cache.cache_info()['entries'] == 0
+
+    @pytest.mark.parametrize("n_workers", [1, 2])
+    def test_discovery_stage_reuses_reality_check(self, monkeypatch, n_workers):
+        sequence, cache = "DAEFRHDSGYEVHHQK", EnsembleCache()
+        ScientificRealityChecker(sequence, base_seed=4, ensemble_cache=cache,
+                                 n_workers=n_workers).run_reality_check(n_samples=24)
+
+        def no_sampling(self, *args, **kwargs):
+            raise AssertionError("the discovery stage drew new samples")
+
+        monkeypatch.setattr(RigorousProteinFolder, '_sample_arrays', no_sampling)
+        engine = ScientificDiscoveryEngine(sequence, n_workers=n_workers, base_seed=4, ensemble_cache=cache)
+        results = engine._run_rigorous_analysis(n_samples=24)
+        assert results['reused_samples'] == 24 and results['n_samples'] == 24
@@ -0,0 +1,119 @@
+"""
+Test Suite for the Rigorous Protein Folding Analysis
+
+Validates RigorousProteinFolder's batched sampling, Metropolis mode and
+multi-process chains against the scalar formulations and single-process
+runs they replace.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fot.ensemble_cache import EnsembleCache
+from fot.rng_context import RNGContext
+from protein_folding_analysis import RigorousProteinFolder
+
+AB42_SEQUENCE = "DAEFRHDSGYEVHHQKLVFFAEDVGSNKGAIIGLMVGGVVIA"
+
+
+class TestBatchedSampling:
+    """Array-batched trials and Boltzmann draw in sample_conformation"""
+
+    def test_local_interactions_vectorized(self):
+        folder = RigorousProteinFolder(AB42_SEQUENCE + "KDERC")
+        expected = [folder.calculate_local_interactions(i, 0.0, 0.0) for i in range(folder.n_residues)]
+        np.testing.assert_array_equal(folder.local_interaction_energies(), expected)
+
+    def test_trial_energies(self):
+        folder = RigorousProteinFolder(AB42_SEQUENCE)
+        trials = np.random.default_rng(1).uniform(-180, 180, size=(folder.n_residues, 5, 2))
+        expected = [[folder.calculate_ramachandran_energy(i, phi, psi) + folder.calculate_local_interactions(i, phi, psi)
+                     for phi, psi in trials[i]] for i in range(folder.n_residues)]
+        np.testing.assert_allclose(folder.trial_energies(trials), expected, atol=5e-3)
+
+    def test_low_temperature_picks_minimum(self):
+        sequence = "DAEFRHDSGY"
+        folder = RigorousProteinFolder(sequence, temperature=1e-3, rng=RNGContext.derive(3, sequence))
+        replay = RNGContext.derive(3, sequence)
+        trials = replay.numpy.uniform(-180, 180, size=(len(sequence), 100, 2))
+        best = folder.trial_energies(trials).min(axis=1)
+
+        with np.errstate(over='ignore'):  # Boltzmann factors of the recorded states overflow at 1 mK
+            conformations = folder.sample_conformation()
+        np.testing.assert_allclose([state.energy for state in conformations], best)
+
+
+class TestMetropolisSampling:
+    """run_folding_simulation(method='mcmc')"""
+
+    def test_incremental_energy_matches_recomputation(self):
+        folder = RigorousProteinFolder(AB42_SEQUENCE, rng=RNGContext.derive(0, AB42_SEQUENCE))
+        results = folder.run_folding_simulation(n_samples=30, method='mcmc', burn_in=100, thin=20, move_residues=3)
+
+        assert results['method'] == 'mcmc' and len(results['energy_samples']) == 30
+        assert 0.0 < results['acceptance_rate'] <= 1.0
+        recomputed = sum(state.energy for state in results['best_conformation']) - 8.0 * len(AB42_SEQUENCE)
+        assert recomputed == pytest.approx(results['best_energy'], abs=1e-9)
+
+    def test_samples_boltzmann_distribution(self):
+        folder = RigorousProteinFolder("A", rng=RNGContext.derive(1, "A"))
+        chain = folder.run_mcmc(n_samples=20000, burn_in=500, thin=1, step_size=60.0)
+
+        # Boltzmann mean energy by quadrature on a 1° grid of cell centers
+        centers = np.arange(-179.5, 180.0, 1.0)
+        phi, psi = np.meshgrid(centers, centers, indexing='ij')
+        energies = folder.ramachandran_energies(0, phi.ravel(), psi.ravel())
+        weights = np.exp(-(energies - energies.min()) / folder.kT)
+        expected = np.sum(weights * energies) / weights.sum()
+        assert np.mean(chain['energies']) - folder.baseline_energy() == pytest.approx(expected, abs=0.05)
+
+    def test_seeded_and_validated(self):
+        runs = [RigorousProteinFolder("DAEFRHDSGY", rng=RNGContext.derive(5, "DAEFRHDSGY")).run_mcmc(10)
+                for _ in range(2)]
+        assert runs[0]['energies'] == runs[1]['energies']
+
+        with pytest.raises(ValueError):
+            RigorousProteinFolder("DAEF").run_folding_simulation(n_samples=1, method='annealing')
+
+
+class TestParallelChains:
+    """run_folding_simulation(n_workers=..., n_chains=...)"""
+
+    @staticmethod
+    def simulate(**kwargs):
+        folder = RigorousProteinFolder("DAEFRHDSGYEV", rng=RNGContext.derive(6, "DAEFRHDSGYEV"),
+                                       ensemble_cache=EnsembleCache(max_entries=0))
+        return folder.run_folding_simulation(**kwargs)
+
+    @pytest.mark.parametrize("method", ['independent', 'mcmc'])
+    def test_pool_matches_in_process_chains(self, method):
+        serial = self.simulate(n_samples=30, method=method, n_chains=3, reservoir_size=8)
+        pooled = self.simulate(n_samples=30, method=method, n_chains=3, n_workers=2, reservoir_size=8)
+
+        for key in ('best_energy', 'mean_energy', 'std_energy', 'energy_samples', 'energy_histogram',
+                    'mean_structure_fractions', 'acceptance_rate'):
+            assert serial.get(key) == pooled.get(key)
+        assert serial['statistics'].energy.count == 30
+        assert [s.phi for s in serial['best_conformation']] == [s.phi for s in pooled['best_conformation']]
+
+    def test_merged_chains_match_their_samples(self):
+        merged = self.simulate(n_samples=20, n_chains=4, retain_conformations=True)
+        assert len(merged['all_energies']) == 20 and len(merged['all_conformations']) == 20
+        assert merged['mean_energy'] == pytest.approx(np.mean(merged['all_energies']), rel=1e-12)
+        assert merged['std_energy'] == pytest.approx(np.std(merged['all_energies']), rel=1e-9)
+        assert merged['best_energy'] == min(merged['all_energies'])
+
+        # A single chain is unchanged by the chain machinery
+        single = self.simulate(n_samples=20)
+        assert single['n_chains'] == 1 and single['energy_samples'] != merged['energy_samples']
+
+    def test_validates_chain_counts(self):
+        with pytest.raises(ValueError):
+            self.simulate(n_samples=2, n_chains=3)
+        with pytest.raises(ValueError):
+            self.simulate(n_samples=2, n_workers=0)
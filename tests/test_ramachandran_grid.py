@@ -0,0 +1,60 @@
+"""
+Test Suite for the Ramachandran Energy Grids
+
+Checks the tabulated region energies against RigorousProteinFolder's scalar
+region loop and the grid cache's storage tiers.
+"""
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(REPO_ROOT)
+
+from fot.ramachandran_grid import RamachandranGridCache
+from protein_folding_analysis import RigorousProteinFolder
+
+
+class TestRamachandranGrid:
+    """Tabulated Ramachandran energies vs the scalar region loop"""
+
+    def test_matches_region_loop(self, tmp_path):
+        sequence = "ACDEFGHIKLMNPQRSTVWY"
+        folder = RigorousProteinFolder(sequence, grid_cache=RamachandranGridCache(tmp_path))
+        rng = np.random.default_rng(0)
+
+        for i in range(len(sequence)):
+            angles = rng.uniform(-180, 180, size=(500, 2))
+            # Both sides of the beta-sheet box edges (phi -145 / -95, psi 90 / 150)
+            edges = np.array([[-145.001, 120], [-144.999, 120], [-95.001, 120], [-94.999, 120],
+                              [-120, 89.999], [-120, 90.001], [-120, 149.999], [-120, 150.001]])
+            angles = np.vstack([angles, edges])
+
+            expected = [folder.calculate_ramachandran_energy(i, phi, psi) for phi, psi in angles]
+            np.testing.assert_allclose(folder.ramachandran_energies(i, angles[:, 0], angles[:, 1]),
+                                       expected, atol=5e-3)
+
+    def test_disk_cache(self, tmp_path):
+        first = RigorousProteinFolder("DAEF", grid_cache=RamachandranGridCache(tmp_path))
+        phi, psi = np.array([-60.3, 100.7]), np.array([-45.2, -99.9])
+        energies = first.ramachandran_energies(0, phi, psi)
+        assert len(list(tmp_path.glob('*.npy'))) == 1
+
+        cache = RamachandranGridCache(tmp_path)
+        second = RigorousProteinFolder("DAEF", grid_cache=cache)
+        np.testing.assert_array_equal(second.ramachandran_energies(0, phi, psi), energies)
+        assert cache.cache_info()['disk_hits'] == 1
+
+    @pytest.mark.parametrize("opt_in", [False, True])
+    def test_default_cache_persists_only_on_request(self, tmp_path, opt_in):
+        env = {key: value for key, value in os.environ.items() if key != 'FOT_RAMACHANDRAN_GRID_DIR'}
+        if opt_in:
+            env['FOT_RAMACHANDRAN_GRID_DIR'] = str(tmp_path)
+        probe = "from fot.ramachandran_grid import default_grid_cache; print(default_grid_cache().cache_dir)"
+        output = subprocess.run([sys.executable, "-c", probe], env=env, cwd=REPO_ROOT, check=True,
+                                capture_output=True, text=True).stdout.strip()
+        assert output == (str(tmp_path) if opt_in else "None")
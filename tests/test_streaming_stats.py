@@ -0,0 +1,97 @@
+"""
+Test Suite for the Streaming Folding Statistics
+
+Checks the constant-memory accumulators against numpy on the full sample
+set, and run_folding_simulation's summaries against retained samples.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fot.ensemble_cache import EnsembleCache
+from fot.rng_context import RNGContext
+from fot.streaming_stats import FoldingStatistics, ReservoirSample, WelfordAccumulator, structure_fractions
+from protein_folding_analysis import RigorousProteinFolder
+
+AB42_SEQUENCE = "DAEFRHDSGYEVHHQKLVFFAEDVGSNKGAIIGLMVGGVVIA"
+
+
+class TestStreamingStatistics:
+    """Constant-memory summaries of run_folding_simulation"""
+
+    def test_welford_matches_numpy_and_merges(self):
+        values = np.random.default_rng(0).normal(-300.0, 12.0, size=1000)
+        left, right, full = WelfordAccumulator(), WelfordAccumulator(), WelfordAccumulator()
+        for i, value in enumerate(values):
+            (left if i < 400 else right).update(value)
+            full.update(value)
+        left.merge(right)
+
+        for acc in (full, left):
+            assert acc.count == 1000
+            assert acc.mean == pytest.approx(np.mean(values), rel=1e-12)
+            assert acc.std == pytest.approx(np.std(values), rel=1e-9)
+            assert (acc.min, acc.max) == (values.min(), values.max())
+
+    def test_reservoir_is_bounded(self):
+        small = ReservoirSample(10, np.random.default_rng(0))
+        for value in range(7):
+            small.update(float(value))
+        assert small.values == [float(v) for v in range(7)]
+
+        large = ReservoirSample(10, np.random.default_rng(0))
+        other = ReservoirSample(10, np.random.default_rng(1))
+        for value in range(1000):
+            (large if value < 600 else other).update(float(value))
+        large.merge(other)
+        assert len(large.values) == 10 and large.seen == 1000
+        assert len(set(large.values)) == 10
+
+    def test_structure_fractions_match_analysis(self):
+        folder = RigorousProteinFolder(AB42_SEQUENCE, rng=RNGContext.derive(2, AB42_SEQUENCE))
+        conformation = folder.sample_conformation()
+        phi = [state.phi for state in conformation]
+        psi = [state.psi for state in conformation]
+        assert structure_fractions(phi, psi) == pytest.approx(folder.analyze_secondary_structure(conformation))
+
+    def test_summary_and_opt_in_retention(self):
+        def simulate(**kwargs):
+            folder = RigorousProteinFolder(AB42_SEQUENCE, rng=RNGContext.derive(3, AB42_SEQUENCE),
+                                           ensemble_cache=EnsembleCache(max_entries=0))
+            return folder.run_folding_simulation(n_samples=40, **kwargs)
+
+        streamed = simulate(reservoir_size=16)
+        retained = simulate(reservoir_size=16, retain_conformations=True)
+
+        assert len(streamed['energy_samples']) == 16
+        assert 'all_energies' not in streamed and 'all_conformations' not in streamed
+        assert len(retained['all_energies']) == 40 and len(retained['all_conformations']) == 40
+        assert retained['all_energies'] == retained['energy_samples']
+        assert streamed['mean_energy'] == pytest.approx(np.mean(retained['all_energies']), rel=1e-12)
+        assert streamed['std_energy'] == pytest.approx(np.std(retained['all_energies']), rel=1e-9)
+        assert streamed['best_energy'] == min(retained['all_energies'])
+        assert sum(streamed['energy_histogram']['counts']) + streamed['energy_histogram']['underflow'] + \
+            streamed['energy_histogram']['overflow'] == 40
+        assert sum(streamed['mean_structure_fractions'].values()) == pytest.approx(1.0)
+
+    def test_merged_runs_match_single_accumulator(self):
+        energies = np.random.default_rng(4).normal(-330.0, 5.0, size=300)
+        merged, single = FoldingStatistics(42), FoldingStatistics(42)
+        parts = [FoldingStatistics(42) for _ in range(3)]
+        for i, energy in enumerate(energies):
+            parts[i % 3].update(float(energy), payload=i)
+            single.update(float(energy), payload=i)
+        for part in parts:
+            merged.merge(part)
+
+        a, b = merged.summary(), single.summary()
+        assert a['n_samples'] == b['n_samples'] == 300
+        assert a['mean_energy'] == pytest.approx(b['mean_energy'], rel=1e-12)
+        assert a['std_energy'] == pytest.approx(b['std_energy'], rel=1e-9)
+        assert a['energy_histogram'] == b['energy_histogram']
+        assert merged.best_payload == single.best_payload
@@ -0,0 +1,1035 @@
+"""
+Test Suite for vQbit Mathematics
+
+Validates the optimized vQbit engine paths against the reference
+formulations they replace.
+"""
+
+import pytest
+import torch
+import numpy as np
+import networkx as nx
+import os
+
+# Import our FoT components
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fot.vqbit_mathematics import (
+    ProteinVQbitGraph, resume_fot_optimization, contact_edges, VQbitState, VIRTUE_NAMES, BASIS_STATES, shared_virtue_block, shared_virtue_projector,
+    amplification_rounds, grover_step, sequence_propensities
+)
+from fot.vqbit_propagator import SpectralPropagator, KrylovPropagator
+from fot.vqbit_batch import VQbitBatch, run_vqbit_protein_folding_batch
+from fot.convergence import ConvergenceController, LagConvergence, ToleranceConvergence
+from fot.vqbit_init_cache import InitializationCache
+from fot.motif_snapshot import MotifSnapshot, MotifSnapshotStore
+from fot.vqbit_precision import PRECISION_POLICIES
+from fot.rng_context import RNGContext
+from fot.thread_budget import thread_budget
+from fot import vqbit_windowed
+from fot.vqbit_windowed import WindowedVQbitSolver, blend_windows, window_spans
+from fot.vqbit_checkpoint import FoTCheckpointer, checkpoint_path_for, pending_checkpoints
+from fot.csr_graph import CSRGraph
+from fot.vqbit_gradient import GradientFoTOptimizer, fot_surrogate
+from protein_folding_analysis import RigorousProteinFolder
+
+AB42_SEQUENCE = "DAEFRHDSGYEVHHQKLVFFAEDVGSNKGAIIGLMVGGVVIA"
+
+
+def kronecker_evolution(laplacian: torch.Tensor, amplitudes: torch.Tensor, time_step: float) -> torch.Tensor:
+    """Reference dense evolution: exp(-iH*dt) with H = -(L ⊗ I₈)"""
+    identity_8 = torch.eye(8, dtype=torch.complex64)
+    hamiltonian = -1.0 * torch.kron(laplacian.to(torch.complex64), identity_8)
+    evolution_operator = torch.matrix_exp(-1j * hamiltonian * time_step)
+    return (evolution_operator @ amplitudes.reshape(-1)).view(-1, 8)
+
+
+class TestSpectralPropagator:
+    """Spectral propagator must reproduce the Kronecker matrix exponential"""
+
+    @pytest.mark.parametrize("time_step", [0.05, 0.1, 1.0])
+    def test_matches_kronecker_path(self, time_step):
+        torch.manual_seed(424242)
+        graph = ProteinVQbitGraph(AB42_SEQUENCE)
+        amplitudes = torch.randn(graph.n_residues, 8, dtype=torch.complex64)
+
+        propagator = SpectralPropagator(graph.laplacian_matrix)
+        spectral = propagator.apply(amplitudes, time_step)
+        reference = kronecker_evolution(graph.laplacian_matrix, amplitudes, time_step)
+
+        assert torch.allclose(spectral, reference, atol=1e-5)
+
+    def test_propagator_is_unitary_and_cached(self):
+        graph = ProteinVQbitGraph(AB42_SEQUENCE)
+        propagator = SpectralPropagator(graph.laplacian_matrix, max_cached_steps=2)
+
+        u = propagator.propagator(0.1)
+        identity = torch.eye(graph.n_residues, dtype=torch.complex64)
+        assert torch.allclose(u @ u.conj().T, identity, atol=1e-5)
+        assert propagator.propagator(0.1) is u
+
+        propagator.propagator(0.2)
+        propagator.propagator(0.3)
+        assert propagator.cache_info()['cached_steps'] == 2
+
+    def test_evolve_entangled_states_matches_reference(self):
+        torch.manual_seed(424242)
+        graph = ProteinVQbitGraph(AB42_SEQUENCE)
+        graph.initialize_from_sequence(use_biophysical_priors=True)
+        before = torch.stack([v.amplitudes for v in graph.vqbit_states.values()])
+
+        graph.evolve_entangled_states(time_step=0.1)
+        after = torch.stack([v.amplitudes for v in graph.vqbit_states.values()])
+
+        reference = kronecker_evolution(graph.laplacian_matrix, before, 0.1)
+        assert torch.allclose(after, reference, atol=1e-5)
+        np.testing.assert_allclose(
+            torch.linalg.vector_norm(after).item(),
+            torch.linalg.vector_norm(before).item(),
+            rtol=1e-5
+        )
+
+
+class TestStructOfArraysState:
+    """Batched virtue projection on the (N, 8) state tensor"""
+
+    def test_batched_projection_matches_per_residue_reference(self):
+        torch.manual_seed(424242)
+        graph = ProteinVQbitGraph(AB42_SEQUENCE)
+        graph.initialize_from_sequence(use_biophysical_priors=True)
+
+        # Reference: original per-residue loop over each virtue in turn
+        reference = graph.amplitudes.clone()
+        reference_scores = torch.zeros(graph.n_residues, len(VIRTUE_NAMES))
+        for k, virtue_name in enumerate(VIRTUE_NAMES):
+            virtue_op = graph.virtue_operators[virtue_name]
+            for i in range(graph.n_residues):
+                projected = virtue_op.projector @ reference[i].view(8, 1)
+                norm = torch.sqrt(torch.sum(torch.conj(projected) * projected).real)
+                if norm > 1e-10:
+                    projected = projected / norm
+                    reference[i] = projected.view(8)
+                reference_scores[i, k] = torch.real(
+                    torch.conj(projected).T @ virtue_op.residue_matrices().sum(dim=0) @ projected
+                ).item()
+
+        graph.apply_all_virtue_constraints()
+
+        assert torch.allclose(graph.amplitudes, reference, atol=1e-5)
+        assert torch.allclose(graph.virtue_scores, reference_scores, rtol=1e-4)
+
+    def test_batched_projection_matches_sequential_calls(self):
+        torch.manual_seed(7)
+        batched = ProteinVQbitGraph(AB42_SEQUENCE)
+        batched.initialize_vqbit_states()
+        sequential = ProteinVQbitGraph(AB42_SEQUENCE)
+        sequential.initialize_from_sequence(use_biophysical_priors=False)
+        sequential.amplitudes = batched.amplitudes.clone()
+
+        batched.apply_all_virtue_constraints()
+        for virtue_name in VIRTUE_NAMES:
+            sequential.apply_virtue_constraints(virtue_name)
+
+        assert torch.allclose(batched.amplitudes, sequential.amplitudes, atol=1e-5)
+        assert torch.allclose(batched.virtue_scores, sequential.virtue_scores, rtol=1e-4)
+
+    def test_compatibility_view_reads_and_writes_state(self):
+        graph = ProteinVQbitGraph(AB42_SEQUENCE)
+        assert len(graph.vqbit_states) == 0
+
+        graph.initialize_from_sequence(use_biophysical_priors=True)
+        assert len(graph.vqbit_states) == graph.n_residues
+
+        view = graph.vqbit_states[3]
+        assert view.residue_id == 3
+        assert set(view.virtue_scores) == set(VIRTUE_NAMES)
+        assert len(view.basis_states) == 8
+        assert set(view.entanglement_map) == set(graph.akg.neighbors(3))
+
+        view.amplitudes = -view.amplitudes
+        assert torch.equal(graph.amplitudes[3], view.amplitudes)
+        assert isinstance(view.to_state(), VQbitState)
+
+
+class TestSharedVirtueOperators:
+    """Virtue operators are shared 8×8 blocks cached process-wide"""
+
+    def test_graphs_share_cached_operators(self):
+        first = ProteinVQbitGraph(AB42_SEQUENCE)
+        second = ProteinVQbitGraph(AB42_SEQUENCE[::-1])
+
+        for virtue_name in VIRTUE_NAMES:
+            assert first.virtue_operators[virtue_name].constraint_matrix.shape == (8, 8)
+            assert first.virtue_operators[virtue_name].projector is second.virtue_operators[virtue_name].projector
+            assert first.virtue_operators[virtue_name].constraint_matrix is shared_virtue_block(virtue_name)
+
+    def test_projector_matches_per_residue_construction(self):
+        graph = ProteinVQbitGraph(AB42_SEQUENCE)
+
+        for virtue_name in VIRTUE_NAMES:
+            virtue_op = graph.virtue_operators[virtue_name]
+            stacked = virtue_op.residue_matrices()
+            assert stacked.shape == (graph.n_residues, 8, 8)
+
+            eigenvals, eigenvecs = torch.linalg.eigh(stacked.sum(dim=0))
+            valid = eigenvecs[:, eigenvals > virtue_op.threshold]
+            reference = valid @ torch.conj(valid).T
+
+            assert torch.allclose(virtue_op.projector, reference, atol=1e-5)
+            assert torch.allclose(virtue_op.aggregate_matrix, stacked.sum(dim=0), atol=1e-4)
+
+    def test_residue_override_is_local_to_graph(self):
+        graph = ProteinVQbitGraph(AB42_SEQUENCE)
+        override = torch.zeros(8, 8, dtype=torch.complex64)
+
+        graph.set_residue_constraint('Honesty', 5, override)
+        virtue_op = graph.virtue_operators['Honesty']
+
+        assert torch.equal(virtue_op.residue_matrix(5), override)
+        assert torch.allclose(virtue_op.aggregate_matrix, virtue_op.residue_matrices().sum(dim=0), atol=1e-4)
+        assert virtue_op.projector is not shared_virtue_projector('Honesty', graph.n_residues, 0.7)
+        assert torch.equal(shared_virtue_block('Honesty')[5, 5], torch.tensor(0.7, dtype=torch.complex64))
+
+        with pytest.raises(ValueError):
+            graph.set_residue_constraint('Charity', 0, override)
+
+
+class TestSparseLaplacianBackend:
+    """CSR Laplacian with expm_multiply evolution for long chains"""
+
+    def test_krylov_matches_spectral_propagator(self):
+        torch.manual_seed(424242)
+        graph = ProteinVQbitGraph(AB42_SEQUENCE)
+        amplitudes = torch.randn(graph.n_residues, 8, dtype=torch.complex64)
+
+        krylov = KrylovPropagator(graph.laplacian_csr).apply(amplitudes, 0.1)
+        spectral = SpectralPropagator(graph.laplacian_matrix).apply(amplitudes, 0.1)
+
+        assert torch.allclose(krylov, spectral, atol=1e-5)
+
+    def test_backend_selected_by_length_threshold(self):
+        torch.manual_seed(424242)
+        dense = ProteinVQbitGraph(AB42_SEQUENCE)
+        sparse = ProteinVQbitGraph(AB42_SEQUENCE, sparse_threshold=16)
+
+        assert dense.laplacian_backend == 'dense'
+        assert sparse.laplacian_backend == 'sparse'
+        assert sparse.laplacian_matrix is None
+
+        dense.initialize_from_sequence(use_biophysical_priors=True)
+        sparse.initialize_from_sequence(use_biophysical_priors=False)
+        sparse.amplitudes = dense.amplitudes.clone()
+
+        dense.evolve_entangled_states(time_step=0.1)
+        sparse.evolve_entangled_states(time_step=0.1)
+
+        assert isinstance(sparse.propagator, KrylovPropagator)
+        assert torch.allclose(sparse.amplitudes, dense.amplitudes, atol=1e-5)
+
+
+class TestVQbitBatch:
+    """Batched engine must reproduce per-sequence optimization"""
+
+    def test_batch_matches_single_sequence_runs(self):
+        sequences = [AB42_SEQUENCE, "GSHMKLVFFAEDV", AB42_SEQUENCE[:30]]
+
+        torch.manual_seed(11)
+        batch = VQbitBatch(sequences)
+        batch.initialize_states()
+        initial = [graph.amplitudes.clone() for graph in batch.graphs]
+        batch.initialize_states = lambda: None
+        batch_results = batch.run_fot_optimization(max_iterations=25)
+
+        for sequence, start, batch_result in zip(sequences, initial, batch_results):
+            graph = ProteinVQbitGraph(sequence)
+            graph.initialize_vqbit_states = lambda seed=None, g=graph, a=start: g._set_state(a.clone())
+            single_result = graph.run_fot_optimization(max_iterations=25)
+
+            assert batch_result['sequence'] == sequence
+            assert set(batch_result) == set(single_result) | {'sequence'}
+            assert batch_result['iterations'] == single_result['iterations']
+            assert batch_result['best_iteration'] == single_result['best_iteration']
+            np.testing.assert_allclose(batch_result['fot_history'], single_result['fot_history'], rtol=1e-4)
+            assert len(batch_result['telemetry']) == batch_result['iterations']
+
+    def test_converged_sequences_leave_active_set(self):
+        torch.manual_seed(3)
+        batch = VQbitBatch(["ACDEFGHIKL", AB42_SEQUENCE])
+        batch.graph_factors[0] = 0.0  # FoT of the first sequence is constant, so it converges at once
+
+        evolved = []
+        evolve = batch.evolve_entangled_states
+        batch.evolve_entangled_states = lambda active, **kwargs: (evolved.append(active.tolist()),
+                                                                   evolve(active, **kwargs))
+        results = batch.run_fot_optimization(max_iterations=40)
+
+        assert results[0]['converged'] and results[0]['iterations'] == 12
+        assert len(results[0]['fot_history']) == 12
+        assert not results[1]['converged'] and len(results[1]['fot_history']) == 40
+        assert evolved[11] == [0, 1] and all(active == [1] for active in evolved[12:])
+        for result in results:
+            assert len(result['fot_history']) == result['iterations']
+            assert len(result['final_conformations']) == result['graph_properties']['nodes']
+
+    def test_per_sequence_convergence_controllers(self):
+        torch.manual_seed(4)
+        batch = VQbitBatch(["ACDEFGHIKL", AB42_SEQUENCE])
+        controllers = [ToleranceConvergence(patience=1000, min_iterations=1, time_budget_s=0.0),
+                       ToleranceConvergence(patience=1000)]
+        results = batch.run_fot_optimization(max_iterations=20, convergence=controllers)
+
+        assert results[0]['iterations'] == 1 and results[0]['convergence']['stop_reason'] == 'time_budget'
+        assert results[1]['iterations'] == 20 and results[1]['convergence']['stop_reason'] == 'max_iterations'
+        assert not any(result['converged'] for result in results)
+        with pytest.raises(ValueError):
+            batch.run_fot_optimization(max_iterations=1, convergence=controllers[:1])
+
+    def test_equal_lengths_share_an_unpadded_eigenbasis(self):
+        sequences = [AB42_SEQUENCE, "GSHMKLVFFAEDV", "ACDEFGHIKLMNP"]
+        batch = VQbitBatch(sequences)
+        shapes = {n: (members.tolist(), basis.shape) for n, (members, basis, _) in batch.eigenbases().items()}
+        assert shapes == {42: ([0], (1, 42, 42)), 13: ([1, 2], (2, 13, 13))}
+
+        # One step in the eigenbasis matches each graph's own propagator
+        torch.manual_seed(6)
+        batch.initialize_states()
+        before = batch.amplitudes.clone()
+        batch.evolve_entangled_states(torch.tensor([0, 2]))
+        for b in (0, 2):
+            n = batch.graphs[b].n_residues
+            expected = batch.graphs[b]._ensure_propagator().apply(before[b, :n], 0.1)
+            assert torch.allclose(batch.amplitudes[b, :n], expected, atol=1e-5)
+        assert torch.equal(batch.amplitudes[1], before[1])
+
+    def test_sparse_backend_sequences_evolve_per_graph(self):
+        sequences = [AB42_SEQUENCE, "GSHMKLVFFAEDV"]
+
+        torch.manual_seed(5)
+        batch = VQbitBatch(sequences, sparse_threshold=20)
+        batch.initialize_states()
+        initial = [graph.amplitudes.clone() for graph in batch.graphs]
+        batch.initialize_states = lambda: None
+        batch_results = batch.run_fot_optimization(max_iterations=15)
+
+        assert {n: basis.shape for n, (_, basis, _) in batch.eigenbases().items()} == {13: (1, 13, 13)}
+        assert isinstance(batch.graphs[0].propagator, KrylovPropagator)
+        for sequence, start, batch_result in zip(sequences, initial, batch_results):
+            graph = ProteinVQbitGraph(sequence, sparse_threshold=20)
+            graph.initialize_vqbit_states = lambda seed=None, g=graph, a=start: g._set_state(a.clone())
+            single_result = graph.run_fot_optimization(max_iterations=15)
+            np.testing.assert_allclose(batch_result['fot_history'], single_result['fot_history'], rtol=1e-4)
+
+
+class TestGraphInvariants:
+    """Cached AKG invariants and vectorized FoT scoring"""
+
+    def test_invariants_match_networkx(self):
+        graph = ProteinVQbitGraph(AB42_SEQUENCE)
+        invariants = graph.graph_invariants
+
+        assert invariants.n_edges == graph.akg.number_of_edges()
+        assert graph.contact_graph.edge_index.shape == (2, invariants.n_edges)
+        assert invariants.density == pytest.approx(nx.density(graph.akg))
+        assert invariants.average_clustering == pytest.approx(nx.average_clustering(graph.akg))
+        assert graph.contact_graph.degrees().tolist() == [d for _, d in sorted(graph.akg.degree())]
+
+    def test_fot_equation_matches_per_residue_sum(self):
+        torch.manual_seed(5)
+        graph = ProteinVQbitGraph(AB42_SEQUENCE)
+        graph.initialize_from_sequence(use_biophysical_priors=True)
+        graph.apply_all_virtue_constraints()
+
+        virtue_sum = sum(
+            torch.sum(torch.real(torch.conj(v.amplitudes) * v.amplitudes)).item() * np.mean(list(v.virtue_scores.values()))
+            for v in graph.vqbit_states.values()
+        )
+        expected = (nx.average_clustering(graph.akg) + nx.density(graph.akg)) / 2.0 * virtue_sum
+
+        assert graph.calculate_fot_equation() == pytest.approx(expected, rel=1e-5)
+
+    def test_optimization_returns_telemetry(self):
+        torch.manual_seed(5)
+        results = ProteinVQbitGraph(AB42_SEQUENCE).run_fot_optimization(max_iterations=15)
+
+        assert [r['fot_value'] for r in results['telemetry']] == results['fot_history']
+        assert results['graph_properties']['nodes'] == len(AB42_SEQUENCE)
+
+
+class TestEnsembleMeasurement:
+    """Batched measurement and collapse from one prepared state"""
+
+    def test_ensemble_frequencies_follow_born_rule(self):
+        torch.manual_seed(13)
+        graph = ProteinVQbitGraph(AB42_SEQUENCE)
+        graph.initialize_from_sequence(use_biophysical_priors=True)
+        before = graph.amplitudes.clone()
+
+        indices, probabilities = graph.measure_ensemble(20000)
+
+        assert indices.shape == (20000, graph.n_residues)
+        assert torch.equal(graph.amplitudes, before)
+        expected = graph.measurement_probabilities()
+        assert torch.allclose(probabilities[0], expected.gather(1, indices[0].view(-1, 1)).view(-1))
+        frequencies = torch.nn.functional.one_hot(indices, 8).float().mean(dim=0)
+        assert torch.allclose(frequencies, expected, atol=0.02)
+
+    def test_measure_conformation_collapses_state(self):
+        torch.manual_seed(13)
+        graph = ProteinVQbitGraph(AB42_SEQUENCE)
+        graph.initialize_from_sequence(use_biophysical_priors=True)
+
+        measured = graph.measure_conformation()
+
+        assert len(measured) == graph.n_residues
+        assert torch.equal(graph.amplitudes.abs().sum(dim=1), torch.ones(graph.n_residues))
+        for i, measurement in measured.items():
+            assert BASIS_STATES[graph.amplitudes[i].abs().argmax().item()] is measurement['conformation']
+
+    def test_collapse_reuses_prepared_state(self, monkeypatch):
+        torch.manual_seed(13)
+        graph = ProteinVQbitGraph(AB42_SEQUENCE)
+        graph.initialize_from_sequence(use_biophysical_priors=True)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("collapse must not re-initialize the state")
+        monkeypatch.setattr(graph, 'initialize_from_sequence', fail)
+
+        conformations = graph.virtue_guided_collapse(target_conformations=6, collapse_rounds=2)
+
+        assert len(conformations) == 6
+        assert sorted(c['conformation_id'] for c in conformations) == list(range(6))
+        assert len({c['initial_fot_value'] for c in conformations}) == 1
+        assert all(len(c['coordinates']) == graph.n_residues for c in conformations)
+
+
+class TestConvergenceControllers:
+    """Pluggable convergence control for run_fot_optimization"""
+
+    def test_controller_without_check_cannot_be_created(self):
+        class Incomplete(ConvergenceController):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+    def test_lag_rule_matches_original_criterion(self):
+        controller = LagConvergence(threshold=1e-3)
+        scores = [1.0, 1.1, 1.2] + [1.3] * 20
+        stopped_at = next(i for i, score in enumerate(scores) if controller.update(i, score))
+
+        # Original rule: iteration > 10 and |h[-1] - h[-10]| < threshold
+        history = []
+        for i, score in enumerate(scores):
+            history.append(score)
+            if i > 10 and abs(history[-1] - history[-10]) < 1e-3:
+                break
+        assert stopped_at == i
+        assert controller.trace()['stop_reason'] == 'converged'
+
+    def test_tolerance_patience_and_fidelity(self):
+        controller = ToleranceConvergence(score_rtol=1e-3, patience=5, min_iterations=0, fidelity_tol=1e-6)
+        state = torch.ones(4, 8, dtype=torch.complex64)
+
+        decisions = [controller.update(i, 10.0, state * (1j ** i)) for i in range(7)]
+
+        # Global phase does not change fidelity; first step has no predecessor
+        assert decisions == [False] * 5 + [True, True]
+
+        controller.reset()
+        drifting = [controller.update(i, 10.0, torch.roll(state, i, dims=1) * (1 + i)) for i in range(7)]
+        assert drifting == [False] * 5 + [True, True]
+
+        controller.reset()
+        rotating = torch.eye(8, dtype=torch.complex64)[:4]
+        assert not any(controller.update(i, 10.0, torch.roll(rotating, i, dims=1)) for i in range(10))
+
+    def test_time_budget_and_compact_trace(self):
+        controller = ToleranceConvergence(score_rtol=0.0, score_atol=0.0, time_budget_s=0.0, max_trace_points=10)
+        assert controller.update(0, 1.0) is True
+        assert controller.trace()['stop_reason'] == 'time_budget'
+        assert controller.converged is False
+
+        controller = ToleranceConvergence(score_rtol=0.0, score_atol=0.0, max_trace_points=10)
+        for i in range(95):
+            controller.update(i, float(i))
+        trace = controller.trace()
+        assert len(trace['iteration']) <= 11
+        assert trace['iteration'][-1] == 94 and trace['fot'][-1] == 94.0
+
+    def test_optimization_stops_early_with_tolerance_controller(self):
+        torch.manual_seed(21)
+        results = ProteinVQbitGraph(AB42_SEQUENCE).run_fot_optimization(
+            max_iterations=300, convergence=ToleranceConvergence(score_rtol=1e-3, patience=5)
+        )
+
+        assert results['converged']
+        assert results['iterations'] < 300
+        assert results['convergence']['iteration'][-1] == results['iterations'] - 1
+
+
+class TestAmplitudeAmplification:
+    """Fused oracle/diffusion kernel and optimal round count"""
+
+    def test_round_heuristic(self):
+        assert amplification_rounds(0, 100, 100).item() == 0
+        assert amplification_rounds(1, 100, 100).item() == int(np.pi / (4 * np.arcsin(0.1)))
+        assert amplification_rounds(1, 10 ** 6, 100).item() == 100
+        assert amplification_rounds(90, 100, 100).item() == 1
+        assert amplification_rounds(torch.tensor([0, 4]), torch.tensor([10, 64]), 50).tolist() == [0, 3]
+
+    def test_grover_step_matches_per_residue_loop(self):
+        torch.manual_seed(17)
+        amplitudes = torch.randn(12, 8, dtype=torch.complex64)
+        marked = torch.rand(12) > 0.5
+
+        reference = amplitudes.clone()
+        reference[marked] = -reference[marked]
+        average = reference.mean(dim=0)
+        for i in range(12):
+            reference[i] = 2 * average - reference[i]
+            reference[i] = reference[i] / torch.sqrt(torch.sum(torch.conj(reference[i]) * reference[i]).real)
+
+        phase = 1.0 - 2.0 * marked.unsqueeze(1).expand(12, 8).to(torch.complex64)
+        assert torch.allclose(grover_step(amplitudes, phase), reference, atol=1e-6)
+
+    def test_search_reports_marked_residues(self):
+        torch.manual_seed(17)
+        graph = ProteinVQbitGraph(AB42_SEQUENCE)
+        graph.initialize_from_sequence(use_biophysical_priors=True)
+        graph.virtue_scores[::3] = 0.9
+
+        high_virtue = graph.amplitude_amplification_search(target_virtue_threshold=0.8)
+
+        assert high_virtue == list(range(0, graph.n_residues, 3))
+        norms = torch.linalg.vector_norm(graph.amplitudes, dim=1)
+        assert torch.allclose(norms, torch.ones_like(norms), atol=1e-5)
+
+
+class TestInitializationCache:
+    """Hoisted propensity tables, seeded entanglement maps and the init cache"""
+
+    LEGACY_PROPENSITIES = {
+        'A': [0.3, 0.3, 0.2, 0.1, 0.1, 0.0, 0.0, 0.0], 'G': [0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.2, 0.2],
+        'P': [0.0, 0.0, 0.0, 0.1, 0.1, 0.1, 0.4, 0.3], 'F': [0.2, 0.2, 0.1, 0.3, 0.2, 0.0, 0.0, 0.0],
+    }
+
+    def test_propensities_match_per_residue_rules(self):
+        sequence = "APGAPPFXA"
+        reference = []
+        for i, amino_acid in enumerate(sequence):
+            row = list(self.LEGACY_PROPENSITIES.get(amino_acid, [0.125] * 8))
+            if i > 0 and sequence[i - 1] == 'P':
+                row[0] *= 0.1
+                row[1] *= 0.1
+                row[2] *= 0.1
+            if i < len(sequence) - 1 and sequence[i + 1] == 'P':
+                row[6] *= 2.0
+                row[7] *= 2.0
+            reference.append(row)
+
+        assert torch.allclose(sequence_propensities(sequence), torch.tensor(reference))
+
+    def test_seeded_initialization_is_cached(self):
+        cache = InitializationCache()
+        graph = ProteinVQbitGraph(AB42_SEQUENCE, init_cache=cache)
+
+        graph.initialize_from_sequence(use_biophysical_priors=True, seed=5)
+        first = graph.amplitudes.clone()
+        graph.initialize_from_sequence(use_biophysical_priors=True, seed=5)
+
+        assert torch.equal(graph.amplitudes, first)
+        assert cache.cache_info()['hits'] == 1 and cache.cache_info()['misses'] == 1
+
+        graph.initialize_from_sequence(use_biophysical_priors=True, seed=6)
+        assert not torch.equal(graph.amplitudes, first)
+
+        graph.initialize_vqbit_states()
+        assert cache.cache_info()['misses'] == 2
+
+    def test_cache_hit_is_not_aliased(self):
+        cache = InitializationCache()
+        ProteinVQbitGraph(AB42_SEQUENCE, init_cache=cache).initialize_vqbit_states(seed=3)
+
+        served = ProteinVQbitGraph(AB42_SEQUENCE, init_cache=cache)
+        served.initialize_vqbit_states(seed=3)
+        expected = served.amplitudes.clone()
+        served.vqbit_states[0].amplitudes = torch.zeros(8, dtype=expected.dtype)
+
+        again = ProteinVQbitGraph(AB42_SEQUENCE, init_cache=cache)
+        again.initialize_vqbit_states(seed=3)
+        assert cache.cache_info()['hits'] == 2
+        assert torch.equal(again.amplitudes, expected)
+
+    def test_disk_cache_survives_new_process_cache(self, tmp_path):
+        graph = ProteinVQbitGraph(AB42_SEQUENCE, init_cache=InitializationCache(cache_dir=tmp_path))
+        graph.initialize_vqbit_states(seed=9)
+        stored = graph.amplitudes.clone()
+
+        reloaded_cache = InitializationCache(cache_dir=tmp_path)
+        reloaded = ProteinVQbitGraph(AB42_SEQUENCE, init_cache=reloaded_cache)
+        reloaded.initialize_vqbit_states(seed=9)
+
+        assert torch.equal(reloaded.amplitudes, stored)
+        assert reloaded_cache.cache_info()['disk_hits'] == 1
+
+    def test_entanglement_maps_are_keyed_by_sequence_and_residue(self):
+        first = ProteinVQbitGraph(AB42_SEQUENCE)
+        second = ProteinVQbitGraph(AB42_SEQUENCE)
+
+        assert set(first.entanglement_maps[5]) == set(first.akg.neighbors(5))
+        for neighbor, block in first.entanglement_maps[5].items():
+            assert torch.equal(block, second.entanglement_maps[5][neighbor])
+        assert not torch.equal(first.entanglement_maps[5][4], first.entanglement_maps[4][3])
+
+
+class TestMotifSnapshot:
+    """Local k-mer motif lookup must match the per-window AKG query"""
+
+    MOTIFS = [
+        {'motif_id': 'h1', 'type': 'alpha_helix', 'fragment': 'AEFRHDSGY', 'confidence': 0.6, 'validation_score': 0.5},
+        {'motif_id': 'b1', 'type': 'beta_hairpin', 'fragment': 'GSNKGAII', 'confidence': 0.7, 'validation_score': 0.4},
+        {'motif_id': 's1', 'type': 'binding_site', 'fragment': 'LVFF', 'confidence': 0.65, 'validation_score': 0.9},
+        {'motif_id': 'c1', 'type': 'cysteine_bridge', 'fragment': 'CAAC', 'confidence': 0.8, 'validation_score': 0.1},
+    ]
+
+    @staticmethod
+    def query_reference(motifs, fragment):
+        """The AKG query rule: containment either way, ranked by confidence then validation"""
+        matches = [m for m in motifs if fragment in m['fragment'] or m['fragment'] in fragment]
+        matches.sort(key=lambda m: (-m['confidence'], -m['validation_score']))
+        return [m['motif_id'] for m in matches[:10]]
+
+    def test_windows_match_per_window_queries(self):
+        snapshot = MotifSnapshot(self.MOTIFS, version=3)
+
+        expected = []
+        for i in range(0, len(AB42_SEQUENCE), 6):
+            fragment = AB42_SEQUENCE[i:i + 6]
+            if len(fragment) >= 4:
+                assert [m['motif_id'] for m in snapshot.query(fragment)] == self.query_reference(self.MOTIFS, fragment)
+                expected.extend((i, motif_id) for motif_id in self.query_reference(self.MOTIFS, fragment))
+
+        resolved = snapshot.resolve_windows(AB42_SEQUENCE)
+        assert [(m['query_start'], m['motif_id']) for m in resolved] == expected
+        assert expected
+
+    def test_store_refreshes_only_on_version_change(self, tmp_path):
+        versions = [1]
+        fetches = []
+
+        def fetch_snapshot():
+            fetches.append(versions[0])
+            return MotifSnapshot(self.MOTIFS[:versions[0]], version=versions[0])
+
+        path = tmp_path / "motifs.json"
+        store = MotifSnapshotStore(fetch_snapshot, lambda: versions[0], snapshot_path=path, refresh_interval_s=0.0)
+
+        assert len(store.snapshot()) == 1
+        assert len(store.snapshot()) == 1
+        versions[0] = 2
+        assert len(store.snapshot()) == 2
+        assert fetches == [1, 2]
+
+        def unreachable():
+            raise ConnectionError("database unavailable")
+
+        offline = MotifSnapshotStore(fetch_snapshot, unreachable, snapshot_path=path)
+        assert offline.snapshot().version == 2 and fetches == [1, 2]
+
+    def test_snapshot_biases_initialization(self):
+        torch.manual_seed(0)
+        graph = ProteinVQbitGraph(AB42_SEQUENCE)
+        snapshot = MotifSnapshot(self.MOTIFS)
+
+        graph.initialize_from_sequence(use_biophysical_priors=True, use_learned_motifs=True,
+                                       seed=1, motif_snapshot=snapshot)
+        biased = graph.amplitudes.clone()
+        graph.initialize_from_sequence(use_biophysical_priors=True, seed=1)
+
+        windows = {m['query_start'] for m in snapshot.resolve_windows(AB42_SEQUENCE)}
+        touched = [i for start in windows for i in range(start, start + 9) if i < graph.n_residues]
+        untouched = sorted(set(range(graph.n_residues)) - set(touched))
+        assert not torch.allclose(biased[touched], graph.amplitudes[touched])
+        assert torch.allclose(biased[untouched], graph.amplitudes[untouched])
+
+
+class TestPrecisionPolicy:
+    """Reference, default and reduced precision modes"""
+
+    def test_modes_set_state_and_operator_dtypes(self):
+        for mode, complex_dtype, real_dtype in [('reference', torch.complex128, torch.float64),
+                                                ('default', torch.complex64, torch.float32),
+                                                ('reduced', torch.complex64, torch.float32)]:
+            graph = ProteinVQbitGraph(AB42_SEQUENCE, precision=mode)
+            graph.initialize_vqbit_states(seed=1)
+            graph.apply_all_virtue_constraints()
+            graph.evolve_entangled_states()
+
+            assert graph.precision is PRECISION_POLICIES[mode]
+            assert graph.amplitudes.dtype == complex_dtype
+            assert graph.virtue_scores.dtype == real_dtype
+            assert graph.virtue_operators['Justice'].projector.dtype == complex_dtype
+
+        with pytest.raises(ValueError):
+            ProteinVQbitGraph(AB42_SEQUENCE, precision='bfloat16')
+
+    def test_split_projection_matches_complex_projection(self):
+        default = ProteinVQbitGraph(AB42_SEQUENCE)
+        reduced = ProteinVQbitGraph(AB42_SEQUENCE, precision='reduced')
+        for graph in (default, reduced):
+            graph.initialize_from_sequence(use_biophysical_priors=True, seed=4)
+            graph.apply_all_virtue_constraints()
+
+        assert reduced._staged_operators(VIRTUE_NAMES)[2]
+        assert torch.allclose(reduced.amplitudes, default.amplitudes, atol=1e-6)
+        assert torch.allclose(reduced.virtue_scores, default.virtue_scores, rtol=1e-5)
+
+    def test_complex_override_falls_back_to_complex_projection(self):
+        graph = ProteinVQbitGraph(AB42_SEQUENCE, precision='reduced')
+        graph.initialize_vqbit_states(seed=2)
+        graph.apply_all_virtue_constraints()
+        assert graph._staged_operators(VIRTUE_NAMES)[2]
+
+        override = torch.eye(8, dtype=torch.complex64) * 0.7
+        override[0, 1], override[1, 0] = 5j, -5j
+        graph.set_residue_constraint('Honesty', 0, override)
+        graph.apply_all_virtue_constraints()
+
+        assert not graph._staged_operators(VIRTUE_NAMES)[2]
+
+    def test_fot_scores_agree_with_reference(self):
+        histories = {}
+        for mode in PRECISION_POLICIES:
+            graph = ProteinVQbitGraph(AB42_SEQUENCE, precision=mode)
+            results = graph.run_fot_optimization(max_iterations=30, convergence=LagConvergence(threshold=0.0),
+                                                 init_seed=7)
+            histories[mode] = np.array(results['fot_history'])
+
+        np.testing.assert_allclose(histories['default'], histories['reference'], rtol=1e-5)
+        np.testing.assert_allclose(histories['reduced'], histories['reference'], rtol=1e-5)
+
+
+class TestRNGContext:
+    """Explicit RNG contexts make every sampler reproducible"""
+
+    def test_derived_streams_are_keyed(self):
+        first = RNGContext.derive(42, AB42_SEQUENCE, replica=1, stage='vqbit')
+        again = RNGContext.derive(42, AB42_SEQUENCE, replica=1, stage='vqbit')
+        assert first.numpy.random() == again.numpy.random()
+        assert torch.equal(torch.rand(4, generator=first.torch), torch.rand(4, generator=again.torch))
+
+        draws = {
+            RNGContext.derive(*key).numpy.random()
+            for key in [(42, AB42_SEQUENCE, 1, 'vqbit'), (43, AB42_SEQUENCE, 1, 'vqbit'),
+                        (42, AB42_SEQUENCE[:40], 1, 'vqbit'), (42, AB42_SEQUENCE, 2, 'vqbit'),
+                        (42, AB42_SEQUENCE, 1, 'classical')]
+        }
+        assert len(draws) == 5
+
+        workers = [child.numpy.random() for child in RNGContext.derive(42).spawn(3)]
+        assert len(set(workers)) == 3
+
+    def test_stages_do_not_alias_spawned_children(self):
+        context = RNGContext.derive(42, AB42_SEQUENCE)
+        children = [child.numpy.random() for child in context.spawn(3)]
+        stages = [context.stage(i).numpy.random() for i in range(3)]
+        assert len(set(children + stages)) == 6
+        assert context.stage(0).numpy.random() != context.stage('0').numpy.random()
+
+    def test_derived_stage_matches_stage_of_derived_context(self):
+        derived = RNGContext.derive(42, AB42_SEQUENCE, 1, 'folding')
+        staged = RNGContext.derive(42, AB42_SEQUENCE, 1).stage('folding')
+        assert derived.seed_sequence.spawn_key == staged.seed_sequence.spawn_key
+        assert derived.numpy.random() == staged.numpy.random()
+        assert torch.equal(torch.rand(4, generator=derived.torch), torch.rand(4, generator=staged.torch))
+
+    def test_vqbit_optimization_is_reproducible(self):
+        results = []
+        for global_seed in (0, 1):
+            torch.manual_seed(global_seed)
+            graph = ProteinVQbitGraph(AB42_SEQUENCE, rng=RNGContext.derive(7, AB42_SEQUENCE))
+            results.append(graph.run_fot_optimization(max_iterations=20))
+
+        assert results[0]['fot_history'] == results[1]['fot_history']
+        assert results[0]['final_conformations'] == results[1]['final_conformations']
+
+    def test_classical_sampler_is_reproducible(self):
+        samples = []
+        for global_seed in (0, 1):
+            np.random.seed(global_seed)
+            folder = RigorousProteinFolder("DAEFRHDSGY", rng=RNGContext.derive(7, "DAEFRHDSGY", stage='classical'))
+            samples.append([(state.phi, state.psi) for state in folder.sample_conformation()])
+
+        assert samples[0] == samples[1]
+
+
+class TestCompiledStep:
+    """Fused/compiled FoT steps match the op-by-op optimization loop"""
+
+    @pytest.mark.parametrize("backend", ['fused', 'torchscript'])
+    def test_step_matches_eager_loop(self, backend):
+        histories = []
+        for step_backend in (None, backend):
+            graph = ProteinVQbitGraph(AB42_SEQUENCE)
+            results = graph.run_fot_optimization(max_iterations=30, init_seed=5, step_backend=step_backend,
+                                                 convergence=LagConvergence(threshold=0.0))
+            histories.append(results['fot_history'])
+
+        assert np.allclose(histories[0], histories[1], rtol=1e-5)
+
+    def test_complex_override_uses_eager_path(self):
+        graph = ProteinVQbitGraph(AB42_SEQUENCE)
+        graph.set_residue_constraint('Honesty', 3, torch.eye(8, dtype=torch.complex64) * (0.5 + 0.5j))
+        assert graph._compiled_step_operators(VIRTUE_NAMES, 0.1) is None
+
+        results = graph.run_fot_optimization(max_iterations=5, step_backend='fused')
+        assert results['iterations'] == 5
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            ProteinVQbitGraph(AB42_SEQUENCE).run_fot_optimization(max_iterations=1, step_backend='jit')
+
+    def test_thread_budget(self):
+        assert thread_budget(8, total_threads=32) == 4
+        assert thread_budget(8, total_threads=4) == 1
+        assert thread_budget(1, total_threads=6) == 6
+        with pytest.raises(ValueError):
+            thread_budget(0)
+
+
+class TestCheckpointResume:
+    """Interrupted optimizations resume bit for bit from their checkpoint"""
+
+    def run(self, checkpoint=None, crash_at=None):
+        graph = ProteinVQbitGraph(AB42_SEQUENCE, rng=RNGContext.derive(11, AB42_SEQUENCE))
+        if crash_at is not None:
+            calculate = graph.calculate_fot_equation
+            calls = []
+
+            def crashing_fot():
+                calls.append(None)
+                if len(calls) == crash_at:
+                    raise KeyboardInterrupt
+                return calculate()
+            graph.calculate_fot_equation = crashing_fot
+
+        return graph.run_fot_optimization(max_iterations=40, checkpoint=checkpoint,
+                                          convergence=ToleranceConvergence(patience=1000))
+
+    def test_resume_matches_uninterrupted_run(self, tmp_path):
+        reference = self.run()
+
+        path = checkpoint_path_for(tmp_path, AB42_SEQUENCE)
+        with pytest.raises(KeyboardInterrupt):
+            self.run(FoTCheckpointer(path, max_io_fraction=0.5, min_interval_s=0.0), crash_at=25)
+        assert [c.sequence for c in pending_checkpoints(tmp_path)] == [AB42_SEQUENCE]
+
+        resumed = self.run(path)
+        assert resumed['checkpoint']['resumed_from_iteration'] > 0
+        assert resumed['fot_history'] == reference['fot_history']
+        assert resumed['final_conformations'] == reference['final_conformations']
+        assert resumed['convergence']['fot'] == reference['convergence']['fot']
+        assert not path.exists()
+
+    def test_resume_entry_point(self, tmp_path):
+        path = tmp_path / "fot.pt"
+        with pytest.raises(KeyboardInterrupt):
+            self.run(FoTCheckpointer(path, max_io_fraction=0.5, min_interval_s=0.0), crash_at=15)
+
+        # The graph's RNGContext is rebuilt from the checkpoint; the global torch RNG is left alone
+        global_state = torch.get_rng_state()
+        results = resume_fot_optimization(path, convergence=ToleranceConvergence(patience=1000))
+        assert torch.equal(torch.get_rng_state(), global_state)
+        assert results['iterations'] == 40
+        assert results['fot_history'] == self.run()['fot_history']
+        assert resume_fot_optimization(path) is None
+
+    @pytest.mark.parametrize("rerun", [
+        lambda path: ProteinVQbitGraph(AB42_SEQUENCE[:30]).run_fot_optimization(max_iterations=5, checkpoint=path),
+        lambda path: ProteinVQbitGraph(AB42_SEQUENCE, rng=RNGContext.derive(11, AB42_SEQUENCE))
+        .run_fot_optimization(max_iterations=30, checkpoint=path),
+        lambda path: ProteinVQbitGraph(AB42_SEQUENCE, rng=RNGContext.derive(11, AB42_SEQUENCE))
+        .run_fot_optimization(max_iterations=40, init_seed=3, checkpoint=path),
+        lambda path: ProteinVQbitGraph(AB42_SEQUENCE, rng=RNGContext.derive(12, AB42_SEQUENCE))
+        .run_fot_optimization(max_iterations=40, checkpoint=path),
+        lambda path: ProteinVQbitGraph(AB42_SEQUENCE, rng=RNGContext.derive(11, AB42_SEQUENCE))
+        .run_fot_optimization(max_iterations=40, method='gradient', checkpoint=path),
+    ], ids=['sequence', 'max_iterations', 'init_seed', 'rng_seed', 'method'])
+    def test_mismatched_parameters_start_fresh(self, tmp_path, rerun):
+        path = tmp_path / "fot.pt"
+        with pytest.raises(KeyboardInterrupt):
+            self.run(FoTCheckpointer(path, max_io_fraction=0.5, min_interval_s=0.0), crash_at=15)
+
+        assert rerun(path)['checkpoint']['resumed_from_iteration'] is None
+
+    def test_adaptive_interval(self, tmp_path):
+        checkpointer = FoTCheckpointer(tmp_path / "fot.pt", max_io_fraction=0.1, min_interval_s=0.0)
+        assert checkpointer.due()
+
+        # A 1 s save with a 10% I/O budget waits 9 s of optimization
+        checkpointer._last_save_s = 1.0
+        checkpointer._last_save_end -= 8.0
+        assert not checkpointer.due()
+        checkpointer._last_save_end -= 1.5
+        assert checkpointer.due()
+
+        with pytest.raises(ValueError):
+            FoTCheckpointer(tmp_path / "fot.pt", max_io_fraction=1.5)
+
+
+class TestWindowedSolver:
+    """Overlapping-window decomposition and blending"""
+
+    def test_window_spans_cover_chain(self):
+        spans = window_spans(300, window=128, overlap=16)
+        assert spans[0][0] == 0 and spans[-1][1] == 300
+        assert all(end - start == 128 for start, end in spans)
+        assert all(next_start <= end - 16 for (_, end), (next_start, _) in zip(spans, spans[1:]))
+        assert window_spans(50) == [(0, 50)]
+        with pytest.raises(ValueError):
+            window_spans(300, window=16, overlap=16)
+
+    def test_blend_recovers_consistent_windows(self):
+        state = torch.randn(300, 8, dtype=torch.complex64)
+        state = state / torch.linalg.vector_norm(state, dim=1, keepdim=True)
+        spans = window_spans(300, window=64, overlap=8)
+
+        # Windows carrying arbitrary global phases blend back to the state
+        windows = [state[start:end] * torch.exp(1j * torch.tensor(0.7 * k)) for k, (start, end) in enumerate(spans)]
+        blended = blend_windows(300, spans, windows)
+        assert torch.allclose(blended, state, atol=1e-5)
+
+    def test_solver_tracks_monolithic_fot(self):
+        sequence = AB42_SEQUENCE * 5
+        windowed = WindowedVQbitSolver(sequence, window=64, overlap=8).run(
+            max_iterations=30, refinement_iterations=5, init_seed=0)
+        monolithic = ProteinVQbitGraph(sequence).run_fot_optimization(max_iterations=30, init_seed=0)
+
+        assert len(windowed['windows']) == len(window_spans(len(sequence), 64, 8))
+        assert windowed['final_conformations'] is not None
+        assert abs(windowed['fot_history'][-1] / monolithic['fot_history'][-1] - 1) < 0.05
+
+    def test_wrapper_forwards_precision(self, monkeypatch):
+        precisions = []
+
+        class RecordingGraph(ProteinVQbitGraph):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                precisions.append(self.precision.name)
+
+        monkeypatch.setattr(vqbit_windowed, 'ProteinVQbitGraph', RecordingGraph)
+        vqbit_windowed.run_windowed_vqbit_optimization(AB42_SEQUENCE * 2, window=48, overlap=8,
+                                                       precision='reference', max_iterations=2,
+                                                       refinement_iterations=1)
+        assert len(precisions) == 3 and set(precisions) == {'reference'}
+
+
+class TestContactEdges:
+    """Vectorized backbone / medium-range edge builder"""
+
+    def test_medium_range_hydrophobic_edges(self):
+        graph = ProteinVQbitGraph(AB42_SEQUENCE)
+
+        # Hydrophobic pairs 3-7 residues apart are bonded
+        medium = {(u, v) for u, v, kind in graph.akg.edges(data='bond_type') if kind == 'medium_range'}
+        assert (16, 19) in medium  # L17 - F20
+        assert (17, 20) not in medium  # V18 - A21 (Ala is not in the hydrophobic class)
+        assert (30, 35) in medium  # I31 - V36
+        assert graph.akg.edges[16, 19]['coupling_strength'] == 0.5
+
+    def test_matches_pairwise_rule(self):
+        sequence = "MKCDEFGHIKLMNPQRSTVWYCXDK" * 4
+        edge_index, coupling, medium_range = contact_edges(sequence)
+
+        hydrophobic, positive, negative = set('FYWLIVM'), set('KRH'), set('DE')
+
+        def interacts(a, b):
+            return (a in hydrophobic and b in hydrophobic) or (a in positive and b in negative) or \
+                (a in negative and b in positive) or (a == 'C' and b == 'C')
+
+        expected = {(i, i + 1) for i in range(len(sequence) - 1)}
+        expected |= {(i, j) for i in range(len(sequence)) for j in range(i + 3, min(i + 8, len(sequence)))
+                     if interacts(sequence[i], sequence[j])}
+
+        assert set(zip(edge_index[0].tolist(), edge_index[1].tolist())) == expected
+        assert edge_index.shape[1] == len(expected)
+        assert np.all(coupling[medium_range] == 0.5) and np.all(coupling[~medium_range] == 1.0)
+
+
+class TestCSRGraph:
+    """CSR contact graph vs the NetworkX view"""
+
+    def test_matches_networkx(self):
+        graph = ProteinVQbitGraph("MKCDEFGHIKLMNPQRSTVWYCXDK" * 3)
+        csr, akg = graph.contact_graph, graph.akg
+
+        for node in range(graph.n_residues):
+            assert csr.neighbors(node).tolist() == sorted(akg.neighbors(node))
+        assert csr.degrees().tolist() == [akg.degree(node) for node in range(graph.n_residues)]
+        assert csr.average_clustering() == pytest.approx(nx.average_clustering(akg))
+        assert csr.density() == pytest.approx(nx.density(akg))
+
+        expected = nx.normalized_laplacian_matrix(akg, nodelist=range(graph.n_residues)).toarray()
+        np.testing.assert_allclose(graph.laplacian_csr.toarray(), expected, atol=1e-12)
+
+    def test_isolated_nodes(self):
+        csr = CSRGraph.from_edges(4, np.array([[0], [1]]))
+        assert csr.neighbors(3).size == 0
+        laplacian = csr.normalized_laplacian().toarray()
+        assert laplacian[2, 2] == 0.0 and laplacian[0, 0] == 1.0
+        assert csr.average_clustering() == 0.0
+
+    def test_networkx_view_is_lazy(self):
+        graph = ProteinVQbitGraph(AB42_SEQUENCE)
+        graph.run_fot_optimization(max_iterations=5, init_seed=0)
+        assert graph._akg is None
+
+        assert graph.akg.number_of_edges() == graph.contact_graph.n_edges
+        assert graph.akg.nodes[0]['residue_type'] == 'D'
+        assert graph.akg is graph.akg
+
+
+class TestGradientOptimizer:
+    """method='gradient': autograd ascent on the FoT surrogate"""
+
+    def test_surrogate_matches_eager_iteration(self):
+        graph = ProteinVQbitGraph(AB42_SEQUENCE)
+        graph.initialize_vqbit_states(seed=0)
+        fot, _, _, _ = fot_surrogate(graph, graph.amplitudes, VIRTUE_NAMES)
+
+        graph.apply_all_virtue_constraints(VIRTUE_NAMES)
+        graph.evolve_entangled_states()
+        assert fot.item() == pytest.approx(graph.calculate_fot_equation(), rel=1e-5)
+
+    def test_sparse_adjoint_gradient(self):
+        dense = ProteinVQbitGraph(AB42_SEQUENCE, precision='reference')
+        sparse = ProteinVQbitGraph(AB42_SEQUENCE, precision='reference', sparse_threshold=10)
+        dense.initialize_vqbit_states(seed=0)
+
+        grads = []
+        for graph in (dense, sparse):
+            amplitudes = dense.amplitudes.clone().requires_grad_(True)
+            fot, _, _, _ = fot_surrogate(graph, amplitudes, VIRTUE_NAMES)
+            fot.backward()
+            grads.append(amplitudes.grad)
+        torch.testing.assert_close(grads[1], grads[0], rtol=1e-6, atol=1e-8)
+
+    @pytest.mark.parametrize("optimizer", ['adam', 'lbfgs'])
+    def test_reaches_projection_score(self, optimizer):
+        projection = ProteinVQbitGraph(AB42_SEQUENCE).run_fot_optimization(
+            max_iterations=50, init_seed=0, final_measurement=False)
+        gradient = ProteinVQbitGraph(AB42_SEQUENCE).run_fot_optimization(
+            max_iterations=50, init_seed=0, final_measurement=False,
+            method='gradient', gradient_optimizer=optimizer)
+
+        assert gradient['best_fot_value'] >= projection['best_fot_value']
+        assert gradient['final_fot_value'] == pytest.approx(max(gradient['fot_history']), rel=1e-4)
+
+    def test_unknown_names(self):
+        graph = ProteinVQbitGraph(AB42_SEQUENCE)
+        with pytest.raises(ValueError):
+            graph.run_fot_optimization(max_iterations=1, method='annealing')
+        graph.initialize_vqbit_states(seed=0)
+        with pytest.raises(ValueError):
+            GradientFoTOptimizer(graph, optimizer='sgd')
@@ -29,6 +29,7 @@ from scientific_sequence_generator import ScientificSequenceGenerator, SequenceC
 from validate_discovery_quality import DiscoveryQualityValidator, ValidationResult
 from protein_folding_analysis import RigorousProteinFolder
 from fot.vqbit_mathematics import ProteinVQbitGraph
+from fot.vqbit_checkpoint import checkpoint_path_for, pending_checkpoints
 
 # Configure honest logging
 logging.basicConfig(
@@ -78,7 +79,8 @@ class ValidatedDiscoverySystem:
                  random_seed: int = None,
                  min_validation_score: float = 0.8,
                  min_therapeutic_potential: float = 0.6,
-                 use_de_novo_fot: bool = False):
+                 use_de_novo_fot: bool = False,
+                 checkpoint_dir: Optional[Path] = None):
         
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -86,6 +88,7 @@ class ValidatedDiscoverySystem:
         self.min_validation_score = min_validation_score
         self.min_therapeutic_potential = min_therapeutic_potential
         self.use_de_novo_fot = use_de_novo_fot  # Phase 1: FoT AlphaFold Independence
+        self.checkpoint_dir = checkpoint_dir  # Resumable vQbit optimization when set
         
         # Initialize validated components
         self.sequence_generator = ScientificSequenceGenerator(random_seed=random_seed)
@@ -122,15 +125,28 @@ class ValidatedDiscoverySystem:
             logger.error("❌ System validation failed - cannot proceed")
             return self._create_failure_report("System validation failed")
         
+        # Candidates whose analysis was interrupted are finished first. Only the vQbit
+        # optimization resumes from its checkpoint; validation and folding run again.
+        interrupted = []
+        if self.checkpoint_dir is not None:
+            interrupted = [checkpoint.sequence for checkpoint in pending_checkpoints(self.checkpoint_dir)]
+            if interrupted:
+                logger.info(f"♻️ Re-analyzing {len(interrupted)} interrupted candidates "
+                            f"(vQbit optimization resumes from its checkpoint, other stages re-run)")
+        
         attempt = 0
         while len(discoveries) < target_discoveries and attempt < max_attempts:
             attempt += 1
             self.generation_attempts += 1
             
             try:
-                # Generate candidate sequence
-                logger.info(f"🧬 Attempt {attempt}/{max_attempts}: Generating candidate...")
-                sequence = self._generate_validated_candidate()
+                if interrupted:
+                    logger.info(f"🧬 Attempt {attempt}/{max_attempts}: Resuming interrupted candidate...")
+                    sequence = interrupted.pop(0)
+                else:
+                    # Generate candidate sequence
+                    logger.info(f"🧬 Attempt {attempt}/{max_attempts}: Generating candidate...")
+                    sequence = self._generate_validated_candidate()
                 
                 if sequence is None:
                     logger.warning("⚠️ Failed to generate valid candidate")
@@ -260,7 +276,8 @@ class ValidatedDiscoverySystem:
                 sequence,
                 num_iterations=50,
                 include_provenance=True,
-                use_de_novo=self.use_de_novo_fot  # Phase 1: Use de novo mode if enabled
+                use_de_novo=self.use_de_novo_fot,  # Phase 1: Use de novo mode if enabled
+                checkpoint=checkpoint_path_for(self.checkpoint_dir, sequence) if self.checkpoint_dir else None
             )
             
             if not vqbit_results.get('success', False):